@@ -0,0 +1,69 @@
+"""
+TranslationCache throughput: bulk write, warm-up lookup (get_many) and per-string get(),
+then the same lookups and writes from one thread per locale sharing the cache.
+
+  python benchmarks/bench_cache.py --n 250000 --locales fr_FR,de_DE,es_ES,it_IT
+
+Runs against a fresh SQLite file in a temp directory; every string is cached for every
+locale, written and looked up in shuffled order (as a real run's sources arrive).
+"""
+import os, sys, time, random, argparse, tempfile, threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from i18n_seed.cache import TranslationCache
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark TranslationCache bulk reads/writes")
+    ap.add_argument("--n", type=int, default=250_000, help="Number of cached strings per locale.")
+    ap.add_argument("--locales", default="fr_FR,de_DE,es_ES,it_IT", help="Comma-separated locales.")
+    ap.add_argument("--mem-entries", type=int, default=0,
+                    help="Size of the in-memory LRU tier (default 0: time SQLite itself; writes would fill the tier).")
+    ap.add_argument("--single-gets", type=int, default=20_000, help="Per-string get() calls to time for comparison.")
+    args = ap.parse_args()
+
+    locales = [l.strip() for l in args.locales.split(",") if l.strip()]
+    sources = [f"Sample product title number {i} with some words" for i in range(args.n)]
+    random.Random(0).shuffle(sources)
+    total = args.n * len(locales)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.sqlite")
+        cache = TranslationCache(path, mem_entries=args.mem_entries)
+
+        t = time.perf_counter()
+        chunk = 50_000
+        for loc in locales:
+            for k in range(0, args.n, chunk):
+                cache.put_many((s, loc, f"[{loc}] " + s) for s in sources[k:k + chunk])
+        cache.flush()
+        print(f"put_many: {total} rows in {time.perf_counter() - t:.2f}s")
+
+        t = time.perf_counter()
+        hits = sum(len(cache.get_many(sources + ["missing string"], loc)) for loc in locales)
+        print(f"get_many: {hits} hits of {total + len(locales)} in {time.perf_counter() - t:.2f}s")
+
+        n = min(args.single_gets, args.n)
+        t = time.perf_counter()
+        for s in sources[:n]:
+            cache.get(s, locales[0])
+        dt = time.perf_counter() - t
+        print(f"get: {n} lookups in {dt:.2f}s (~{dt / n * total:.1f}s for {total})")
+
+        # one thread per locale: reads on per-thread connections, writes through the writer thread
+        def worker(loc):
+            cache.get_many(sources, loc)
+            for k in range(0, args.n, chunk):
+                cache.put_many((s + " (v2)", loc, f"[{loc}] " + s) for s in sources[k:k + chunk])
+        threads = [threading.Thread(target=worker, args=(loc,)) for loc in locales]
+        t = time.perf_counter()
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join()
+        cache.flush()
+        print(f"{len(threads)} threads: {total} lookups + {total} writes in {time.perf_counter() - t:.2f}s")
+        cache.close()
+        print(f"file: {os.path.getsize(path) / 2**20:.1f} MiB; lookups: {cache.report()}")
+
+if __name__ == "__main__":
+    main()
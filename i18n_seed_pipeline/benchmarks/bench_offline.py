@@ -0,0 +1,76 @@
+"""
+Offline end-to-end benchmark: runs the translate pipeline against the local Gemini stub.
+
+  python benchmarks/bench_offline.py --locales fr_FR de_DE --latency lognormal:0.8:0.4 \
+      --chars-per-sec 2500 --rate-429 0.03 --drop-rate 0.01 -- --batch-chars 6000 --stream
+
+Arguments after "--" are passed to `i18n-seed translate` unchanged. Every run uses a fresh
+cache and output directory, so timings include every request.
+"""
+import os, sys, json, time, argparse, tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from i18n_seed import cli
+from i18n_seed.gemini_stub import StubConfig, start_stub_server
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+INPUTS = os.path.join(HERE, "..", "inputs")
+
+def main():
+    argv = sys.argv[1:]
+    passthrough = []
+    if "--" in argv:
+        k = argv.index("--")
+        argv, passthrough = argv[:k], argv[k + 1:]
+
+    ap = argparse.ArgumentParser(description="Benchmark the pipeline against the local Gemini stub")
+    ap.add_argument("--schema", default=os.path.join(INPUTS, "amazon-penguin-only-schema.json"))
+    ap.add_argument("--input-sql", default=os.path.join(INPUTS, "db_1757726935364_hnxldqjgq.sql"))
+    ap.add_argument("--locales", nargs="+", default=["fr_FR"])
+    ap.add_argument("--mode", choices=["synth", "replay"], default="synth")
+    ap.add_argument("--cassettes", default=None)
+    ap.add_argument("--latency", default="lognormal:0.8:0.4")
+    ap.add_argument("--chars-per-sec", type=float, default=2500.0)
+    ap.add_argument("--rate-429", type=float, default=0.0)
+    ap.add_argument("--rate-5xx", type=float, default=0.0)
+    ap.add_argument("--drop-rate", type=float, default=0.0)
+    ap.add_argument("--reorder-rate", type=float, default=0.0)
+    ap.add_argument("--malformed-rate", type=float, default=0.0)
+    ap.add_argument("--seed", type=int, default=1234)
+    args = ap.parse_args(argv)
+
+    server, stub = start_stub_server(StubConfig(
+        port=0, mode=args.mode, cassette_dir=args.cassettes, replay_miss="synth",
+        latency=args.latency, chars_per_sec=args.chars_per_sec,
+        rate_429=args.rate_429, rate_5xx=args.rate_5xx, drop_rate=args.drop_rate,
+        reorder_rate=args.reorder_rate, malformed_rate=args.malformed_rate, seed=args.seed,
+    ))
+    host, port = server.server_address[:2]
+    os.environ.setdefault("GEMINI_API_KEY", "offline-benchmark")
+
+    with tempfile.TemporaryDirectory(prefix="i18n-bench-") as tmp:
+        out_dir = os.path.join(tmp, "out")
+        sys.argv = [
+            "i18n-seed", "translate", "--schema", args.schema, "--input-sql", args.input_sql,
+            "--output", out_dir, "--locales", *args.locales,
+            "--cache", os.path.join(tmp, "cache.sqlite"),
+            "--llm-endpoint", f"http://{host}:{port}", "--qps", "1000", "--log-level", "WARNING",
+            *passthrough,
+        ]
+        t0 = time.perf_counter()
+        cli.main()
+        wall = time.perf_counter() - t0
+        report_path = os.path.join(out_dir, "run_report.json")
+        report = json.load(open(report_path, encoding="utf-8")) if os.path.exists(report_path) else {}
+
+    server.shutdown()
+    print(json.dumps({
+        "wall_s": round(wall, 2),
+        "locales": args.locales,
+        "stub": stub.stats,
+        "report": {k: v for k, v in report.items() if k != "locales"},
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Placeholder locking throughput on the extracted items of a seed: one pat.sub pass per
+pattern (the previous implementation) against the single-pass combined alternation.
+Then unlocking every occurrence: one str.replace per token (previous), one regex pass,
+and the per-locale PlaceholderUnlocker over the PlaceholderLocker's shared pairs.
+
+  python benchmarks/bench_placeholders.py --repeat 5 --with-generic
+
+Also counts strings whose locked form differs between the two. Only strings with
+overlapping or adjacent matches can differ (e.g. a code right after an inserted token).
+"""
+import os, sys, json, time, argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from i18n_seed.schema_loader import SchemaLoader
+from i18n_seed.sql_extractor import SqlExtractor
+from i18n_seed.placeholder_lock import (lock_placeholders, unlock_placeholders, _lock_sequential,
+                                        PlaceholderLocker, PlaceholderUnlocker)
+from i18n_seed.profiles.generic import GenericProfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+INPUTS = os.path.join(HERE, "..", "inputs")
+
+def _unlock_replace(s, mapping):
+    # previous unlock_placeholders
+    for k in sorted(mapping.keys(), key=lambda x: -len(x)):
+        s = s.replace(k, mapping[k])
+    return s
+
+def _time(fn, values, patterns, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        out = [fn(v, patterns) for v in values]
+        best = min(best, time.perf_counter() - t)
+    return best, out
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark placeholder locking")
+    ap.add_argument("--schema", default=os.path.join(INPUTS, "amazon-penguin-only-schema.json"))
+    ap.add_argument("--input-sql", default=os.path.join(INPUTS, "db_1757726935364_hnxldqjgq.sql"))
+    ap.add_argument("--repeat", type=int, default=5, help="Timed passes over all items (best is reported).")
+    ap.add_argument("--with-generic", action="store_true",
+                    help="Add the generic profile's patterns (URLs, format strings, tags, codes) to the seed's profile.")
+    args = ap.parse_args()
+
+    loader = SchemaLoader(args.schema)
+    profile = loader.profile_from_schema()
+    patterns = list(profile.placeholder_patterns) + (list(GenericProfile.placeholder_patterns) if args.with_generic else [])
+    extractor = SqlExtractor(loader.translatable_columns(), loader.primary_keys(), hints=loader.schema_hints,
+                             schema_columns_order=loader.columns_order_map())
+    with open(args.input_sql, encoding="utf-8") as f:
+        values = [it.value for it in extractor.extract(f.read())]
+    chars = sum(len(v) for v in values)
+
+    seq_s, seq_out = _time(_lock_sequential, values, patterns, args.repeat)
+    comb_s, comb_out = _time(lock_placeholders, values, patterns, args.repeat)
+    differing = [v for v, a, b in zip(values, seq_out, comb_out) if a != b]
+
+    # unlock a stand-in translation of every occurrence, as the dump and validation do
+    locker = PlaceholderLocker(patterns)
+    pairs = [locker.lock(v) for v in values]
+    targets = {locked: f"[xx] {locked}" for locked, _ in pairs}
+    unlock = {}
+    for name, make in (("replace", lambda: _unlock_replace), ("regex", lambda: unlock_placeholders),
+                       ("memoized", lambda: PlaceholderUnlocker().unlock)):
+        best = float("inf")
+        for _ in range(args.repeat):
+            fn = make()  # fresh memo per pass: one locale
+            t = time.perf_counter()
+            out = [fn(targets[locked], mapping) for locked, mapping in pairs]
+            best = min(best, time.perf_counter() - t)
+        unlock[name] = {"seconds": round(best, 4), "items_per_s": round(len(pairs) / best)}
+        unlock.setdefault("_ref", out)
+        if out != unlock["_ref"]:
+            raise SystemExit(f"unlock {name}: output differs")
+    del unlock["_ref"]
+    print(json.dumps({
+        "profile": profile.id,
+        "patterns": len(patterns),
+        "items": len(values),
+        "chars": chars,
+        "locked_items": sum(1 for _, m in comb_out if m),
+        "sequential": {"seconds": round(seq_s, 4), "items_per_s": round(len(values) / seq_s)},
+        "combined": {"seconds": round(comb_s, 4), "items_per_s": round(len(values) / comb_s)},
+        "speedup": round(seq_s / comb_s, 2),
+        "identical": len(values) - len(differing),
+        "differing": len(differing),
+        "differing_examples": differing[:3],
+        "unlock": unlock,
+    }, ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()
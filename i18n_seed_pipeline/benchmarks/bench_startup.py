@@ -0,0 +1,49 @@
+"""
+Startup cost: module import times and domain profile construction, each measured in a fresh
+interpreter (median of --runs).
+
+  python benchmarks/bench_startup.py --runs 15 --locales fr_FR
+
+"profile_first" builds a profile through the registry, "profile_cached" fetches it again,
+"overrides_<locale>" loads one locale's overrides, "all_locales" loads every locale's
+overrides (the cost every run paid when profiles were built eagerly).
+"""
+import os, sys, json, argparse, statistics, subprocess
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+SNIPPET = r"""
+import sys, time, json
+sys.path.insert(0, {root!r})
+out = {{}}
+t = time.perf_counter(); import i18n_seed.profiles as P; out["import_profiles"] = time.perf_counter() - t
+t = time.perf_counter(); p = P.get_profile({profile!r}); out["profile_first"] = time.perf_counter() - t
+t = time.perf_counter(); P.get_profile({profile!r}); out["profile_cached"] = time.perf_counter() - t
+for loc in {locales!r}:
+    t = time.perf_counter(); p.json_overrides_by_locale.get(loc, []); out["overrides_" + loc] = time.perf_counter() - t
+t = time.perf_counter(); [p.json_overrides_by_locale[loc] for loc in p.json_overrides_by_locale]; out["all_locales"] = time.perf_counter() - t
+t = time.perf_counter(); import i18n_seed.schema_loader; out["import_schema_loader"] = time.perf_counter() - t
+t = time.perf_counter(); import i18n_seed.cli; out["import_cli"] = time.perf_counter() - t
+print(json.dumps(out))
+"""
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark import and profile construction time")
+    ap.add_argument("--runs", type=int, default=15)
+    ap.add_argument("--profile", default="amazon")
+    ap.add_argument("--locales", nargs="+", default=["fr_FR"])
+    args = ap.parse_args()
+
+    code = SNIPPET.format(root=os.path.abspath(ROOT), profile=args.profile, locales=args.locales)
+    samples = []
+    for _ in range(args.runs):
+        res = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        samples.append(json.loads(res.stdout))
+    print(json.dumps({
+        "runs": args.runs,
+        "profile": args.profile,
+        "median_ms": {k: round(statistics.median(s[k] for s in samples) * 1000, 3) for k in samples[0]},
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
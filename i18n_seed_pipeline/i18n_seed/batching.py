@@ -0,0 +1,107 @@
+"""
+Batch planning for translation requests.
+
+Strings are packed into batches of at most `max_chars` characters with first-fit decreasing
+bin packing, so one long description no longer closes a nearly empty batch the way greedy
+order-preserving slicing does. Texts longer than `long_frac * max_chars` (default 3/4 of a
+batch) go to a separate lane and are packed among themselves, mostly one per request: they
+could hardly share a batch anyway, and a truncated or dropped answer for one of them then
+does not take a batch of short strings down with it.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from itertools import groupby
+from typing import List
+
+@dataclass
+class BatchPlan:
+    batches: List[List[str]] = field(default_factory=list)
+    long_batches: int = 0
+    max_chars: int = 0
+    greedy_batches: int = 0  # what order-preserving slicing of the same input needed
+
+    def __iter__(self):
+        return iter(self.batches)
+
+    def __len__(self) -> int:
+        return len(self.batches)
+
+    @property
+    def n_items(self) -> int:
+        return sum(len(b) for b in self.batches)
+
+    def describe(self) -> str:
+        if not self.batches:
+            return "0 batch(es)"
+        sizes = [sum(len(s) for s in b) for b in self.batches]
+        fill = sum(sizes) / (len(sizes) * self.max_chars) if self.max_chars else 0.0
+        return (
+            f"{len(self.batches)} batch(es) for {self.n_items} string(s) "
+            f"({self.long_batches} in the long lane), avg fill {fill:.0%}, "
+            f"greedy slicing would need {self.greedy_batches}"
+        )
+
+def _first_fit_decreasing(texts: List[str], idx: List[int], max_chars: int) -> List[List[int]]:
+    # the bins' free room sits in the leaves of a max segment tree, so the first bin with
+    # enough room is found in O(log bins) instead of scanning every open bin; texts of equal
+    # length arrive together and first fit puts as many of them as fit into that bin at once
+    size = 1
+    while size < max(1, len(idx)):
+        size *= 2
+    tree = [-1] * (2 * size)  # -1: no bin there yet
+    bins: List[List[int]] = []
+    for n, group in groupby(sorted(idx, key=lambda k: len(texts[k]), reverse=True), key=lambda k: len(texts[k])):
+        run = list(group)
+        k = 0
+        while k < len(run):
+            if tree[1] >= n:
+                node = 1
+                while node < size:
+                    node = 2 * node if tree[2 * node] >= n else 2 * node + 1
+                room = tree[node]
+                take = min(len(run) - k, room // n) if n else len(run) - k
+                bins[node - size].extend(run[k:k + take])
+            else:
+                # no open bin fits: a new one (oversized strings still get a batch of their own)
+                node = len(bins) + size
+                room = max_chars
+                take = min(len(run) - k, max(1, room // n)) if n else len(run) - k
+                bins.append(run[k:k + take])
+            k += take
+            tree[node] = max(0, room - take * n)
+            node //= 2
+            while node:
+                best = max(tree[2 * node], tree[2 * node + 1])
+                if tree[node] == best:
+                    break  # ancestors are unchanged too
+                tree[node] = best
+                node //= 2
+    return bins
+
+def plan_batches(texts: List[str], max_chars: int, long_frac: float = 0.75) -> BatchPlan:
+    """
+    Packs `texts` into batches of <= max_chars characters. Every text ends up in exactly one
+    batch; inside a batch the input order is kept (stable prompts for identical inputs).
+    """
+    max_chars = max(1, max_chars)
+    limit = max_chars * long_frac
+    short_idx = [i for i, s in enumerate(texts) if len(s) <= limit]
+    long_idx = [i for i, s in enumerate(texts) if len(s) > limit]
+
+    short_bins = _first_fit_decreasing(texts, short_idx, max_chars)
+    long_bins = _first_fit_decreasing(texts, long_idx, max_chars)
+    bins = sorted((sorted(b) for b in short_bins), key=lambda b: b[0]) + sorted((sorted(b) for b in long_bins), key=lambda b: b[0])
+    return BatchPlan(
+        batches=[[texts[i] for i in b] for b in bins], long_batches=len(long_bins),
+        max_chars=max_chars, greedy_batches=greedy_batch_count(texts, max_chars),
+    )
+
+def greedy_batch_count(texts: List[str], max_chars: int) -> int:
+    """Number of batches the previous order-preserving slicing produced (for comparison in logs)."""
+    count, cur_chars, cur_n = 0, 0, 0
+    for s in texts:
+        if cur_n and cur_chars + len(s) > max_chars:
+            count += 1; cur_chars, cur_n = 0, 0
+        cur_chars += len(s); cur_n += 1
+    return count + (1 if cur_n else 0)
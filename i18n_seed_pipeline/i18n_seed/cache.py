@@ -1,30 +1,583 @@
+import atexit
+import fnmatch
+import hashlib
+import logging
+import math
+import os
+import queue
 import sqlite3
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+# Entries are keyed by a 64-bit blake2b digest of (namespace, locale, source), stored as the
+# rowid. The namespace names the model and prompt/rule version that produced a translation,
+# so switching models or rule sets starts a separate set of entries in the same file instead
+# of reusing (or requiring the deletion of) the old ones. Source texts are stored once, under
+# their own digest (sid), which reads also compare, so a key collision can't return a wrong row.
+# last_used (unix seconds) and hits drive `i18n-seed cache evict` / `prune`. Pinned entries
+# (human translations from `i18n-seed ingest-localized`) are never overwritten or evicted.
+SCHEMA_VERSION = 4
 SCHEMA = '''
-CREATE TABLE IF NOT EXISTS cache (
-  source TEXT NOT NULL,
+CREATE TABLE IF NOT EXISTS namespaces (
+  ns_id INTEGER PRIMARY KEY,
+  name TEXT NOT NULL UNIQUE,
+  last_used INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS sources (
+  sid INTEGER PRIMARY KEY,
+  source TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS translations (
+  key INTEGER PRIMARY KEY,
+  sid INTEGER NOT NULL,
+  ns_id INTEGER NOT NULL,
   locale TEXT NOT NULL,
   translated TEXT NOT NULL,
-  PRIMARY KEY (source, locale)
+  last_used INTEGER NOT NULL DEFAULT 0,
+  hits INTEGER NOT NULL DEFAULT 0,
+  pinned INTEGER NOT NULL DEFAULT 0
 );
 '''
 
+# WAL + synchronous=NORMAL: commits don't fsync (the WAL is synced at checkpoints); a crash can
+# lose at most the last uncommitted writes, which are simply translated again on the next run
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA mmap_size=268435456;",  # 256 MiB
+    "PRAGMA cache_size=-65536;",    # 64 MiB
+    "PRAGMA busy_timeout=10000;",
+)
+# per-thread read connections: same caches, and they can never take the write lock
+READ_PRAGMAS = PRAGMAS[2:] + ("PRAGMA query_only=1;",)
+# new files free pages with `PRAGMA incremental_vacuum` (older files are converted by `cache vacuum`)
+AUTO_VACUUM_INCREMENTAL = 2
+
+# stays below SQLITE_MAX_VARIABLE_NUMBER of old builds (999)
+_IN_CHUNK = 900
+DEFAULT_NAMESPACE = "default"
+# entries migrated from v1 files, which don't record the model or rules that produced them
+LEGACY_NAMESPACE = "legacy"
+# rough per-entry overhead of the in-memory tier (tuple key, OrderedDict node, str headers)
+_MEM_ENTRY_OVERHEAD = 200
+# hit counts / last-used times are written in batches of this many entries (and at flush/close)
+_TOUCH_BATCH = 5000
+
+def _digest64(h) -> int:
+    return int.from_bytes(h.digest(), "big", signed=True)
+
+def source_digest(source: str) -> int:
+    return _digest64(hashlib.blake2b(source.encode("utf-8"), digest_size=8))
+
+def entry_key(namespace: str, locale: str, source: str) -> int:
+    h = hashlib.blake2b(digest_size=8, person=b"i18n-seed")
+    for part in (namespace, locale):
+        h.update(part.encode("utf-8")); h.update(b"\x00")
+    h.update(source.encode("utf-8"))
+    return _digest64(h)
+
+def _open_writer(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, check_same_thread=False)
+    # only effective before the first table exists, i.e. for new files
+    conn.execute(f"PRAGMA auto_vacuum={AUTO_VACUUM_INCREMENTAL};")
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+def _upgrade_schema(conn: sqlite3.Connection) -> None:
+    """Creates missing tables and adds later columns to older files (v2 entries count as used now)."""
+    conn.executescript(SCHEMA)
+    now = int(time.time())
+    for table in ("namespaces", "translations"):
+        cols = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if "last_used" not in cols:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN last_used INTEGER NOT NULL DEFAULT 0")
+            conn.execute(f"UPDATE {table} SET last_used=?", (now,))
+        if table == "translations" and "hits" not in cols:
+            conn.execute("ALTER TABLE translations ADD COLUMN hits INTEGER NOT NULL DEFAULT 0")
+        if table == "translations" and "pinned" not in cols:
+            conn.execute("ALTER TABLE translations ADD COLUMN pinned INTEGER NOT NULL DEFAULT 0")
+    conn.execute(f"PRAGMA user_version={SCHEMA_VERSION};")
+    conn.commit()
+
+def _upsert_rows(conn: sqlite3.Connection, namespace: str, ns_id: int, rows) -> None:
+    """Writes (source, locale, translated) rows into `namespace`; pinned entries are kept."""
+    src_rows, tr_rows = [], []
+    now = int(time.time())
+    for source, locale, translated in rows:
+        sid = source_digest(source)
+        src_rows.append((sid, source))
+        tr_rows.append((entry_key(namespace, locale, source), sid, ns_id, locale, translated, now))
+    # digests are random, so insert in key order to walk the B-trees instead of jumping around
+    src_rows.sort(); tr_rows.sort()
+    conn.executemany("INSERT OR IGNORE INTO sources (sid, source) VALUES (?, ?)", src_rows)
+    conn.executemany(
+        "INSERT INTO translations (key, sid, ns_id, locale, translated, last_used) VALUES (?, ?, ?, ?, ?, ?) "
+        "ON CONFLICT(key) DO UPDATE SET translated=excluded.translated, last_used=excluded.last_used WHERE pinned=0", tr_rows
+    )
+
+def _migrate_v1(conn: sqlite3.Connection) -> Optional[int]:
+    """
+    Old files have a single `cache (source, locale, translated)` table without model/rules.
+    Its rows move to the `legacy` namespace, since nothing tells which model or rule set
+    produced them, then the table is dropped and the file vacuumed. Returns the number of
+    migrated entries (None for files that are already current).
+    """
+    if not conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='cache'").fetchone():
+        return None
+    conn.execute("INSERT OR IGNORE INTO namespaces (name, last_used) VALUES (?, ?)", (LEGACY_NAMESPACE, int(time.time())))
+    ns_id = conn.execute("SELECT ns_id FROM namespaces WHERE name=?", (LEGACY_NAMESPACE,)).fetchone()[0]
+    rows = conn.execute("SELECT source, locale, translated FROM cache").fetchall()
+    _upsert_rows(conn, LEGACY_NAMESPACE, ns_id, rows)
+    conn.execute("DROP TABLE cache")
+    conn.commit()
+    conn.execute("VACUUM")
+    return len(rows)
+
 class TranslationCache:
-    def __init__(self, path: str) -> None:
-        self.conn = sqlite3.connect(path)
-        self.conn.execute("PRAGMA journal_mode=WAL;")
-        self.conn.execute(SCHEMA)
+    """
+    SQLite translation cache that can be shared by any number of threads.
+
+    Reads use one read-only connection per thread; with WAL they see the last committed state
+    and are never blocked by writes. Writes are queued and a single writer thread commits
+    them in batched transactions (whatever is queued, up to `commit_every` rows each). Rows
+    still in the queue are served from memory, so a put is visible to get() immediately.
+    flush() waits until everything queued so far is committed.
+    """
+
+    def __init__(self, path: str, commit_every: int = 500, namespace: str = DEFAULT_NAMESPACE,
+                 logger: Optional[logging.Logger] = None, mem_entries: int = 100_000,
+                 mem_bytes: int = 64 * 2**20) -> None:
+        self.path = path
+        self.logger = logger or logging.getLogger("i18n-seed")
+        # guards the memory tier, the unwritten rows and the counters; never held during SQLite I/O
+        self._lock = threading.Lock()
+        # in-process LRU tier in front of SQLite, bounded by entries and by (approximate) bytes;
+        # writes go through to both, so a string is fetched from SQLite at most once per process
+        self.mem_entries = max(0, mem_entries)
+        self.mem_bytes = max(0, mem_bytes)
+        self._mem: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._mem_size = 0
+        # (locale, source) -> translation queued for the writer but not committed yet
+        self._unwritten: Dict[Tuple[str, str], str] = {}
+        # (locale, source) -> hits since the last touch batch went to the writer
+        self._touched: Dict[Tuple[str, str], int] = {}
+        self.stats = {"memory_hits": 0, "sqlite_hits": 0, "misses": 0, "evictions": 0,
+                      "write_batches": 0, "rows_written": 0, "write_errors": 0}
+
+        # the writer connection is only used by the writer thread once it has started
+        self.conn = _open_writer(path)
+        _upgrade_schema(self.conn)
+        self.namespace = namespace
+        self.ns_id = self._namespace_id(namespace)
         self.conn.commit()
+        migrated = _migrate_v1(self.conn)
+        if migrated is not None:
+            self.logger.info(f"Translation cache migrated to schema v{SCHEMA_VERSION}: {migrated} entries -> namespace "
+                             f"'{LEGACY_NAMESPACE}' (use them with --cache-namespace {LEGACY_NAMESPACE})")
+
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self.commit_every = max(1, commit_every)
+        self._queue: "queue.Queue" = queue.Queue()
+        self._closed = False
+        # set when the writer thread hits an unexpected error; puts and flushes raise from then on
+        self._failed: Optional[BaseException] = None
+        self._writer = threading.Thread(target=self._writer_loop, name="i18n-seed-cache-writer", daemon=True)
+        self._writer.start()
+        # queued rows are committed even if the run ends without close() (e.g. Ctrl-C)
+        atexit.register(self.close)
+
+    def _namespace_id(self, name: str) -> int:
+        self.conn.execute("INSERT OR IGNORE INTO namespaces (name) VALUES (?)", (name,))
+        self.conn.execute("UPDATE namespaces SET last_used=? WHERE name=?", (int(time.time()), name))
+        return self.conn.execute("SELECT ns_id FROM namespaces WHERE name=?", (name,)).fetchone()[0]
+
+    # ----------------- reads -----------------
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            for pragma in READ_PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            with self._lock:
+                self._readers.append(conn)
+        return conn
 
     def get(self, source: str, locale: str) -> Optional[str]:
-        cur = self.conn.execute("SELECT translated FROM cache WHERE source=? AND locale=?", (source, locale))
-        row = cur.fetchone()
-        return row[0] if row else None
+        return self.get_many((source,), locale).get(source)
+
+    def get_many(self, sources: Iterable[str], locale: str) -> Dict[str, str]:
+        """source -> translation for every cached source (misses are absent); chunked IN queries."""
+        out: Dict[str, str] = {}
+        by_key = {}
+        with self._lock:
+            for s in dict.fromkeys(sources):
+                t = self._unwritten.get((locale, s))
+                if t is None:
+                    t = self._mem_get(locale, s)
+                if t is None:
+                    by_key[entry_key(self.namespace, locale, s)] = s
+                else:
+                    out[s] = t
+            self.stats["memory_hits"] += len(out)
+            self._touch(locale, out)
+        found: Dict[str, str] = {}
+        if by_key:
+            conn = self._reader()
+            # sorted keys walk the B-tree in order instead of jumping around for every chunk
+            keys = sorted(by_key)
+            for k in range(0, len(keys), _IN_CHUNK):
+                chunk = keys[k:k + _IN_CHUNK]
+                marks = ",".join("?" * len(chunk))
+                cur = conn.execute(f"SELECT key, sid, translated FROM translations WHERE key IN ({marks})", chunk)
+                for key, sid, t in cur.fetchall():
+                    src = by_key[key]
+                    if sid == source_digest(src):
+                        found[src] = t
+        with self._lock:
+            for src, t in found.items():
+                # a put from another thread since the lookup is newer than what we read
+                if (locale, src) not in self._unwritten and (locale, src) not in self._mem:
+                    self._mem_put(locale, src, t)
+            self.stats["sqlite_hits"] += len(found)
+            self.stats["misses"] += len(by_key) - len(found)
+            self._touch(locale, found)
+            touched = self._take_touched() if len(self._touched) >= _TOUCH_BATCH else None
+        if touched:
+            self._queue.put(("touch", touched))
+        out.update(found)
+        return out
+
+    def _touch(self, locale: str, sources: Iterable[str]) -> None:
+        for s in sources:
+            self._touched[(locale, s)] = self._touched.get((locale, s), 0) + 1
+
+    def _take_touched(self) -> Dict[Tuple[str, str], int]:
+        touched, self._touched = self._touched, {}
+        return touched
+
+    def _mem_get(self, locale: str, source: str) -> Optional[str]:
+        t = self._mem.get((locale, source))
+        if t is not None:
+            self._mem.move_to_end((locale, source))
+        return t
+
+    def _mem_put(self, locale: str, source: str, translated: str) -> None:
+        if not self.mem_entries or not self.mem_bytes:
+            return
+        key = (locale, source)
+        old = self._mem.pop(key, None)
+        if old is not None:
+            self._mem_size -= len(source) + len(old) + _MEM_ENTRY_OVERHEAD
+        self._mem[key] = translated
+        self._mem_size += len(source) + len(translated) + _MEM_ENTRY_OVERHEAD
+        while self._mem and (len(self._mem) > self.mem_entries or self._mem_size > self.mem_bytes):
+            (_, s), t = self._mem.popitem(last=False)
+            self._mem_size -= len(s) + len(t) + _MEM_ENTRY_OVERHEAD
+            self.stats["evictions"] += 1
+
+    def _mem_drop(self, key: Tuple[str, str]) -> None:
+        t = self._mem.pop(key, None)
+        if t is not None:
+            self._mem_size -= len(key[1]) + len(t) + _MEM_ENTRY_OVERHEAD
+
+    def report(self) -> Dict[str, object]:
+        """Lookup counters for run_report.json (per distinct source and locale), plus writer counters."""
+        with self._lock:
+            st = dict(self.stats)
+            lookups = st["memory_hits"] + st["sqlite_hits"] + st["misses"]
+            st["lookups"] = lookups
+            st["memory_hit_rate"] = round(st["memory_hits"] / lookups, 4) if lookups else 0.0
+            st["hit_rate"] = round((st["memory_hits"] + st["sqlite_hits"]) / lookups, 4) if lookups else 0.0
+            st["memory_entries"] = len(self._mem)
+            st["memory_bytes"] = self._mem_size
+        return st
+
+    # ----------------- writes -----------------
 
     def put(self, source: str, locale: str, translated: str) -> None:
-        self.conn.execute("INSERT OR REPLACE INTO cache (source, locale, translated) VALUES (?, ?, ?)", (source, locale, translated))
-        self.conn.commit()
+        self.put_many([(source, locale, translated)])
+
+    def put_many(self, rows: Iterable[Tuple[str, str, str]]) -> int:
+        """Queues (source, locale, translated) rows for the writer thread; returns the row count."""
+        rows = list(rows)
+        if not rows:
+            return 0
+        if self._closed:
+            raise RuntimeError("TranslationCache is closed")
+        self._raise_if_failed()
+        with self._lock:
+            for source, locale, translated in rows:
+                self._unwritten[(locale, source)] = translated
+                self._mem_put(locale, source, translated)
+        self._queue.put(("rows", rows))
+        return len(rows)
+
+    def _writer_loop(self) -> None:
+        # queue items: ("rows", [(source, locale, translated)]), ("touch", {(locale, source): hits}), None = stop
+        stop = False
+        while not stop:
+            items = [self._queue.get()]
+            # group whatever else is queued into the same transaction
+            while sum(len(it[1]) for it in items if it is not None) < self.commit_every:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(it is None for it in items)
+            try:
+                if self._failed is not None:
+                    continue  # drain, so flush() and close() return
+                rows = [r for it in items if it is not None and it[0] == "rows" for r in it[1]]
+                touched: Dict[Tuple[str, str], int] = {}
+                for it in items:
+                    if it is not None and it[0] == "touch":
+                        for k, n in it[1].items():
+                            touched[k] = touched.get(k, 0) + n
+                if rows or touched:
+                    self._commit_rows(rows, touched)
+            except Exception as e:
+                self._failed = e
+                try:
+                    self.conn.rollback()
+                except sqlite3.Error:
+                    pass
+                self.logger.error(f"Translation cache writer failed, nothing more is written: {e!r}")
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+
+    def _raise_if_failed(self) -> None:
+        if self._failed is not None:
+            raise RuntimeError(f"TranslationCache writer failed: {self._failed!r}") from self._failed
+
+    def _commit_rows(self, rows, touched: Dict[Tuple[str, str], int]) -> None:
+        pinned: List[Tuple[str, str]] = []
+        try:
+            self._write(rows)
+            pinned = self._pinned(rows)
+            if touched:
+                now = int(time.time())
+                self.conn.executemany(
+                    "UPDATE translations SET hits=hits+?, last_used=? WHERE key=?",
+                    sorted((n, now, entry_key(self.namespace, loc, s)) for (loc, s), n in touched.items()),
+                )
+            self.conn.commit()
+            ok = True
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            self.logger.warning(f"Translation cache: writing {len(rows)} row(s) failed: {e}")
+            ok = False
+        with self._lock:
+            for source, locale, translated in rows:
+                if self._unwritten.get((locale, source)) is translated:
+                    del self._unwritten[(locale, source)]
+            # the upsert kept the pinned translation; the next get() reads it from SQLite
+            for key in pinned:
+                self._mem_drop(key)
+            if ok and rows:
+                self.stats["write_batches"] += 1
+                self.stats["rows_written"] += len(rows)
+            elif not ok:
+                self.stats["write_errors"] += len(rows)
+
+    def _pinned(self, rows) -> List[Tuple[str, str]]:
+        """(locale, source) of the rows whose entry is pinned, i.e. was not overwritten."""
+        by_key = {entry_key(self.namespace, locale, source): (locale, source) for source, locale, _ in rows}
+        keys = sorted(by_key)
+        out = []
+        for k in range(0, len(keys), _IN_CHUNK):
+            chunk = keys[k:k + _IN_CHUNK]
+            marks = ",".join("?" * len(chunk))
+            out += [by_key[key] for (key,) in self.conn.execute(
+                f"SELECT key FROM translations WHERE pinned=1 AND key IN ({marks})", chunk)]
+        return out
+
+    def _write(self, rows) -> None:
+        _upsert_rows(self.conn, self.namespace, self.ns_id, rows)
+
+    def flush(self) -> None:
+        """Blocks until every row (and hit count) queued so far is committed (RuntimeError if the writer failed)."""
+        with self._lock:
+            touched = self._take_touched()
+        if touched:
+            self._queue.put(("touch", touched))
+        self._queue.join()
+        self._raise_if_failed()
 
     def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        with self._lock:
+            touched = self._take_touched()
+        if touched:
+            self._queue.put(("touch", touched))
+        self._queue.put(None)
+        self._writer.join()
+        with self._lock:
+            readers, self._readers = self._readers, []
+        for conn in readers:
+            conn.close()
         self.conn.close()
+
+# ----------------- maintenance (`i18n-seed cache ...`) -----------------
+
+def open_for_maintenance(path: str, create: bool = False) -> sqlite3.Connection:
+    """Writer connection to a cache file (an existing one unless `create`), upgraded to the current schema."""
+    if not create and not os.path.exists(path):
+        raise FileNotFoundError(f"Translation cache not found: {path}")
+    conn = _open_writer(path)
+    _upgrade_schema(conn)
+    migrated = _migrate_v1(conn)
+    if migrated is not None:
+        logging.getLogger("i18n-seed").info(f"{path}: migrated {migrated} v1 entries to namespace '{LEGACY_NAMESPACE}'")
+    return conn
+
+def _fmt_time(ts: Optional[int]) -> Optional[str]:
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(ts)) if ts else None
+
+def _live_bytes(conn: sqlite3.Connection) -> int:
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    pages = conn.execute("PRAGMA page_count").fetchone()[0]
+    free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    return (pages - free) * page_size
+
+def _delete_orphan_sources(conn: sqlite3.Connection) -> int:
+    cur = conn.execute("DELETE FROM sources WHERE sid NOT IN (SELECT sid FROM translations)")
+    return cur.rowcount
+
+def cache_stats(conn: sqlite3.Connection, path: str) -> Dict[str, Any]:
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    pages = conn.execute("PRAGMA page_count").fetchone()[0]
+    free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    namespaces = []
+    for ns_id, name, ns_used in conn.execute("SELECT ns_id, name, last_used FROM namespaces ORDER BY name").fetchall():
+        n, hits, never, pinned, oldest, newest = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(hits), 0), COALESCE(SUM(hits = 0), 0), COALESCE(SUM(pinned), 0), "
+            "MIN(last_used), MAX(last_used) FROM translations WHERE ns_id=?", (ns_id,)
+        ).fetchone()
+        locales = dict(conn.execute(
+            "SELECT locale, COUNT(*) FROM translations WHERE ns_id=? GROUP BY locale ORDER BY locale", (ns_id,)
+        ).fetchall())
+        namespaces.append({
+            "name": name, "entries": n, "hits": hits, "never_hit": never, "pinned": pinned, "locales": locales,
+            "last_opened": _fmt_time(ns_used), "oldest_use": _fmt_time(oldest), "newest_use": _fmt_time(newest),
+        })
+    wal = path + "-wal"
+    return {
+        "path": path,
+        "file_bytes": os.path.getsize(path) + (os.path.getsize(wal) if os.path.exists(wal) else 0),
+        "live_bytes": (pages - free) * page_size,
+        "free_bytes": free * page_size,
+        "auto_vacuum": {0: "none", 1: "full", 2: "incremental"}.get(conn.execute("PRAGMA auto_vacuum").fetchone()[0]),
+        "entries": conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0],
+        "sources": conn.execute("SELECT COUNT(*) FROM sources").fetchone()[0],
+        "orphan_sources": conn.execute(
+            "SELECT COUNT(*) FROM sources WHERE sid NOT IN (SELECT sid FROM translations)"
+        ).fetchone()[0],
+        "namespaces": namespaces,
+    }
+
+def evict_entries(conn: sqlite3.Connection, max_bytes: Optional[int] = None, ttl_days: Optional[float] = None,
+                  now: Optional[int] = None) -> Dict[str, int]:
+    """
+    Deletes entries not used for `ttl_days`, then least recently used ones (fewest hits first
+    among equally old entries) until the file fits in `max_bytes`. Pinned entries are kept;
+    sources left without translations are removed.
+
+    Keys are random, so deletions leave pages partly empty rather than free: each size round
+    drops the share of entries above the cap and compacts the file (VACUUM) to measure again.
+    """
+    now = int(time.time()) if now is None else now
+    out = {"ttl_evicted": 0, "lru_evicted": 0, "orphan_sources": 0, "live_bytes_before": _live_bytes(conn)}
+    if ttl_days is not None:
+        cur = conn.execute("DELETE FROM translations WHERE last_used < ? AND pinned=0", (now - int(ttl_days * 86400),))
+        out["ttl_evicted"] = cur.rowcount
+        out["orphan_sources"] += _delete_orphan_sources(conn)
+        conn.commit()
+    if max_bytes is not None:
+        size = _live_bytes(conn)
+        for _ in range(4):
+            entries = conn.execute("SELECT COUNT(*) FROM translations WHERE pinned=0").fetchone()[0]
+            if size <= max_bytes or not entries:
+                break
+            n = entries - math.floor(entries * max_bytes / size)
+            cur = conn.execute(
+                "DELETE FROM translations WHERE key IN "
+                "(SELECT key FROM translations WHERE pinned=0 ORDER BY last_used, hits LIMIT ?)", (max(1, n),)
+            )
+            out["lru_evicted"] += cur.rowcount
+            out["orphan_sources"] += _delete_orphan_sources(conn)
+            conn.commit()
+            vacuum_cache(conn, full=True)
+            size = _live_bytes(conn)
+    out["live_bytes_after"] = _live_bytes(conn)
+    return out
+
+def pin_translations(conn: sqlite3.Connection, namespace: str, locale: str, pairs: Dict[str, str]) -> int:
+    """Stores source -> translation pairs as pinned entries of `namespace`, replacing cached model output."""
+    now = int(time.time())
+    conn.execute("INSERT OR IGNORE INTO namespaces (name, last_used) VALUES (?, ?)", (namespace, now))
+    ns_id = conn.execute("SELECT ns_id FROM namespaces WHERE name=?", (namespace,)).fetchone()[0]
+    src_rows, tr_rows = [], []
+    for source, translated in pairs.items():
+        sid = source_digest(source)
+        src_rows.append((sid, source))
+        tr_rows.append((entry_key(namespace, locale, source), sid, ns_id, locale, translated, now))
+    src_rows.sort(); tr_rows.sort()
+    conn.executemany("INSERT OR IGNORE INTO sources (sid, source) VALUES (?, ?)", src_rows)
+    conn.executemany(
+        "INSERT INTO translations (key, sid, ns_id, locale, translated, last_used, pinned) VALUES (?, ?, ?, ?, ?, ?, 1) "
+        "ON CONFLICT(key) DO UPDATE SET translated=excluded.translated, last_used=excluded.last_used, pinned=1", tr_rows
+    )
+    conn.commit()
+    return len(tr_rows)
+
+def prune_namespaces(conn: sqlite3.Connection, drop: Optional[List[str]] = None, keep: Optional[List[str]] = None,
+                     unused_days: Optional[float] = None, now: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Deletes the entries of namespaces (models / prompt versions) matching a `drop` pattern, not
+    matching any `keep` pattern, or not opened by a run for `unused_days` (fnmatch patterns,
+    e.g. 'gemini:gemini-1.5-*'). Orphaned sources are removed in any case.
+    """
+    now = int(time.time()) if now is None else now
+    pruned = []
+    for ns_id, name, last_used in conn.execute("SELECT ns_id, name, last_used FROM namespaces").fetchall():
+        if (any(fnmatch.fnmatchcase(name, p) for p in drop or [])
+                or (keep and not any(fnmatch.fnmatchcase(name, p) for p in keep))
+                or (unused_days is not None and last_used < now - unused_days * 86400)):
+            cur = conn.execute("DELETE FROM translations WHERE ns_id=?", (ns_id,))
+            conn.execute("DELETE FROM namespaces WHERE ns_id=?", (ns_id,))
+            pruned.append({"name": name, "entries": cur.rowcount})
+    orphans = _delete_orphan_sources(conn)
+    conn.commit()
+    return {"namespaces": pruned, "entries": sum(p["entries"] for p in pruned), "orphan_sources": orphans}
+
+def vacuum_cache(conn: sqlite3.Connection, full: bool = False) -> Dict[str, Any]:
+    """
+    Returns free pages to the file system: `PRAGMA incremental_vacuum` on files in incremental
+    auto-vacuum mode, otherwise (or with full=True) a VACUUM, which also compacts partly empty
+    pages and switches the file to incremental mode. The WAL is checkpointed and truncated.
+    """
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    before = conn.execute("PRAGMA page_count").fetchone()[0] * page_size
+    mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+    if full or mode != AUTO_VACUUM_INCREMENTAL:
+        conn.execute(f"PRAGMA auto_vacuum={AUTO_VACUUM_INCREMENTAL};")
+        conn.execute("VACUUM")
+        how = "full"
+    else:
+        conn.execute("PRAGMA incremental_vacuum").fetchall()
+        conn.commit()
+        how = "incremental"
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+    after = conn.execute("PRAGMA page_count").fetchone()[0] * page_size
+    return {"vacuum": how, "bytes_before": before, "bytes_after": after}
@@ -0,0 +1,161 @@
+"""
+Portable cache bundles (`i18n-seed cache export` / `cache import`), to warm-start fresh CI
+runners and other ephemeral workers from a published artifact.
+
+A bundle is gzip-compressed JSON Lines: a header, one line per entry
+  {"n": namespace, "l": locale, "s": source, "t": translation}   (+ "p": 1 for pinned entries)
+in entry-key order, and a trailer with the entry count and the SHA-256 of the entry lines.
+gzip runs with mtime 0, so the same entries always give the same bytes. Exported to a
+directory, the file is named after that digest (cache-<digest>.jsonl.gz), i.e. artifacts are
+content-addressed.
+
+Imports verify the trailer first and then bulk insert with INSERT OR IGNORE, in large
+transactions: local entries win, and importing a bundle again changes nothing. With
+overwrite, bundle entries replace the translation of local ones but keep their usage
+counters, and a locally pinned entry is only replaced by a pinned bundle entry.
+"""
+from __future__ import annotations
+
+import os
+import gzip
+import json
+import time
+import fnmatch
+import hashlib
+import sqlite3
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .cache import entry_key, source_digest
+
+BUNDLE_FORMAT = "i18n-seed-cache-bundle"
+BUNDLE_VERSION = 1
+_IMPORT_BATCH = 50_000
+
+def _match(name: str, patterns: Optional[List[str]]) -> bool:
+    return not patterns or any(fnmatch.fnmatchcase(name, p) for p in patterns)
+
+def export_bundle(conn: sqlite3.Connection, out_path: str, *, locales: Optional[List[str]] = None,
+                  namespaces: Optional[List[str]] = None, sources: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Writes the entries matching the filters (locales, namespace fnmatch patterns, source texts)
+    to a bundle. `out_path` may be a directory; the bundle is then named after its digest.
+    """
+    ns_ids = {ns_id: name for ns_id, name in conn.execute("SELECT ns_id, name FROM namespaces")
+              if _match(name, namespaces)}
+    sql = ("SELECT t.ns_id, t.locale, s.source, t.translated, t.pinned FROM translations t "
+           "JOIN sources s ON s.sid = t.sid")
+    if sources is not None:
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS bundle_sids (sid INTEGER PRIMARY KEY)")
+        conn.execute("DELETE FROM bundle_sids")
+        conn.executemany("INSERT OR IGNORE INTO bundle_sids VALUES (?)", ((source_digest(s),) for s in set(sources)))
+        sql += " JOIN bundle_sids w ON w.sid = t.sid"
+    where, params = [f"t.ns_id IN ({','.join('?' * len(ns_ids))})"], list(ns_ids)
+    if locales:
+        where.append(f"t.locale IN ({','.join('?' * len(locales))})")
+        params += locales
+    sql += " WHERE " + " AND ".join(where) + " ORDER BY t.key"
+
+    to_dir = os.path.isdir(out_path)
+    fd, tmp = tempfile.mkstemp(suffix=".jsonl.gz.tmp", dir=out_path if to_dir else (os.path.dirname(out_path) or "."))
+    os.close(fd)
+    digest = hashlib.sha256()
+    n = 0
+    # no timestamp: equal entries must give byte-identical bundles
+    header = {"format": BUNDLE_FORMAT, "version": BUNDLE_VERSION,
+              "filters": {"locales": locales, "namespaces": namespaces, "sources": sources is not None}}
+    try:
+        with open(tmp, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as gz:
+            gz.write((json.dumps(header, sort_keys=True) + "\n").encode("utf-8"))
+            for ns_id, locale, source, translated, pinned in conn.execute(sql, params):
+                entry = {"n": ns_ids[ns_id], "l": locale, "s": source, "t": translated}
+                if pinned:
+                    entry["p"] = 1
+                line = (json.dumps(entry, ensure_ascii=False, sort_keys=True) + "\n").encode("utf-8")
+                digest.update(line)
+                gz.write(line)
+                n += 1
+            gz.write((json.dumps({"end": True, "entries": n, "sha256": digest.hexdigest()}) + "\n").encode("utf-8"))
+        path = os.path.join(out_path, f"cache-{digest.hexdigest()[:16]}.jsonl.gz") if to_dir else out_path
+        os.chmod(tmp, 0o644)  # mkstemp creates 0600; bundles are meant to be shared
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return {"bundle": path, "entries": n, "sha256": digest.hexdigest(), "bytes": os.path.getsize(path),
+            "namespaces": sorted(ns_ids.values())}
+
+def _read_lines(path: str) -> Iterator[bytes]:
+    with gzip.open(path, "rb") as gz:
+        for line in gz:
+            yield line
+
+def verify_bundle(path: str) -> Dict[str, Any]:
+    """Header of a complete, unmodified bundle (ValueError otherwise)."""
+    lines = _read_lines(path)
+    header = json.loads(next(lines, b"{}"))
+    if header.get("format") != BUNDLE_FORMAT or header.get("version") != BUNDLE_VERSION:
+        raise ValueError(f"{path}: not an {BUNDLE_FORMAT} v{BUNDLE_VERSION} file")
+    digest, n, trailer = hashlib.sha256(), 0, None
+    for line in lines:
+        if line.startswith(b'{"end"'):
+            trailer = json.loads(line)
+            break
+        digest.update(line)
+        n += 1
+    if trailer is None or trailer.get("entries") != n or trailer.get("sha256") != digest.hexdigest():
+        raise ValueError(f"{path}: truncated or corrupt bundle")
+    return header
+
+def import_bundle(conn: sqlite3.Connection, path: str, *, locales: Optional[List[str]] = None,
+                  namespaces: Optional[List[str]] = None, overwrite: bool = False) -> Dict[str, Any]:
+    """
+    Merges a bundle into the cache; with overwrite=True bundle entries replace local ones,
+    except that unpinned bundle entries never replace pinned local ones.
+    """
+    verify_bundle(path)
+    ns_ids: Dict[str, int] = {}
+    sql = "INTO translations (key, sid, ns_id, locale, translated, last_used, pinned) VALUES (?, ?, ?, ?, ?, ?, ?)"
+    if overwrite:
+        # hits/last_used are the local usage of the entry; keep them
+        sql = ("INSERT " + sql + " ON CONFLICT(key) DO UPDATE SET translated=excluded.translated, pinned=excluded.pinned "
+               "WHERE translations.pinned=0 OR excluded.pinned=1")
+    else:
+        sql = "INSERT OR IGNORE " + sql
+    now = int(time.time())
+    stats = {"bundle": path, "entries": 0, "imported": 0, "skipped_filter": 0}
+    src_rows: List[tuple] = []
+    tr_rows: List[tuple] = []
+
+    def flush() -> None:
+        src_rows.sort(); tr_rows.sort()
+        conn.executemany("INSERT OR IGNORE INTO sources (sid, source) VALUES (?, ?)", src_rows)
+        before = conn.total_changes
+        conn.executemany(sql, tr_rows)
+        stats["imported"] += conn.total_changes - before
+        conn.commit()
+        src_rows.clear(); tr_rows.clear()
+
+    lines = _read_lines(path)
+    next(lines)  # header
+    for line in lines:
+        e = json.loads(line)
+        if e.get("end"):
+            break
+        stats["entries"] += 1
+        name, locale, source = e["n"], e["l"], e["s"]
+        if (locales and locale not in locales) or not _match(name, namespaces):
+            stats["skipped_filter"] += 1
+            continue
+        ns_id = ns_ids.get(name)
+        if ns_id is None:
+            conn.execute("INSERT OR IGNORE INTO namespaces (name, last_used) VALUES (?, ?)", (name, now))
+            ns_id = ns_ids[name] = conn.execute("SELECT ns_id FROM namespaces WHERE name=?", (name,)).fetchone()[0]
+        sid = source_digest(source)
+        src_rows.append((sid, source))
+        tr_rows.append((entry_key(name, locale, source), sid, ns_id, locale, e["t"], now, int(e.get("p", 0))))
+        if len(tr_rows) >= _IMPORT_BATCH:
+            flush()
+    flush()
+    stats["already_cached"] = stats["entries"] - stats["skipped_filter"] - stats["imported"]
+    return stats
@@ -0,0 +1,437 @@
+"""
+Shared translation cache: one TranslationCache file served over HTTP (TCP or a Unix socket),
+so pipeline runs on several build nodes read and fill the same warm cache.
+
+  python -m i18n_seed.cli cache serve --cache /srv/i18n/.llm_cache.sqlite --host 0.0.0.0 --port 8787
+  python -m i18n_seed.cli cache serve --cache .llm_cache.sqlite --socket /tmp/i18n-seed-cache.sock
+  GEMINI_API_KEY=... python -m i18n_seed.cli translate ... --cache-url http://cache-node:8787
+                                                        (or --cache-url unix:///tmp/i18n-seed-cache.sock)
+
+Endpoints (POST, JSON bodies):
+  /v1/get      {namespace, locale, sources}                   -> {hits: {source: translation}}
+  /v1/put      {namespace, rows: [[source, locale, translated]]} -> {written}
+  /v1/claim    {namespace, locale, sources, owner, lease, poll?} -> {hits, claimed, pending}
+  /v1/release  {owner, namespace?, locale?, sources?}         -> {released}
+  GET /v1/stats
+
+/v1/claim deduplicates misses across nodes: the first node asking for an uncached string gets
+it in `claimed` and is expected to put the translation back within `lease` seconds; nodes
+asking meanwhile get it in `pending` and wait for it instead of paying for it again. A put
+ends the claim; an expired claim goes to the next node that asks. Claims live in memory only.
+
+RemoteTranslationCache is the client; it has TranslationCache's interface, so the pipeline
+uses it unchanged (plus claim/release for the deduplication above).
+"""
+from __future__ import annotations
+
+import os
+import json
+import time
+import uuid
+import socket
+import logging
+import threading
+import http.client
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .cache import TranslationCache
+
+DEFAULT_LEASE = 600
+# bounds the size of one request (sources per get/claim, rows per put)
+_CHUNK = 2000
+_PURGE_EVERY = 60.0
+
+class CacheServer:
+    def __init__(self, path: str, logger: Optional[logging.Logger] = None, mem_entries: int = 100_000) -> None:
+        self.path = path
+        self.logger = logger or logging.getLogger("i18n-seed")
+        self.mem_entries = mem_entries
+        self._caches: Dict[str, TranslationCache] = {}
+        self._lock = threading.Lock()
+        # (namespace, locale, source) -> (owner, expires)
+        self._claims: Dict[Tuple[str, str, str], Tuple[str, float]] = {}
+        self._next_purge = time.time() + _PURGE_EVERY
+        self.stats = {"get_requests": 0, "put_requests": 0, "claim_requests": 0, "hits": 0, "misses": 0,
+                      "rows_written": 0, "claimed": 0, "deduplicated": 0, "expired_claims": 0}
+
+    def _cache(self, namespace: str) -> TranslationCache:
+        with self._lock:
+            cache = self._caches.get(namespace)
+            if cache is None:
+                cache = TranslationCache(self.path, namespace=namespace, logger=self.logger, mem_entries=self.mem_entries)
+                self._caches[namespace] = cache
+                self.logger.info(f"Cache server: opened namespace {namespace}")
+            return cache
+
+    def _count(self, **kw: int) -> None:
+        with self._lock:
+            for k, n in kw.items():
+                self.stats[k] += n
+
+    def get(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        sources = list(body.get("sources") or [])
+        hits = self._cache(body["namespace"]).get_many(sources, body["locale"])
+        self._count(get_requests=1, hits=len(hits), misses=len(set(sources)) - len(hits))
+        return {"hits": hits}
+
+    def put(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        ns = body["namespace"]
+        rows = [(r[0], r[1], r[2]) for r in body.get("rows") or []]
+        n = self._cache(ns).put_many(rows)
+        with self._lock:
+            for source, locale, _ in rows:
+                self._claims.pop((ns, locale, source), None)
+            self.stats["put_requests"] += 1
+            self.stats["rows_written"] += n
+        return {"written": n}
+
+    def claim(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        ns, locale, owner = body["namespace"], body["locale"], body["owner"]
+        lease = float(body.get("lease") or DEFAULT_LEASE)
+        sources = list(dict.fromkeys(body.get("sources") or []))
+        hits = self._cache(ns).get_many(sources, locale)
+        claimed, pending = [], []
+        now = time.time()
+        with self._lock:
+            if now >= self._next_purge:
+                self._purge(now)
+            for s in sources:
+                if s in hits:
+                    continue
+                cur = self._claims.get((ns, locale, s))
+                if cur is None or cur[0] == owner or cur[1] <= now:
+                    if cur is not None and cur[0] != owner:
+                        self.stats["expired_claims"] += 1
+                    self._claims[(ns, locale, s)] = (owner, now + lease)
+                    claimed.append(s)
+                else:
+                    pending.append(s)
+            self.stats["claim_requests"] += 1
+            self.stats["hits"] += len(hits)
+            self.stats["claimed"] += len(claimed)
+            # a poll re-asks for strings already counted as pending
+            if not body.get("poll"):
+                self.stats["misses"] += len(claimed) + len(pending)
+                self.stats["deduplicated"] += len(pending)
+        return {"hits": hits, "claimed": claimed, "pending": pending}
+
+    def release(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Drops claims of `owner` (all of them, or those of the given namespace/locale/sources)."""
+        owner, ns, locale = body["owner"], body.get("namespace"), body.get("locale")
+        only = set(body["sources"]) if body.get("sources") is not None else None
+        with self._lock:
+            keys = [k for k, (o, _) in self._claims.items()
+                    if o == owner and (ns is None or k[0] == ns) and (locale is None or k[1] == locale)
+                    and (only is None or k[2] in only)]
+            for k in keys:
+                del self._claims[k]
+        return {"released": len(keys)}
+
+    def _purge(self, now: float) -> None:
+        for k in [k for k, (_, exp) in self._claims.items() if exp <= now]:
+            del self._claims[k]
+        self._next_purge = now + _PURGE_EVERY
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            out: Dict[str, Any] = dict(self.stats)
+            out["open_claims"] = len(self._claims)
+            caches = dict(self._caches)
+        out["namespaces"] = {ns: c.report() for ns, c in caches.items()}
+        return out
+
+    def close(self) -> None:
+        with self._lock:
+            caches, self._caches = list(self._caches.values()), {}
+        for c in caches:
+            c.close()
+
+def _make_handler(server: CacheServer):
+    routes = {"/v1/get": server.get, "/v1/put": server.put, "/v1/claim": server.claim, "/v1/release": server.release}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, fmt, *args):  # keep stdout quiet; use the pipeline logger
+            server.logger.debug("cache server: " + fmt % args)
+
+        def _send(self, status: int, payload: Dict[str, Any]) -> None:
+            data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if urlsplit(self.path).path == "/v1/stats":
+                self._send(200, server.report())
+            else:
+                self._send(404, {"error": "not found"})
+
+        def do_POST(self):
+            n = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(n) if n else b""
+            route = routes.get(urlsplit(self.path).path)
+            if route is None:
+                self._send(404, {"error": "not found"})
+                return
+            try:
+                body = json.loads(raw.decode("utf-8") or "{}")
+            except Exception:
+                self._send(400, {"error": "invalid JSON"})
+                return
+            try:
+                self._send(200, route(body))
+            except KeyError as e:
+                self._send(400, {"error": f"missing field {e}"})
+            except Exception as e:
+                server.logger.error(f"Cache server failed: {e}")
+                self._send(500, {"error": str(e)})
+
+    return Handler
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        sock, _ = super().get_request()
+        # BaseHTTPRequestHandler expects an (host, port) client address
+        return sock, ("unix", 0)
+
+def _bind(server: CacheServer, host: str, port: int, socket_path: Optional[str]):
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        return _UnixHTTPServer(socket_path, _make_handler(server)), f"unix://{socket_path}"
+    httpd = ThreadingHTTPServer((host, port), _make_handler(server))
+    httpd.daemon_threads = True
+    bound_host, bound_port = httpd.server_address[:2]
+    return httpd, f"http://{bound_host}:{bound_port}"
+
+def start_cache_server(path: str, host: str = "127.0.0.1", port: int = 0, socket_path: Optional[str] = None,
+                       logger: Optional[logging.Logger] = None) -> Tuple[Any, CacheServer, str]:
+    """Starts the server on a daemon thread; returns (httpd, server, url)."""
+    server = CacheServer(path, logger)
+    httpd, url = _bind(server, host, port, socket_path)
+    threading.Thread(target=httpd.serve_forever, name="i18n-seed-cache-server", daemon=True).start()
+    return httpd, server, url
+
+def serve_cache(path: str, host: str = "127.0.0.1", port: int = 8787, socket_path: Optional[str] = None,
+                logger: Optional[logging.Logger] = None, mem_entries: int = 100_000) -> None:
+    logger = logger or logging.getLogger("i18n-seed")
+    server = CacheServer(path, logger, mem_entries=mem_entries)
+    httpd, url = _bind(server, host, port, socket_path)
+    logger.info(f"Translation cache {path} served on {url}")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
+        stats = server.report()
+        server.close()
+        logger.info(f"Cache server stats: {json.dumps({k: v for k, v in stats.items() if k != 'namespaces'})}")
+
+# ----------------- client -----------------
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: float) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+class RemoteTranslationCache:
+    """
+    TranslationCache interface backed by a cache server (http://host:port or unix:///path).
+
+    put() is buffered (sent every `put_batch` rows and on flush/get/close); put_many() is sent
+    at once. A server that is unreachable at start-up is an error; later failures are logged
+    and degrade to misses / unsaved rows, so a run never stops because the cache went away.
+    close() releases the claims this client still holds.
+    """
+
+    def __init__(self, url: str, namespace: str, logger: Optional[logging.Logger] = None, lease: int = DEFAULT_LEASE,
+                 timeout: float = 30.0, retries: int = 2, put_batch: int = 200) -> None:
+        self.url = url
+        self.namespace = namespace
+        self.logger = logger or logging.getLogger("i18n-seed")
+        self.lease = lease
+        self.timeout = timeout
+        self.retries = retries
+        self.put_batch = max(1, put_batch)
+        # unique per run, so a restarted node doesn't inherit (and never finish) old claims
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        parts = urlsplit(url)
+        if parts.scheme == "unix":
+            self._target: Tuple[str, Any] = ("unix", parts.path)
+        elif parts.scheme == "http":
+            self._target = ("http", (parts.hostname or "127.0.0.1", parts.port or 80))
+        else:
+            raise ValueError(f"Unsupported cache URL {url!r} (use http://host:port or unix:///path)")
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._buffer: Dict[Tuple[str, str], str] = {}
+        self.stats = {"requests": 0, "hits": 0, "misses": 0, "rows_written": 0, "claimed": 0, "pending": 0, "errors": 0}
+        self._call("GET", "/v1/stats")  # fail fast on a wrong URL / server not running
+
+    def _conn(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            kind, target = self._target
+            if kind == "unix":
+                conn = _UnixHTTPConnection(target, self.timeout)
+            else:
+                conn = http.client.HTTPConnection(target[0], target[1], timeout=self.timeout)
+            self._local.conn = conn
+        return conn
+
+    def _call(self, method: str, path: str, body: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8") if body is not None else None
+        for attempt in range(self.retries + 1):
+            conn = self._conn()
+            try:
+                conn.request(method, path, body=data, headers={"Content-Type": "application/json"})
+                resp = conn.getresponse()
+                raw = resp.read()
+                with self._lock:
+                    self.stats["requests"] += 1
+                if resp.status != 200:
+                    raise RuntimeError(f"HTTP {resp.status}: {raw[:200]!r}")
+                return json.loads(raw.decode("utf-8"))
+            except (OSError, http.client.HTTPException):
+                # stale keep-alive connection or server restart: reconnect and retry
+                conn.close()
+                self._local.conn = None
+                if attempt == self.retries:
+                    raise
+                time.sleep(0.5 * 2 ** attempt)
+        raise AssertionError("unreachable")
+
+    def _failed(self, what: str, e: Exception) -> None:
+        with self._lock:
+            self.stats["errors"] += 1
+        self.logger.warning(f"Cache server {self.url}: {what} failed: {e}")
+
+    def get(self, source: str, locale: str) -> Optional[str]:
+        return self.get_many((source,), locale).get(source)
+
+    def get_many(self, sources: Iterable[str], locale: str) -> Dict[str, str]:
+        out: Dict[str, str] = {}
+        ask = []
+        with self._lock:
+            for s in dict.fromkeys(sources):
+                t = self._buffer.get((locale, s))
+                if t is None:
+                    ask.append(s)
+                else:
+                    out[s] = t
+        found: Dict[str, str] = {}
+        for k in range(0, len(ask), _CHUNK):
+            try:
+                res = self._call("POST", "/v1/get", {"namespace": self.namespace, "locale": locale, "sources": ask[k:k + _CHUNK]})
+            except Exception as e:
+                self._failed("get", e)
+                continue
+            found.update(res.get("hits") or {})
+        with self._lock:
+            self.stats["hits"] += len(out) + len(found)
+            self.stats["misses"] += len(ask) - len(found)
+        out.update(found)
+        return out
+
+    def claim(self, sources: List[str], locale: str, poll: bool = False) -> Tuple[Dict[str, str], List[str], List[str]]:
+        """
+        (hits, claimed, pending) for `sources`: claimed misses are this run's to translate,
+        pending ones are being translated by another node (poll=True when asking again for
+        those). Without a server, all misses are claimed.
+        """
+        self.flush()
+        hits: Dict[str, str] = {}
+        claimed: List[str] = []
+        pending: List[str] = []
+        for k in range(0, len(sources), _CHUNK):
+            chunk = sources[k:k + _CHUNK]
+            try:
+                res = self._call("POST", "/v1/claim", {"namespace": self.namespace, "locale": locale, "sources": chunk,
+                                                       "owner": self.owner, "lease": self.lease, "poll": poll})
+            except Exception as e:
+                self._failed("claim", e)
+                claimed.extend(chunk)
+                continue
+            hits.update(res.get("hits") or {})
+            claimed.extend(res.get("claimed") or [])
+            pending.extend(res.get("pending") or [])
+        with self._lock:
+            self.stats["hits"] += len(hits)
+            self.stats["claimed"] += len(claimed)
+            if not poll:
+                self.stats["misses"] += len(claimed) + len(pending)
+                self.stats["pending"] += len(pending)
+        return hits, claimed, pending
+
+    def release(self, sources: Optional[List[str]] = None, locale: Optional[str] = None) -> None:
+        """Drops this client's claims: all of them, or those on `sources` for `locale`."""
+        if sources is None:
+            bodies = [{"owner": self.owner}]
+        else:
+            bodies = [{"owner": self.owner, "namespace": self.namespace, "locale": locale, "sources": sources[k:k + _CHUNK]}
+                      for k in range(0, len(sources), _CHUNK)]
+        for body in bodies:
+            try:
+                self._call("POST", "/v1/release", body)
+            except Exception as e:
+                self._failed("release", e)
+                return
+
+    def put(self, source: str, locale: str, translated: str) -> None:
+        with self._lock:
+            self._buffer[(locale, source)] = translated
+            full = len(self._buffer) >= self.put_batch
+        if full:
+            self.flush()
+
+    def put_many(self, rows: Iterable[Tuple[str, str, str]]) -> int:
+        rows = list(rows)
+        if rows:
+            with self._lock:
+                for source, locale, translated in rows:
+                    self._buffer[(locale, source)] = translated
+            self.flush()
+        return len(rows)
+
+    def flush(self) -> None:
+        with self._lock:
+            rows = [[s, loc, t] for (loc, s), t in self._buffer.items()]
+            self._buffer = {}
+        for k in range(0, len(rows), _CHUNK):
+            try:
+                res = self._call("POST", "/v1/put", {"namespace": self.namespace, "rows": rows[k:k + _CHUNK]})
+            except Exception as e:
+                self._failed(f"put of {len(rows[k:k + _CHUNK])} row(s)", e)
+                continue
+            with self._lock:
+                self.stats["rows_written"] += int(res.get("written") or 0)
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            out: Dict[str, Any] = dict(self.stats)
+        out["server"] = self.url
+        return out
+
+    def close(self) -> None:
+        self.flush()
+        self.release()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
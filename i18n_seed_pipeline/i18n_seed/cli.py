@@ -408,28 +408,33 @@
 
 # i18n_seed/cli.py
 from __future__ import annotations
-import argparse, os, json, re
-from collections import defaultdict
-from typing import Dict, List, Tuple, Optional
+import argparse, os, json, re, time
+from collections import Counter, defaultdict
+from typing import Dict, List, Set, Tuple, Optional
 
 from .logger import setup_logger
 from .config import TranslateConfig, SchemaHints
 from .schema_loader import SchemaLoader
 from .sql_extractor import SqlExtractor
-from .placeholder_lock import lock_placeholders, unlock_placeholders
-from .translator_gemini import GeminiTranslator
+from .placeholder_lock import PlaceholderLocker, PlaceholderUnlocker, unlock_placeholders
+from .translator_gemini import GeminiTranslator, GEMINI_API_BASE, gemini_cache_namespace
+from .gemini_stub import StubConfig, serve
 from .translator_base import Translator
-from .cache import TranslationCache
+from .cache import (TranslationCache, open_for_maintenance, cache_stats, evict_entries, prune_namespaces,
+                    vacuum_cache, pin_translations)
+from .cache_server import RemoteTranslationCache, serve_cache
+from .cache_bundle import export_bundle, import_bundle
+from .ingest import align_localized
 from .validators import check_placeholder_parity, check_length_ratio, check_glossary_consistency, ValidationIssue
 from .reinjector import SqlReinjector
 from .cost_tracker import CostTracker
 from .utils import sql_escape_single_quotes
+from .batching import plan_batches
+from .templates import cluster_templates, fill_template
+from .segmenter import split_segments, join_segments
+from .prefilter import plan_prefilter, ProfileDictionary
 
-# optional profiles import for --domain override
-try:
-    from .profiles import ALL_PROFILES
-except Exception:
-    ALL_PROFILES = []
+from .profiles import get_profile
 
 # default columns for the enforcement pass
 DEFAULT_TITLE_COLUMNS = {"title", "item_name"}
@@ -454,14 +459,17 @@ def unique_preserve_order(seq: List[str]) -> List[str]:
             seen.add(s); out.append(s)
     return out
 
-def configure_translator(cfg: TranslateConfig, logger, domain_rules: str = "") -> Translator:
+def _rules_text(domain_rules) -> str:
+    # profile system_rules are a string or a list of rule lines
+    if isinstance(domain_rules, list):
+        return "".join(r + "\n" for r in domain_rules)
+    if isinstance(domain_rules, str) and domain_rules:
+        return domain_rules + ("\n" if not domain_rules.endswith("\n") else "")
+    return ""
+
+def configure_translator(cfg: TranslateConfig, logger, domain_rules: str = "", on_item=None, on_usage=None) -> Translator:
     if cfg.llm_provider.lower() == "gemini":
-        rules_text = ""
-        if domain_rules:
-            if isinstance(domain_rules, list):
-                rules_text = "".join(r + "\n" for r in domain_rules)
-            elif isinstance(domain_rules, str):
-                rules_text = domain_rules + ("\n" if not domain_rules.endswith("\n") else "")
+        rules_text = _rules_text(domain_rules)
         return GeminiTranslator(
             cfg.llm_model,
             qps=cfg.qps,
@@ -469,6 +477,17 @@ def configure_translator(cfg: TranslateConfig, logger, domain_rules: str = "") -
             backoff_base=cfg.backoff_base,
             logger=logger,
             domain_rules=rules_text,
+            heal_workers=cfg.heal_workers,
+            heal_batch_items=cfg.heal_batch_items,
+            heal_rounds=cfg.heal_rounds,
+            stream=cfg.stream,
+            on_item=on_item,
+            api_base=cfg.llm_endpoint,
+            response_schema=cfg.response_schema,
+            on_usage=on_usage,
+            context_cache=cfg.context_cache,
+            context_cache_ttl=cfg.context_cache_ttl,
+            context_cache_min_tokens=cfg.context_cache_min_tokens,
         )
     raise RuntimeError(f"Unsupported provider {cfg.llm_provider}")
 
@@ -479,6 +498,22 @@ def _parse_table_from_occ(occ: str) -> str:
     # take the first segment as table
     return (occ.split(":", 1)[0] or "").strip()
 
+def _usage_recorder(cost: CostTracker, src_columns: Dict[str, List[str]]):
+    """
+    on_usage callback for the translator: a response's tokens go to its locale and are split
+    across "table.column" by the length of each source string in the request.
+    """
+    def record(locale: str, sources: List[str], prompt_tokens: float, completion_tokens: float) -> None:
+        weights: Dict[str, float] = defaultdict(float)
+        total = sum(max(1, len(s)) for s in sources) or 1
+        for s in sources:
+            cols = src_columns.get(s) or ["?"]
+            share = max(1, len(s)) / total / len(cols)
+            for c in cols:
+                weights[c] += share
+        cost.add_tokens(prompt_tokens, completion_tokens, locale=locale, weights=weights)
+    return record
+
 def _force_translate_titles_and_item_names(
     *,
     locale: str,
@@ -489,6 +524,7 @@ def _force_translate_titles_and_item_names(
     occ_to_col: Dict[str, str],
     translated_accum: Dict[str, str],
     cost: CostTracker,
+    cache: TranslationCache,
     dump_json_path: str,
     enforce_enabled: bool,
     only_cols: Optional[List[str]] = None,
@@ -496,6 +532,7 @@ def _force_translate_titles_and_item_names(
     occkey_regex: Optional[str] = None,
     max_occurrences: Optional[int] = None,
     extra_prompt_path: Optional[str] = None,
+    on_usage=None,
 ) -> int:
     """
     Reload translations_{locale}.json, find entries whose column matches and target == source_en,
@@ -594,17 +631,21 @@ def _force_translate_titles_and_item_names(
         + user_extra
     )
 
-    strict_translator = configure_translator(cfg, logger, domain_rules=(base_domain_rules or "") + extra_rules)
+    strict_translator = configure_translator(
+        cfg, logger, domain_rules=(base_domain_rules or "") + extra_rules, on_usage=on_usage,
+    )
 
     # Call translator in character-batched chunks (override cache by re-putting results)
-    pos = 0
     forced_results: Dict[str, str] = {}
-    while pos < len(locked_unique):
-        cur, cur_chars = [], 0
-        while pos < len(locked_unique) and (cur_chars + len(locked_unique[pos])) <= cfg.batch_chars:
-            cur.append(locked_unique[pos]); cur_chars += len(locked_unique[pos]); pos += 1
-        if not cur:
-            cur = [locked_unique[pos]]; pos += 1
+    plan = plan_batches(locked_unique, cfg.batch_chars)
+    logger.info(f"Title enforcement batch plan: {plan.describe()}")
+    done = 0
+    for cur in plan:
+        if cost.over_budget(cfg.max_tokens, cfg.max_usd):
+            logger.warning(f"Title enforcement: budget reached, {len(locked_unique) - done} source(s) not re-asked.")
+            break
+        done += len(cur)
+        cur_chars = sum(len(s) for s in cur)
 
         prompt_est = cur_chars + 200
         out = strict_translator.translate_batch(cur, locale)
@@ -612,13 +653,13 @@ def _force_translate_titles_and_item_names(
         cost.add(prompt_est, comp_est)
 
         # update cache immediately so next runs keep the enforced results
-        cache = TranslationCache(cfg.cache_path)
-        for src, tgt in zip(cur, out):
-            forced_results[src] = tgt
-            try:
-                cache.put(src, locale, tgt)
-            except Exception:
-                pass
+        forced_results.update(zip(cur, out))
+        try:
+            cache.put_many((src, locale, tgt) for src, tgt in zip(cur, out))
+        except Exception as e:
+            logger.warning(f"Title enforcement: cache write failed: {e}")
+    if hasattr(strict_translator, "close"):
+        strict_translator.close()
 
     # Apply forced results into translated_accum and into the dump entries
     fixed_count = 0
@@ -649,6 +690,270 @@ def _force_translate_titles_and_item_names(
 
     return fixed_count
 
+# --------- multi-locale fan-out (prefills the cache) ---------
+
+def _multi_locale_prefill(
+    *,
+    cfg: TranslateConfig,
+    logger,
+    translator: Translator,
+    cache: TranslationCache,
+    cost: CostTracker,
+    unique_sources: List[str],
+    dictionary_targets: Optional[Dict[str, Dict[str, str]]] = None,
+) -> int:
+    """
+    Translate cache misses for groups of cfg.multi_locale_group locales with one request per
+    batch and split the answers into the per-locale cache entries. Whatever the model drops
+    is simply left uncached, so the regular per-locale loop picks it up as a fallback.
+    Sources in `dictionary_targets[locale]` (the prefilter's profile dictionary) count as done
+    for that locale. Stops early when the token/USD budget is reached.
+
+    Returns the number of (source, locale) pairs written to the cache.
+    """
+    size = cfg.multi_locale_group
+    groups = [cfg.locales[i:i + size] for i in range(0, len(cfg.locales), size)]
+    written = 0
+    for group in groups:
+        if len(group) < 2:
+            continue
+        have = {loc: cache.get_many(unique_sources, loc) for loc in group}
+        for loc in group:
+            have[loc].update((dictionary_targets or {}).get(loc, {}))
+        todo = [s for s in unique_sources if any(s not in have[loc] for loc in group)]
+        if not todo:
+            continue
+        logger.info(f"Multi-locale fan-out {'+'.join(group)}: {len(todo)} source string(s)")
+        # the answer carries one translation per locale, so keep the output size comparable
+        batch_chars = max(1, cfg.batch_chars // len(group))
+        dropped = 0
+
+        plan = plan_batches(todo, batch_chars)
+        logger.info(f"Multi-locale fan-out {'+'.join(group)} batch plan: {plan.describe()}")
+        for cur in plan:
+            if cost.over_budget(cfg.max_tokens, cfg.max_usd):
+                logger.warning(f"Multi-locale fan-out {'+'.join(group)}: budget reached, stopping.")
+                return written
+            cur_chars = sum(len(s) for s in cur)
+
+            prompt_est = cur_chars + 200
+            res = translator.translate_batch_multi(cur, group)
+            comp_est = sum(len(t) for outs in res.values() for t in outs if t is not None)
+            cost.add(prompt_est, comp_est)
+
+            rows = []
+            for loc in group:
+                for src, tgt in zip(cur, res.get(loc) or []):
+                    if tgt is None:
+                        dropped += 1
+                    elif src not in have[loc]:
+                        rows.append((src, loc, tgt))
+            written += cache.put_many(rows)
+
+        if dropped:
+            logger.info(f"Multi-locale fan-out {'+'.join(group)}: {dropped} translation(s) fall back to per-locale requests")
+    return written
+
+def _template_prepass(
+    *,
+    locale: str,
+    cfg: TranslateConfig,
+    logger,
+    translator: Translator,
+    cache: TranslationCache,
+    cost: CostTracker,
+    sources: List[str],
+    translated_accum: Dict[str, str],
+    src_columns: Dict[str, List[str]],
+) -> Tuple[List[str], Dict[str, int]]:
+    """
+    Template-level dedupe: strings that only differ by numbers / model codes are translated
+    once as a template and rebuilt locally. Templates are cached like any other source.
+    A template whose translation lost or duplicated a slot sends its members back to the
+    individual translation.
+
+    Returns the sources still to translate (input order) and counters for the run report.
+    """
+    tp = cluster_templates(sources)
+    if not tp.clusters:
+        return sources, {}
+    logger.info(f"Template dedupe {locale}: {tp.describe()}")
+
+    tpl_out: Dict[str, str] = cache.get_many(tp.clusters, locale)
+    todo = []
+    for tpl, members in tp.clusters.items():
+        if tpl not in tpl_out:
+            todo.append(tpl)
+            src_columns.setdefault(tpl, unique_preserve_order([c for s, _ in members for c in src_columns.get(s, [])]))
+
+    # templates_translated / template_batches count what was sent; translator_stats.requests
+    # has the LLM requests (retries and heal sub-requests included)
+    stats = {"templates": len(tp.clusters), "templates_translated": 0, "template_batches": 0, "filled": 0, "fallbacks": 0}
+    for cur in plan_batches(todo, cfg.batch_chars):
+        if cost.over_budget(cfg.max_tokens, cfg.max_usd):
+            break
+        out = translator.translate_batch(cur, locale)
+        cost.add(sum(len(s) for s in cur) + 200, sum(len(x) for x in out))
+        tpl_out.update(zip(cur, out))
+        stats["templates_translated"] += len(cur)
+        stats["template_batches"] += 1
+
+    rows = []
+    for tpl, members in tp.clusters.items():
+        tgt = tpl_out.get(tpl)
+        if tgt is None:
+            continue
+        filled = [fill_template(tgt, slots) for _, slots in members]
+        if any(f is None for f in filled):
+            stats["fallbacks"] += len(members)
+            continue
+        rows.append((tpl, locale, tgt))
+        for (src, _), f in zip(members, filled):
+            rows.append((src, locale, f))
+            translated_accum[src] = f
+        stats["filled"] += len(members)
+    cache.put_many(rows)
+    if stats["fallbacks"]:
+        logger.info(f"Template dedupe {locale}: {stats['fallbacks']} string(s) fall back to individual translation")
+    return [s for s in sources if s not in translated_accum], stats
+
+def _segment_sources(
+    *,
+    locale: str,
+    cache: TranslationCache,
+    sources: List[str],
+    segmentable: set,
+    src_columns: Dict[str, List[str]],
+) -> Tuple[List[str], Dict[str, List[Tuple[str, str]]], Dict[str, str], Dict[str, int]]:
+    """
+    Sentence-level translation memory: multi-sentence sources of the segmented columns are
+    replaced by their sentences, each looked up in the cache on its own.
+
+    Returns the units to translate (other sources + uncached sentences, deduped, input
+    order), the split of each segmented source, the cached sentence translations and
+    counters for the run report.
+    """
+    units: List[str] = []
+    parts_by_src: Dict[str, List[Tuple[str, str]]] = {}
+    for s in sources:
+        parts = split_segments(s) if s in segmentable else []
+        if len(parts) < 2:
+            units.append(s)
+        else:
+            parts_by_src[s] = parts
+    seg_cached = cache.get_many((seg for p in parts_by_src.values() for seg, _ in p), locale)
+    for s, parts in parts_by_src.items():
+        for seg, _ in parts:
+            if seg not in seg_cached:
+                units.append(seg)
+                src_columns.setdefault(seg, src_columns.get(s, []))
+    units = unique_preserve_order(units)
+    n_segments = sum(len(p) for p in parts_by_src.values())
+    stats = {
+        "sources": len(parts_by_src), "segments": n_segments,
+        "unique_segments": len({seg for p in parts_by_src.values() for seg, _ in p}),
+        "segment_cache_hits": len(seg_cached),
+    }
+    return units, parts_by_src, seg_cached, stats
+
+def _low_cardinality_fields(stats: Dict[str, Counter], max_distinct: int, min_repeat: float = 3.0,
+                            max_len: int = 64) -> Dict[str, int]:
+    """
+    Fields (ExtractedItem.field_key) with at most max_distinct short values, each repeated
+    min_repeat times on average: statuses, types, conditions, categories. -> distinct count.
+    """
+    out: Dict[str, int] = {}
+    for key, counter in stats.items():
+        distinct, total = len(counter), sum(counter.values())
+        if 1 < distinct <= max_distinct and total >= min_repeat * distinct and all(len(v) <= max_len for v in counter):
+            out[key] = distinct
+    return out
+
+def _enum_dictionary_pass(
+    *,
+    locale: str,
+    cfg: TranslateConfig,
+    logger,
+    translator: Translator,
+    cache: TranslationCache,
+    cost: CostTracker,
+    values: List[str],
+    enum_field_of: Dict[str, List[str]],
+    translated_accum: Dict[str, str],
+) -> Tuple[List[str], Dict[str, int]]:
+    """
+    Translate the uncached values of low-cardinality fields with the compact enum prompt
+    (one request per locale unless the dictionary exceeds a batch), with every field a value
+    occurs in as context. `cache` is the enum namespace. Values the model drops are returned
+    so they go through the regular batches.
+    """
+    missing: List[str] = []
+    requests = 0
+    for cur in plan_batches(values, cfg.batch_chars):
+        if cost.over_budget(cfg.max_tokens, cfg.max_usd):
+            missing.extend(cur)
+            continue
+        fields = [", ".join(enum_field_of[s]) for s in cur]
+        out = translator.translate_enum(cur, fields, locale)
+        requests += 1
+        cost.add(sum(len(s) + len(f) for s, f in zip(cur, fields)) + 200, sum(len(t) for t in out if t is not None))
+        rows = []
+        for src, tgt in zip(cur, out):
+            if tgt is None:
+                missing.append(src)
+                continue
+            rows.append((src, locale, tgt))
+            translated_accum[src] = tgt
+        cache.put_many(rows)
+    logger.info(f"Enum dictionary {locale}: {len(values) - len(missing)} of {len(values)} value(s) in {requests} request(s)")
+    return missing, {"values": len(values), "requests": requests, "fallbacks": len(missing)}
+
+def _open_cache(cfg: TranslateConfig, namespace: str, logger):
+    if cfg.cache_url:
+        return RemoteTranslationCache(cfg.cache_url, namespace=namespace, logger=logger, lease=cfg.cache_lease)
+    return TranslationCache(cfg.cache_path, namespace=namespace, logger=logger,
+                            mem_entries=cfg.cache_mem_entries, mem_bytes=cfg.cache_mem_mb * 2**20)
+
+# --------- shared cache: wait for strings other nodes are translating ---------
+def _await_peer_translations(
+    *,
+    locale: str,
+    cfg: TranslateConfig,
+    logger,
+    translator: Translator,
+    cache: RemoteTranslationCache,
+    cost: CostTracker,
+    pending: List[str],
+    translated_accum: Dict[str, str],
+    poll_seconds: float = 1.0,
+) -> Tuple[Dict[str, int], List[str]]:
+    """
+    Polls the cache server for `pending` strings (claimed by another node when this run asked).
+    Strings whose claim expires without a result are claimed and translated here.
+    Returns the stats and the strings left untranslated when the budget runs out; the claims
+    this run took on those are released.
+    """
+    stats = {"waited": len(pending), "from_peers": 0, "reclaimed": 0}
+    logger.info(f"Shared cache {locale}: waiting for {len(pending)} string(s) another node is translating")
+    while pending:
+        time.sleep(poll_seconds)
+        hits, claimed, pending = cache.claim(pending, locale, poll=True)
+        translated_accum.update(hits)
+        stats["from_peers"] += len(hits)
+        done = set()
+        for cur in plan_batches(claimed, cfg.batch_chars):
+            if cost.over_budget(cfg.max_tokens, cfg.max_usd):
+                abandoned = [s for s in claimed if s not in done]
+                cache.release(abandoned, locale)
+                return stats, abandoned + pending
+            out = translator.translate_batch(cur, locale)
+            cost.add(sum(len(s) for s in cur) + 200, sum(len(x) for x in out))
+            cache.put_many((src, locale, tgt) for src, tgt in zip(cur, out))
+            translated_accum.update(zip(cur, out))
+            done.update(cur)
+            stats["reclaimed"] += len(cur)
+    return stats, []
+
 # ----------------- main pipeline -----------------
 
 def translate(
@@ -668,8 +973,8 @@ def translate(
 
     # profile auto-detected by loader; allow a manual override
     profile = loader.profile_from_schema()
-    if domain_override and domain_override != "auto" and ALL_PROFILES:
-        forced = next((p for p in ALL_PROFILES if p.id == domain_override), None)
+    if domain_override and domain_override != "auto":
+        forced = get_profile(domain_override)
         if forced:
             loader.profile = forced
             profile = forced
@@ -690,26 +995,52 @@ def translate(
     items = extractor.extract(sql_text)
     logger.info(f"Extracted items: {len(items)}")
 
+    # low-cardinality fields: their distinct values are translated as one dictionary per locale
+    enum_fields = _low_cardinality_fields(extractor.column_stats(items), cfg.enum_max_distinct) if cfg.enum_max_distinct else {}
+    enum_field_of: Dict[str, List[str]] = defaultdict(list)  # locked value -> its low-cardinality fields
+    if enum_fields:
+        logger.info(f"Low-cardinality fields: {len(enum_fields)} ({sum(enum_fields.values())} distinct values)")
+
     logger.info("Locking placeholders and building manifest...")
+    # occurrences of equal values share one (locked, mapping) pair
+    locker = PlaceholderLocker(profile.placeholder_patterns)
     locked_map: Dict[str, Tuple[str, Dict[str, str]]] = {}
     occurrences_by_src: Dict[str, List[str]] = defaultdict(list)
     manifest = []
     occ_to_source: Dict[str, str] = {}
     occ_to_col: Dict[str, str] = {}
+    src_columns: Dict[str, List[str]] = defaultdict(list)  # locked source -> "table.column" (token attribution)
+    segmentable = set()  # locked sources of --segment-columns
+    col_values: Dict[str, List[str]] = defaultdict(list)  # "table.column" -> locked value per occurrence
 
     for it in items:
-        locked, mapping = lock_placeholders(it.value, extra_patterns=profile.placeholder_patterns)
+        pair = locker.lock(it.value)
+        locked = pair[0]
         occ = it.occurrence_key()
-        locked_map[occ] = (locked, mapping)
+        locked_map[occ] = pair
         occurrences_by_src[locked].append(occ)
         manifest.append({"occurrence": occ, "source": it.value, "locked": locked, "column": it.column})
         occ_to_source[occ] = it.value
         occ_to_col[occ] = it.column
+        tc = f"{it.table}.{it.column}"
+        if cfg.segment_columns and it.column in cfg.segment_columns:
+            segmentable.add(locked)
+        col_values[tc].append(locked)
+        if enum_fields and it.field_key() in enum_fields and it.field_key() not in enum_field_of[locked]:
+            enum_field_of[locked].append(it.field_key())
+        if tc not in src_columns[locked]:
+            src_columns[locked].append(tc)
 
     unique_sources = unique_preserve_order([m["locked"] for m in manifest])
-    logger.info(f"Unique source strings: {len(unique_sources)}")
+    logger.info(f"Unique source strings: {len(unique_sources)} "
+                f"(placeholders locked once per distinct value: {locker.misses} locked, {locker.hits} reused)")
+
+    # codes, identifiers, URLs, NULLs... never reach the model; enum values the profile maps go by dictionary
+    prefilter = plan_prefilter(unique_sources, src_columns, col_values) if cfg.prefilter else None
+    if prefilter:
+        pf = prefilter.report()
+        logger.info(f"Prefilter: {pf['pass_strings']} pass-through string(s) ({pf['pass_chars']} chars) {pf['by_reason']}")
 
-    cache = TranslationCache(cfg.cache_path)
     glossary = None
     if cfg.glossary_path and os.path.exists(cfg.glossary_path):
         try:
@@ -720,55 +1051,190 @@ def translate(
         except Exception as e:
             logger.warning(f"Failed to load glossary: {e}")
 
-    cost = CostTracker(cfg.cost_per_million)
+    cost = CostTracker(
+        cfg.cost_per_million,
+        input_usd_per_million=cfg.input_usd_per_million,
+        output_usd_per_million=cfg.output_usd_per_million,
+    )
+    on_usage = _usage_recorder(cost, src_columns)
     os.makedirs(cfg.output_dir, exist_ok=True)
 
     save_text(os.path.join(cfg.output_dir, "translation_manifest.json"), json.dumps(manifest, ensure_ascii=False, indent=2))
 
     # Translator with domain rules
-    translator = configure_translator(cfg, logger, domain_rules=profile.system_rules)
+    translator = configure_translator(cfg, logger, domain_rules=profile.system_rules, on_usage=on_usage)
+    # cache entries are namespaced by model + prompt/rules version unless --cache-namespace pins one
+    namespace = cfg.cache_namespace or translator.cache_namespace
+    cache = _open_cache(cfg, namespace, logger)
+    logger.info(f"Translation cache: {cfg.cache_url or cfg.cache_path} (namespace {namespace})")
+    # enum dictionary output comes from its own prompt, so it is cached apart from general batches
+    enum_cache = None
+    if enum_field_of:
+        enum_namespace = f"{cfg.cache_namespace}:enum" if cfg.cache_namespace else translator.enum_cache_namespace
+        enum_cache = _open_cache(cfg, enum_namespace, logger)
+        logger.info(f"Enum dictionary cache namespace: {enum_namespace}")
+    if cfg.stream:
+        # items go to the cache as they arrive
+        translator.on_item = cache.put
 
     report = {"locales": {}, "total_items": len(items)}
+    if prefilter:
+        report["prefilter"] = prefilter.report()
+    if enum_fields:
+        report["enum_fields"] = dict(sorted(enum_fields.items()))
+    budget_exhausted = False
+
+    model_sources = [s for s in unique_sources if not (prefilter and s in prefilter.passthrough)]
+    # enum values are looked up in (and translated into) the enum namespace
+    enum_sources = [s for s in model_sources if s in enum_field_of]
+    model_sources = [s for s in model_sources if s not in enum_field_of]
+    # locale -> source -> target, for the sources the profile dictionary translates
+    dictionary_targets: Dict[str, Dict[str, str]] = {}
+    if prefilter:
+        for locale in cfg.locales:
+            dictionary = ProfileDictionary(profile.json_overrides_by_locale.get(locale, []))
+            targets = dictionary_targets[locale] = {}
+            for s in model_sources + enum_sources:
+                tgt = dictionary.translate(s, src_columns.get(s))
+                if tgt is not None:
+                    targets[s] = tgt
+    if not cfg.dry_run and cfg.multi_locale_group > 1 and len(cfg.locales) > 1:
+        prefilled = _multi_locale_prefill(
+            cfg=cfg, logger=logger, translator=translator, cache=cache, cost=cost, unique_sources=model_sources,
+            dictionary_targets=dictionary_targets,
+        )
+        report["multi_locale_prefilled"] = prefilled
 
     for locale in cfg.locales:
         logger.info(f"=== Locale {locale} ===")
         # Translate unique sources (cache-aware)
+        pending = 0
+        tpl_stats: Dict[str, int] = {}
+        seg_stats: Dict[str, int] = {}
+        dict_hits, dict_chars = 0, 0
+        enum_stats: Dict[str, int] = {}
+        peer_stats: Dict[str, int] = {}
         if cfg.dry_run:
             translated_accum = {s: s for s in unique_sources}
         else:
-            batch_in, translated_accum = [], {}
+            batch_in, enum_in, translated_accum = [], [], {}
+            dict_targets = dictionary_targets.get(locale, {})
+            cached_all = cache.get_many([s for s in model_sources if s not in dict_targets], locale)
+            if enum_cache is not None:
+                cached_all.update(enum_cache.get_many([s for s in enum_sources if s not in dict_targets], locale))
             for s in unique_sources:
-                cached = cache.get(s, locale)
+                if prefilter:
+                    tgt = dict_targets.get(s)
+                    if tgt is not None:
+                        translated_accum[s] = tgt
+                        dict_hits += 1; dict_chars += len(s)
+                        continue
+                    if s in prefilter.passthrough:
+                        translated_accum[s] = s
+                        continue
+                cached = cached_all.get(s)
                 if cached is None:
-                    batch_in.append(s)
+                    (enum_in if s in enum_field_of else batch_in).append(s)
                 else:
                     translated_accum[s] = cached
 
-            pos = 0
-            while pos < len(batch_in):
-                cur, cur_chars = [], 0
-                while pos < len(batch_in) and (cur_chars + len(batch_in[pos])) <= cfg.batch_chars:
-                    cur.append(batch_in[pos]); cur_chars += len(batch_in[pos]); pos += 1
-                if not cur:
-                    cur = [batch_in[pos]]; pos += 1
+            if enum_in:
+                # values the enum prompt dropped in an earlier run were cached by the regular batches
+                general = cache.get_many(enum_in, locale)
+                translated_accum.update(general)
+                enum_in = [s for s in enum_in if s not in general]
+            if enum_in:
+                missing, enum_stats = _enum_dictionary_pass(
+                    locale=locale, cfg=cfg, logger=logger, translator=translator, cache=enum_cache, cost=cost,
+                    values=enum_in, enum_field_of=enum_field_of, translated_accum=translated_accum,
+                )
+                # dropped values go through the regular batches (and their namespace)
+                batch_in = missing + batch_in
+
+            seg_parts: Dict[str, List[Tuple[str, str]]] = {}
+            if segmentable and batch_in:
+                batch_in, seg_parts, seg_out, seg_stats = _segment_sources(
+                    locale=locale, cache=cache, sources=batch_in, segmentable=segmentable, src_columns=src_columns,
+                )
+                translated_accum.update(seg_out)
+
+            if cfg.template_dedupe and batch_in:
+                batch_in, tpl_stats = _template_prepass(
+                    locale=locale, cfg=cfg, logger=logger, translator=translator, cache=cache, cost=cost,
+                    sources=batch_in, translated_accum=translated_accum, src_columns=src_columns,
+                )
+
+            peer_pending: List[str] = []
+            if cfg.cache_url and batch_in:
+                # strings another node is already translating are waited for after our own batches
+                hits, batch_in, peer_pending = cache.claim(batch_in, locale)
+                translated_accum.update(hits)
+
+            plan = plan_batches(batch_in, cfg.batch_chars)
+            if batch_in:
+                logger.info(f"Batch plan {locale}: {plan.describe()}")
+            done: Set[str] = set()
+            for cur in plan:
+                if cost.over_budget(cfg.max_tokens, cfg.max_usd):
+                    budget_exhausted = True
+                    if cfg.cache_url:
+                        # let other nodes take over what this run claimed but won't translate
+                        cache.release([s for s in batch_in if s not in done], locale)
+                    pending = len(batch_in) - len(done) + len(peer_pending)
+                    logger.warning(f"Budget reached: {pending} string(s) left untranslated for {locale}; re-run to resume from the cache.")
+                    break
+                done.update(cur)
+                cur_chars = sum(len(s) for s in cur)
 
                 prompt_est = cur_chars + 200
                 out = translator.translate_batch(cur, locale)
                 comp_est = sum(len(x) for x in out)
                 cost.add(prompt_est, comp_est)
 
-                for src, tgt in zip(cur, out):
-                    cache.put(src, locale, tgt)
-                    translated_accum[src] = tgt
+                cache.put_many((src, locale, tgt) for src, tgt in zip(cur, out))
+                translated_accum.update(zip(cur, out))
+
+            if peer_pending and not budget_exhausted:
+                peer_stats, unfinished = _await_peer_translations(
+                    locale=locale, cfg=cfg, logger=logger, translator=translator, cache=cache, cost=cost,
+                    pending=peer_pending, translated_accum=translated_accum,
+                )
+                if unfinished:
+                    budget_exhausted = True
+                    pending = len(unfinished)
+                    logger.warning(f"Budget reached: {pending} string(s) left untranslated for {locale}; re-run to resume from the cache.")
+
+            if seg_parts:
+                # reassemble segmented sources; sentences that are not sources themselves are dropped again
+                segments = {seg for parts in seg_parts.values() for seg, _ in parts}
+                rows = []
+                for src, parts in seg_parts.items():
+                    whole = join_segments(parts, translated_accum)
+                    if whole is not None:
+                        rows.append((src, locale, whole))
+                        translated_accum[src] = whole
+                cache.put_many(rows)
+                for seg in segments - set(occurrences_by_src):
+                    translated_accum.pop(seg, None)
+
+            if enum_field_of:
+                enum_dict: Dict[str, Dict[str, str]] = defaultdict(dict)
+                for src, field_keys in enum_field_of.items():
+                    if src in translated_accum:
+                        for field_key in field_keys:
+                            enum_dict[field_key][src] = translated_accum[src]
+                save_text(os.path.join(cfg.output_dir, f"enum_dictionary_{locale}.json"),
+                          json.dumps(dict(sorted(enum_dict.items())), ensure_ascii=False, indent=2))
 
         # Bilingual dump (UNLOCKED)
         dump_json_path = os.path.join(cfg.output_dir, f"translations_{locale}.json")
         dump = []
+        unlocker = PlaceholderUnlocker()  # equal values share their mapping: unlocked once per locale
         for it in items:
             occ = it.occurrence_key()
             locked_src, mapping = locked_map[occ]
             tgt_locked = translated_accum.get(locked_src, locked_src)
-            tgt_plain = unlock_placeholders(tgt_locked, mapping)
+            tgt_plain = unlocker.unlock(tgt_locked, mapping)
             dump.append({"occurrence_key": occ, "source_en": it.value, "target": tgt_plain})
         with open(dump_json_path, "w", encoding="utf-8") as f:
             json.dump(dump, f, ensure_ascii=False, indent=2)
@@ -776,7 +1242,7 @@ def translate(
 
         # ---- NEW: enforce translation for titles/item_name that remained English ----
         base_rules = profile.system_rules if isinstance(profile.system_rules, str) else "".join((profile.system_rules or []))
-        fixed = _force_translate_titles_and_item_names(
+        fixed = 0 if pending else _force_translate_titles_and_item_names(
             locale=locale,
             cfg=cfg,
             logger=logger,
@@ -785,6 +1251,7 @@ def translate(
             occ_to_col=occ_to_col,
             translated_accum=translated_accum,
             cost=cost,
+            cache=cache,
             dump_json_path=dump_json_path,
             enforce_enabled=enforce_titles,
             only_cols=enforce_only_cols,
@@ -792,6 +1259,7 @@ def translate(
             occkey_regex=enforce_occkey_regex,
             max_occurrences=enforce_max,
             extra_prompt_path=title_enforce_prompt_path,
+            on_usage=on_usage,
         )
         if fixed:
             logger.info(f"Enforced {fixed} title/item_name translation(s).")
@@ -804,23 +1272,31 @@ def translate(
             tgt_locked = translated_accum.get(src_locked, src_locked)
             issues.extend(check_placeholder_parity(src_locked, tgt_locked, locale))
 
+            by_mapping: Dict[int, Tuple[str, List[ValidationIssue]]] = {}  # id(mapping) -> (SQL literal, issues)
             for occ_key in occ_keys:
                 _, mapping = locked_map[occ_key]
-                src_plain = occ_to_source[occ_key]
-                final_tgt = unlock_placeholders(tgt_locked, mapping)
-
-                issues.extend(check_length_ratio(src_plain, final_tgt, locale, cfg.length_ratio_min, cfg.length_ratio_max))
+                done = by_mapping.get(id(mapping))
+                if done is None:
+                    # same mapping object = same source value (PlaceholderLocker)
+                    src_plain = occ_to_source[occ_key]
+                    final_tgt = unlocker.unlock(tgt_locked, mapping)
+                    done = by_mapping[id(mapping)] = (
+                        "'" + sql_escape_single_quotes(final_tgt) + "'",
+                        check_length_ratio(src_plain, final_tgt, locale, cfg.length_ratio_min, cfg.length_ratio_max),
+                    )
                 # If you want glossary checks back on, uncomment:
                 # issues.extend(check_glossary_consistency(final_tgt, locale, glossary))
-
-                occurrence_to_translated[occ_key] = "'" + sql_escape_single_quotes(final_tgt) + "'"
+                issues.extend(done[1])
+                occurrence_to_translated[occ_key] = done[0]
 
         issues_path = os.path.join(cfg.output_dir, f"validation_{locale}.json")
         with open(issues_path, "w", encoding="utf-8") as f:
             json.dump([issue.__dict__ for issue in issues], f, ensure_ascii=False, indent=2)
         logger.info(f"Validation issues for {locale}: {len(issues)} (see {issues_path})")
 
-        if not cfg.dry_run:
+        if pending:
+            logger.warning(f"Skipping seed_{locale}.sql: {pending} string(s) still untranslated (budget).")
+        elif not cfg.dry_run:
             reinjector = SqlReinjector(
                 trans_cols, pks,
                 hints=loader.schema_hints,
@@ -836,13 +1312,138 @@ def translate(
             "unique_translated": len(translated_accum),
             "issues": len(issues),
             "titles_enforced": fixed,
+            "batches": 0 if cfg.dry_run else len(plan),
         }
+        if enum_stats:
+            report["locales"][locale]["enum_dictionary"] = enum_stats
+        if dict_hits:
+            report["locales"][locale]["dictionary"] = {"strings": dict_hits, "chars": dict_chars}
+        if seg_stats:
+            report["locales"][locale]["segments"] = seg_stats
+        if tpl_stats:
+            report["locales"][locale]["templates"] = tpl_stats
+        if peer_stats:
+            report["locales"][locale]["shared_cache"] = peer_stats
+        if pending:
+            report["locales"][locale]["pending"] = pending
 
     report["cost_chars_total"] = cost.total_chars
     report["cost_est_usd"] = cost.est_cost_usd
+    report["tokens"] = cost.token_report()
+    report["budget_exhausted"] = budget_exhausted
+    # request / parse-failure counters (compare runs with and without --no-response-schema)
+    if getattr(translator, "stats", None) is not None:
+        report["translator_stats"] = dict(translator.stats)
+    if getattr(translator, "context_cache", None) is not None:
+        translator.close()
+        report["context_cache"] = dict(translator.context_cache.stats)
+    report["cache"] = cache.report()
+    cache.close()
+    if enum_cache is not None:
+        report["enum_cache"] = enum_cache.report()
+        enum_cache.close()
     save_text(os.path.join(cfg.output_dir, "run_report.json"), json.dumps(report, ensure_ascii=False, indent=2))
     logger.info(f"Estimated cost: ${cost.est_cost_usd:.2f} for {cost.total_chars} chars")
 
+# ----------------- cache maintenance -----------------
+
+def _seed_cache_sources(schema_path: str, input_sql_path: str, domain: Optional[str], logger) -> List[str]:
+    """
+    Cache sources a translate run of this seed can look up: the locked strings plus the
+    sentences and number templates derived from them (--segment-columns / --template-dedupe).
+    """
+    loader = SchemaLoader(schema_path)
+    profile = loader.profile_from_schema()
+    if domain and domain != "auto":
+        profile = get_profile(domain) or profile
+    extractor = SqlExtractor(loader.translatable_columns(), loader.primary_keys(), hints=loader.schema_hints,
+                             schema_columns_order=loader.columns_order_map())
+    locker = PlaceholderLocker(profile.placeholder_patterns)
+    locked = unique_preserve_order([locker.lock(it.value)[0] for it in extractor.extract(load_text(input_sql_path))])
+    derived = [seg for s in locked for parts in (split_segments(s),) if len(parts) > 1 for seg, _ in parts]
+    derived += list(cluster_templates(locked).clusters)
+    logger.info(f"Seed {input_sql_path}: {len(locked)} source string(s), {len(derived)} derived sentence/template key(s)")
+    return locked + derived
+
+def cache_command(args, logger) -> None:
+    """`i18n-seed cache stats|evict|prune|vacuum|export|import` (prints a JSON summary) and `cache serve`."""
+    if args.cache_cmd == "serve":
+        serve_cache(args.cache, host=args.host, port=args.port, socket_path=args.socket, logger=logger,
+                    mem_entries=args.mem_entries)
+        return
+    conn = open_for_maintenance(args.cache, create=args.cache_cmd == "import")
+    try:
+        if args.cache_cmd == "export":
+            namespaces = (args.namespace or []) + [f"*:{m}:*" for m in args.model or []]
+            sources = None
+            if args.input_sql:
+                if not args.schema:
+                    raise SystemExit("cache export: --input-sql needs --schema")
+                sources = _seed_cache_sources(args.schema, args.input_sql, args.domain, logger)
+            out = export_bundle(conn, args.output, locales=args.locales, namespaces=namespaces or None, sources=sources)
+            logger.info(f"Exported {out['entries']} entries to {out['bundle']} ({out['bytes']} bytes)")
+        elif args.cache_cmd == "import":
+            out = {"bundles": []}
+            for path in args.bundles:
+                res = import_bundle(conn, path, locales=args.locales, namespaces=args.namespace, overwrite=args.overwrite)
+                logger.info(f"Imported {res['imported']} of {res['entries']} entries from {path}")
+                out["bundles"].append(res)
+        elif args.cache_cmd == "stats":
+            out = cache_stats(conn, args.cache)
+        elif args.cache_cmd == "evict":
+            if args.max_mb is None and args.ttl_days is None:
+                raise SystemExit("cache evict: give --max-mb and/or --ttl-days")
+            max_bytes = int(args.max_mb * 2**20) if args.max_mb is not None else None
+            out = evict_entries(conn, max_bytes=max_bytes, ttl_days=args.ttl_days)
+            logger.info(f"Evicted {out['ttl_evicted']} expired and {out['lru_evicted']} least recently used entries")
+            if out["ttl_evicted"] and not args.no_vacuum:
+                out.update(vacuum_cache(conn, full=True))
+        elif args.cache_cmd == "prune":
+            out = prune_namespaces(conn, drop=args.namespace, keep=args.keep_namespace, unused_days=args.unused_days)
+            for ns in out["namespaces"]:
+                logger.info(f"Pruned namespace {ns['name']}: {ns['entries']} entries")
+            if (out["entries"] or out["orphan_sources"]) and not args.no_vacuum:
+                out.update(vacuum_cache(conn, full=True))
+        else:
+            out = vacuum_cache(conn, full=args.full)
+    finally:
+        conn.close()
+    print(json.dumps(out, ensure_ascii=False, indent=2))
+
+def ingest_command(args, logger) -> None:
+    """
+    `i18n-seed ingest-localized`: pins the translations of an existing localized seed into the
+    cache, aligned cell by cell with its English source (prints a JSON summary).
+    """
+    loader = SchemaLoader(args.schema)
+    profile = loader.profile_from_schema()
+    if args.domain and args.domain != "auto":
+        profile = get_profile(args.domain) or profile
+    if args.cache_namespace:
+        namespace = args.cache_namespace
+    elif args.llm_provider.lower() == "gemini":
+        namespace = gemini_cache_namespace(args.llm_model, _rules_text(profile.system_rules))
+    else:
+        raise RuntimeError(f"Unsupported provider {args.llm_provider}")
+    extractor = SqlExtractor(loader.translatable_columns(), loader.primary_keys(), hints=loader.schema_hints,
+                             schema_columns_order=loader.columns_order_map())
+    en_items = extractor.extract(load_text(args.source_sql))
+    loc_items = extractor.extract(load_text(args.localized_sql))
+    logger.info(f"Extracted {len(en_items)} English and {len(loc_items)} {args.locale} cells")
+
+    pairs, out = align_localized(en_items, loc_items, profile.placeholder_patterns, keep_identical=args.keep_identical)
+    if out["missing"] or out["placeholder_mismatch"]:
+        logger.warning(f"Not aligned: {out['missing']} cell(s) missing from {args.localized_sql}, "
+                       f"{out['placeholder_mismatch']} with changed placeholders")
+    conn = open_for_maintenance(args.cache, create=True)
+    try:
+        out["pinned"] = pin_translations(conn, namespace, args.locale, pairs)
+    finally:
+        conn.close()
+    out.update({"namespace": namespace, "locale": args.locale})
+    logger.info(f"Pinned {out['pinned']} {args.locale} translation(s) in namespace {namespace}")
+    print(json.dumps(out, ensure_ascii=False, indent=2))
+
 def main():
     ap = argparse.ArgumentParser(prog="i18n-seed", description="Translate SQL seeds to multiple locales")
     sub = ap.add_subparsers(dest="cmd", required=True)
@@ -866,6 +1467,53 @@ def main():
     t.add_argument("--glossary", dest="glossary_path", default=None)
     t.add_argument("--dry-run", action="store_true")
     t.add_argument("--domain", default="auto", help="auto|amazon|slack|generic")
+    t.add_argument("--multi-locale", type=int, default=0,
+                   help="Translate this many locales per request (e.g. 4); missing answers fall back to per-locale requests.")
+    t.add_argument("--heal-workers", type=int, default=4,
+                   help="Concurrent requests used to re-ask for items missing from a response.")
+    t.add_argument("--heal-batch-items", type=int, default=50,
+                   help="Items per request in the first heal round (later rounds re-ask one item at a time).")
+    t.add_argument("--heal-rounds", type=int, default=2,
+                   help="Heal rounds per batch before items are left in English.")
+    t.add_argument("--stream", action="store_true",
+                   help="Use streamGenerateContent and cache each item as soon as it arrives.")
+    t.add_argument("--llm-endpoint", default=None,
+                   help="Base URL of the Gemini API, e.g. http://127.0.0.1:8765 for the local stub (default: $GEMINI_API_BASE or Google).")
+    t.add_argument("--usd-per-million-input", type=float, default=0.10,
+                   help="Price per million prompt tokens (cost estimate and --max-usd).")
+    t.add_argument("--usd-per-million-output", type=float, default=0.40,
+                   help="Price per million output tokens (cost estimate and --max-usd).")
+    t.add_argument("--max-tokens", type=int, default=None,
+                   help="Stop dispatching new batches once this many tokens were used; re-run to resume.")
+    t.add_argument("--max-usd", type=float, default=None,
+                   help="Stop dispatching new batches once the estimated cost reaches this; re-run to resume.")
+    t.add_argument("--context-cache", action="store_true",
+                   help="Upload the static prompt prefix (with the profile rules) once as a Gemini cachedContent and "
+                        "reference it from every batch. Only prefixes above --context-cache-min-tokens are cached; "
+                        "the default prompt with the bundled profiles stays below it, so this saves nothing there.")
+    t.add_argument("--context-cache-ttl", type=int, default=3600, help="cachedContent TTL in seconds (refreshed before expiry).")
+    t.add_argument("--context-cache-min-tokens", type=int, default=4096,
+                   help="Only cache prefixes of at least this many (estimated) tokens: the API minimum for the model "
+                        "(4096 for gemini-2.0-flash / 2.5 Pro, 1024 for 2.5 Flash).")
+    t.add_argument("--no-response-schema", dest="response_schema", action="store_false",
+                   help="Do not send responseSchema; rely on the prompt for JSON (baseline for parse-retry stats).")
+    t.add_argument("--prefilter", action="store_true",
+                   help="Pass codes, identifiers, URLs and NULLs through and translate mapped enum values from the profile dictionary, without the model.")
+    t.add_argument("--cache-namespace", default=None,
+                   help="Cache namespace to read/write (default: provider:model:prompt-version, so each model/rule set has its own entries).")
+    t.add_argument("--cache-url", default=None,
+                   help="Use a shared cache server (http://host:port or unix:///path, see `cache serve`) instead of --cache.")
+    t.add_argument("--cache-lease", type=int, default=600,
+                   help="Seconds other nodes wait for strings this run is translating before taking them over.")
+    t.add_argument("--cache-mem-entries", type=int, default=100_000,
+                   help="Entries kept in the in-memory LRU tier in front of the SQLite cache (0 = off).")
+    t.add_argument("--cache-mem-mb", type=int, default=64, help="Approximate memory bound of the LRU tier in MiB (0 = off).")
+    t.add_argument("--enum-max-distinct", type=int, default=0,
+                   help="Translate fields with at most this many distinct, repeated values (e.g. 32) as one enum dictionary per locale (default 0 = off).")
+    t.add_argument("--segment-columns", nargs="+", default=None,
+                   help="Translate and cache these columns (e.g. description) sentence by sentence.")
+    t.add_argument("--template-dedupe", action="store_true",
+                   help="Translate strings that only differ by numbers/model codes once per template and fill the values back in.")
 
     # ---- NEW: enforcement options ----
     t.add_argument("--enforce-titles", action="store_true",
@@ -881,7 +1529,106 @@ def main():
     t.add_argument("--title-enforce-prompt", default=None,
                    help="Path to a txt file with extra strict rules appended for the title enforcement pass.")
 
+    # ---- local Gemini stub (offline runs / benchmarks) ----
+    st = sub.add_parser("stub-server", help="Serve a local Gemini-compatible stub (synthetic, record or replay)")
+    st.add_argument("--host", default="127.0.0.1")
+    st.add_argument("--port", type=int, default=8765)
+    st.add_argument("--mode", choices=["synth", "record", "replay"], default="synth")
+    st.add_argument("--cassettes", default=None, help="Cassette directory for record/replay.")
+    st.add_argument("--upstream", default=GEMINI_API_BASE, help="Real API base used in record mode.")
+    st.add_argument("--replay-miss", choices=["error", "synth"], default="error",
+                    help="What replay does for a request without a cassette.")
+    st.add_argument("--no-replay-timing", dest="replay_timing", action="store_false",
+                    help="Replay: use --latency/--chars-per-sec instead of the cassettes' recorded response times.")
+    st.add_argument("--latency", default="fixed:0",
+                    help="fixed:S | uniform:A:B | lognormal:MEDIAN:SIGMA (seconds).")
+    st.add_argument("--chars-per-sec", type=float, default=0.0,
+                    help="Simulated generation speed; adds len(answer)/N seconds (0 = off).")
+    st.add_argument("--stream-chunks", type=int, default=8)
+    st.add_argument("--rate-429", type=float, default=0.0)
+    st.add_argument("--rate-5xx", type=float, default=0.0)
+    st.add_argument("--drop-rate", type=float, default=0.0, help="Probability of dropping each item.")
+    st.add_argument("--reorder-rate", type=float, default=0.0, help="Probability of shuffling a response.")
+    st.add_argument("--malformed-rate", type=float, default=0.0,
+                    help="Probability of cutting a response mid-JSON (requests without responseSchema only).")
+    st.add_argument("--reject-schema", action="store_true", help="Answer 400 to requests that carry a responseSchema.")
+    st.add_argument("--cache-min-tokens", type=int, default=0,
+                    help="Reject cachedContents under this many tokens (~4 chars each; mimics the API's minimum size).")
+    st.add_argument("--seed", type=int, default=None)
+    st.add_argument("--log-level", default="INFO")
+
+    # ---- translation cache maintenance ----
+    c = sub.add_parser("cache", help="Inspect and shrink the translation cache")
+    cs = c.add_subparsers(dest="cache_cmd", required=True)
+    cache_opts = argparse.ArgumentParser(add_help=False)
+    cache_opts.add_argument("--cache", default=".llm_cache.sqlite")
+    cache_opts.add_argument("--log-level", default="INFO")
+    cs.add_parser("stats", parents=[cache_opts], help="Size, entries, hits and last use per namespace (JSON).")
+    ev = cs.add_parser("evict", parents=[cache_opts], help="Evict expired / least recently used entries.")
+    ev.add_argument("--max-mb", type=float, default=None, help="Evict least recently used entries until the data fits in this size.")
+    ev.add_argument("--ttl-days", type=float, default=None, help="Evict entries not used for this many days.")
+    ev.add_argument("--no-vacuum", action="store_true", help="Skip compacting the file after TTL eviction (--max-mb always compacts).")
+    pr = cs.add_parser("prune", parents=[cache_opts],
+                       help="Drop whole namespaces (models / prompt versions) and orphaned source texts.")
+    pr.add_argument("--namespace", nargs="+", default=None, help="Drop namespaces matching these patterns (fnmatch).")
+    pr.add_argument("--keep-namespace", nargs="+", default=None, help="Drop every namespace not matching these patterns.")
+    pr.add_argument("--unused-days", type=float, default=None, help="Drop namespaces no run has used for this many days.")
+    pr.add_argument("--no-vacuum", action="store_true", help="Skip compacting the file afterwards.")
+    vc = cs.add_parser("vacuum", parents=[cache_opts], help="Return free pages to the file system (incremental vacuum).")
+    vc.add_argument("--full", action="store_true", help="Rebuild the whole file (VACUUM) instead.")
+    ex = cs.add_parser("export", parents=[cache_opts], help="Write cache entries to a portable, content-addressed bundle.")
+    ex.add_argument("--output", required=True, help="Bundle file, or a directory (file named cache-<sha256>.jsonl.gz).")
+    ex.add_argument("--locales", nargs="+", default=None)
+    ex.add_argument("--namespace", nargs="+", default=None, help="Namespace patterns (fnmatch).")
+    ex.add_argument("--model", nargs="+", default=None, help="Only entries of these models (namespace *:<model>:*).")
+    ex.add_argument("--schema", default=None)
+    ex.add_argument("--input-sql", default=None, help="Only entries a translate run of this seed would look up.")
+    ex.add_argument("--domain", default="auto")
+    im = cs.add_parser("import", parents=[cache_opts], help="Merge bundles into the cache (idempotent; local entries win).")
+    im.add_argument("bundles", nargs="+")
+    im.add_argument("--locales", nargs="+", default=None)
+    im.add_argument("--namespace", nargs="+", default=None, help="Namespace patterns (fnmatch).")
+    im.add_argument("--overwrite", action="store_true",
+                    help="Bundle entries replace local ones (pinned local entries only by pinned bundle entries).")
+    sv = cs.add_parser("serve", parents=[cache_opts], help="Serve the cache file to other nodes (translate --cache-url).")
+    sv.add_argument("--host", default="127.0.0.1")
+    sv.add_argument("--port", type=int, default=8787)
+    sv.add_argument("--socket", default=None, help="Listen on this Unix socket instead of TCP.")
+    sv.add_argument("--mem-entries", type=int, default=100_000, help="In-memory LRU entries per namespace.")
+
+    ig = sub.add_parser("ingest-localized",
+                        help="Pin the translations of an existing localized seed into the cache (authoritative entries)")
+    ig.add_argument("--schema", required=True)
+    ig.add_argument("--source-sql", required=True, help="The English seed.")
+    ig.add_argument("--localized-sql", required=True, help="The same seed, localized (same rows and keys).")
+    ig.add_argument("--locale", required=True)
+    ig.add_argument("--cache", default=".llm_cache.sqlite")
+    ig.add_argument("--llm-provider", default="gemini")
+    ig.add_argument("--llm-model", default="gemini-2.0-flash-001", help="Model whose cache namespace receives the entries.")
+    ig.add_argument("--cache-namespace", default=None, help="Explicit namespace (as translate --cache-namespace).")
+    ig.add_argument("--domain", default="auto")
+    ig.add_argument("--keep-identical", action="store_true",
+                    help="Also pin cells left unchanged in the localized seed (default: treated as untranslated).")
+    ig.add_argument("--log-level", default="INFO")
+
     args = ap.parse_args()
+    if args.cmd == "cache":
+        cache_command(args, setup_logger(args.log_level))
+        return
+    if args.cmd == "ingest-localized":
+        ingest_command(args, setup_logger(args.log_level))
+        return
+    if args.cmd == "stub-server":
+        serve(StubConfig(
+            host=args.host, port=args.port, mode=args.mode, cassette_dir=args.cassettes,
+            upstream=args.upstream, replay_miss=args.replay_miss, replay_timing=args.replay_timing, latency=args.latency,
+            chars_per_sec=args.chars_per_sec, stream_chunks=args.stream_chunks,
+            rate_429=args.rate_429, rate_5xx=args.rate_5xx, drop_rate=args.drop_rate,
+            reorder_rate=args.reorder_rate, malformed_rate=args.malformed_rate, seed=args.seed,
+            reject_schema=args.reject_schema, cache_min_tokens=args.cache_min_tokens,
+        ), setup_logger(args.log_level))
+        return
+
     cfg = TranslateConfig(
         schema_path=args.schema, input_sql_path=args.input_sql, output_dir=args.output,
         locales=args.locales, llm_provider=args.llm_provider, llm_model=args.llm_model,
@@ -890,6 +1637,17 @@ def main():
         cost_per_million=args.cost_per_million, length_ratio_min=args.length_ratio_min,
         length_ratio_max=args.length_ratio_max, log_level=args.log_level,
         dry_run=args.dry_run, glossary_path=args.glossary_path,
+        multi_locale_group=args.multi_locale, heal_workers=args.heal_workers,
+        heal_batch_items=args.heal_batch_items, heal_rounds=args.heal_rounds, stream=args.stream,
+        llm_endpoint=args.llm_endpoint, response_schema=args.response_schema,
+        input_usd_per_million=args.usd_per_million_input, output_usd_per_million=args.usd_per_million_output,
+        max_tokens=args.max_tokens, max_usd=args.max_usd,
+        context_cache=args.context_cache, context_cache_ttl=args.context_cache_ttl,
+        context_cache_min_tokens=args.context_cache_min_tokens,
+        template_dedupe=args.template_dedupe, segment_columns=args.segment_columns, prefilter=args.prefilter,
+        enum_max_distinct=args.enum_max_distinct, cache_namespace=args.cache_namespace,
+        cache_mem_entries=args.cache_mem_entries, cache_mem_mb=args.cache_mem_mb,
+        cache_url=args.cache_url, cache_lease=args.cache_lease,
     )
 
     translate(
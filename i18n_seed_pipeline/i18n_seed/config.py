@@ -163,3 +163,43 @@ class TranslateConfig:
     log_level: str = "INFO"
     dry_run: bool = False
     glossary_path: Optional[str] = None
+    # >1: translate cache misses for this many locales per request (multi-locale fan-out)
+    multi_locale_group: int = 0
+    # concurrent requests used to re-ask for items a response dropped
+    heal_workers: int = 4
+    # items per request in the first heal round; later rounds re-ask one item at a time
+    heal_batch_items: int = 50
+    heal_rounds: int = 2
+    # streamGenerateContent: items are cached as soon as they arrive
+    stream: bool = False
+    # base URL of the Gemini API (None: GEMINI_API_BASE env or the public endpoint)
+    llm_endpoint: Optional[str] = None
+    # send responseSchema (structured output); off = prompt-only JSON, for comparing parse retries
+    response_schema: bool = True
+    # token pricing (USD per million) and optional budgets; reaching a budget stops dispatching
+    # new batches, and a later run resumes from the cache
+    input_usd_per_million: float = 0.10
+    output_usd_per_million: float = 0.40
+    max_tokens: Optional[int] = None
+    max_usd: Optional[float] = None
+    # Gemini context caching of the static prompt prefix (per model, locale and rule set)
+    context_cache: bool = False
+    context_cache_ttl: int = 3600
+    context_cache_min_tokens: int = 4096
+    # translate one representative per number/model-code template and fill the values back in
+    template_dedupe: bool = False
+    # columns translated and cached sentence by sentence (sentence-level translation memory)
+    segment_columns: Optional[List[str]] = None
+    # local pass-through (codes, identifiers, URLs, NULL) / profile-dictionary stage before batching
+    prefilter: bool = False
+    # fields with at most this many distinct (repeated) values get one enum dictionary per locale; 0 = off
+    enum_max_distinct: int = 0
+    # cache namespace override (default: provider:model:prompt/rules version of the translator)
+    cache_namespace: Optional[str] = None
+    # in-process LRU tier over the SQLite cache (entries / MiB; either 0 = off)
+    cache_mem_entries: int = 100_000
+    cache_mem_mb: int = 64
+    # shared cache server (http://host:port or unix:///path) instead of the local cache file
+    cache_url: Optional[str] = None
+    # seconds another node waits for strings this run claimed before translating them itself
+    cache_lease: int = 600
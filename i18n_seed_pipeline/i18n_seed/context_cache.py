@@ -0,0 +1,153 @@
+"""
+Gemini context caching (cachedContents) for the static part of the translation prompts.
+
+The rules/header of a prompt are identical for every batch of a (model, locale, rule set), so
+they are uploaded once as a cached content and each batch request only sends its payload plus
+a reference to it. Entries are refreshed before they expire. Any failure (prefix below the
+API's minimum size, caching not available for the model, expired or deleted entry) simply
+disables caching for that prefix and the caller sends the full prompt as before.
+
+The API's minimum is counted in tokens (1,024-4,096 depending on the model). The default
+prompt's static part plus the profile rules is only a few hundred tokens, so with the bundled
+profiles nothing is cached; the first such prefix is logged and counted as "too_small".
+"""
+from __future__ import annotations
+
+import time
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Set
+
+import requests
+
+def estimate_tokens(text: str) -> int:
+    """~4 characters per token, the same estimate used when the API reports no usage."""
+    return (len(text) + 3) // 4
+
+@dataclass
+class _Entry:
+    name: str
+    expires_at: float
+
+class GeminiContextCache:
+    def __init__(self, api_base: str, api_key: str, model: str, ttl_s: int = 3600,
+                 refresh_margin_s: int = 120, min_tokens: int = 4096, logger: Optional[logging.Logger] = None,
+                 timeout: int = 30) -> None:
+        self.api_base = api_base.rstrip("/")
+        self.api_key = api_key
+        self.model = model
+        self.ttl_s = max(60, ttl_s)
+        self.refresh_margin_s = min(refresh_margin_s, self.ttl_s // 4)
+        # the API rejects small caches (1k-4k tokens depending on model); don't spend a request on those
+        self.min_tokens = min_tokens
+        self.timeout = timeout
+        self.logger = logger or logging.getLogger("i18n-seed")
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _Entry] = {}
+        self._failed: Set[str] = set()
+        self._small: Set[str] = set()
+        self.stats: Dict[str, int] = {"created": 0, "refreshed": 0, "hits": 0, "fallbacks": 0, "deleted": 0,
+                                      "too_small": 0}
+
+    @staticmethod
+    def _key(prefix: str) -> str:
+        return hashlib.sha256(prefix.encode("utf-8")).hexdigest()
+
+    def get(self, prefix: str) -> Optional[str]:
+        """cachedContents/<id> holding `prefix`, or None when the full prompt should be sent."""
+        key = self._key(prefix)
+        tokens = estimate_tokens(prefix)
+        if tokens < self.min_tokens:
+            with self._lock:
+                if key not in self._small:
+                    self._small.add(key)
+                    self.stats["too_small"] += 1
+                    self.logger.warning(f"Context cache not used: static prompt prefix is ~{tokens} tokens, "
+                                        f"below the {self.min_tokens}-token minimum; sending full prompts")
+            return None
+        with self._lock:
+            if key in self._failed:
+                return None
+            entry = self._entries.get(key)
+            now = time.time()
+            try:
+                if entry and entry.expires_at - self.refresh_margin_s > now:
+                    self.stats["hits"] += 1
+                    return entry.name
+                if entry:
+                    try:
+                        entry.expires_at = self._refresh(entry.name)
+                        self.stats["refreshed"] += 1
+                        return entry.name
+                    except Exception as e:
+                        self.logger.info(f"Context cache refresh failed ({e}); recreating")
+                        self._entries.pop(key, None)
+                entry = _Entry(*self._create(prefix))
+                self._entries[key] = entry
+                self.stats["created"] += 1
+                self.logger.info(f"Context cache created: {entry.name} (~{tokens} tokens)")
+                return entry.name
+            except Exception as e:
+                self.stats["fallbacks"] += 1
+                msg = str(e)
+                if msg.startswith("HTTP 4") and not msg.startswith("HTTP 429"):
+                    # rejected (too small, unsupported model, ...): don't ask again for this prefix
+                    self._failed.add(key)
+                    self.logger.warning(f"Context caching unavailable ({e}); sending full prompts for this rule set")
+                else:
+                    self.logger.info(f"Context cache creation failed ({e}); sending the full prompt")
+                return None
+
+    def invalidate(self, name: str) -> None:
+        """
+        Forget an entry the API no longer accepts; the next get() creates a fresh one. The entry
+        is deleted remotely too, in case it still exists (it would be billed until the TTL ends).
+        """
+        with self._lock:
+            found = False
+            for key, entry in list(self._entries.items()):
+                if entry.name == name:
+                    del self._entries[key]
+                    found = True
+        if found:
+            self._delete(name)
+
+    def close(self) -> None:
+        """Delete the caches created by this run (they would otherwise be billed until the TTL ends)."""
+        with self._lock:
+            entries, self._entries = list(self._entries.values()), {}
+        for entry in entries:
+            self._delete(entry.name)
+
+    def _delete(self, name: str) -> None:
+        try:
+            resp = requests.delete(f"{self.api_base}/v1beta/{name}", params={"key": self.api_key}, timeout=self.timeout)
+            if resp.status_code == 200:
+                with self._lock:
+                    self.stats["deleted"] += 1
+        except Exception:
+            pass
+
+    # ---- REST ----
+    def _create(self, prefix: str):
+        body = {
+            "model": f"models/{self.model}",
+            "contents": [{"role": "user", "parts": [{"text": prefix}]}],
+            "ttl": f"{self.ttl_s}s",
+        }
+        resp = requests.post(f"{self.api_base}/v1beta/cachedContents", params={"key": self.api_key}, json=body, timeout=self.timeout)
+        if resp.status_code != 200:
+            raise RuntimeError(f"HTTP {resp.status_code}: {resp.text[:200]}")
+        data = resp.json()
+        return data["name"], time.time() + self.ttl_s
+
+    def _refresh(self, name: str) -> float:
+        resp = requests.patch(
+            f"{self.api_base}/v1beta/{name}", params={"key": self.api_key, "updateMask": "ttl"},
+            json={"ttl": f"{self.ttl_s}s"}, timeout=self.timeout,
+        )
+        if resp.status_code != 200:
+            raise RuntimeError(f"HTTP {resp.status_code}: {resp.text[:200]}")
+        return time.time() + self.ttl_s
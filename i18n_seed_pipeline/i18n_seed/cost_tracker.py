@@ -1,19 +1,77 @@
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
 
 @dataclass
 class CostTracker:
     cost_per_million: float = 15.0
     prompt_chars: int = 0
     completion_chars: int = 0
+    # token usage reported by the API (usageMetadata); priced per million tokens
+    input_usd_per_million: float = 0.10
+    output_usd_per_million: float = 0.40
+    prompt_tokens: float = 0.0
+    completion_tokens: float = 0.0
+    by_locale: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    by_column: Dict[str, Dict[str, float]] = field(default_factory=dict)  # "table.column"
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
 
     def add(self, prompt_chars: int, completion_chars: int) -> None:
         self.prompt_chars += prompt_chars
         self.completion_chars += completion_chars
 
+    def add_tokens(self, prompt_tokens: float, completion_tokens: float,
+                   locale: Optional[str] = None, weights: Optional[Dict[str, float]] = None) -> None:
+        """Record one response's usage; weights ("table.column" -> share, summing to 1) split it across columns."""
+        with self._lock:
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+            if locale:
+                _accumulate(self.by_locale, locale, prompt_tokens, completion_tokens)
+            for key, w in (weights or {}).items():
+                _accumulate(self.by_column, key, prompt_tokens * w, completion_tokens * w)
+
     @property
     def total_chars(self) -> int:
         return self.prompt_chars + self.completion_chars
 
+    @property
+    def total_tokens(self) -> float:
+        return self.prompt_tokens + self.completion_tokens
+
     @property
     def est_cost_usd(self) -> float:
+        # real token counts when the provider reported any, the character estimate otherwise
+        if self.total_tokens:
+            return (self.prompt_tokens * self.input_usd_per_million
+                    + self.completion_tokens * self.output_usd_per_million) / 1_000_000.0
         return (self.total_chars / 1_000_000.0) * self.cost_per_million
+
+    def over_budget(self, max_tokens: Optional[int] = None, max_usd: Optional[float] = None) -> bool:
+        if max_tokens is not None and self.total_tokens >= max_tokens:
+            return True
+        if max_usd is not None and self.est_cost_usd >= max_usd:
+            return True
+        return False
+
+    def token_report(self) -> Dict[str, Any]:
+        with self._lock:
+            by_table: Dict[str, Dict[str, float]] = {}
+            for key, v in self.by_column.items():
+                _accumulate(by_table, key.split(".", 1)[0], v["prompt_tokens"], v["completion_tokens"])
+            return {
+                "prompt_tokens": round(self.prompt_tokens),
+                "completion_tokens": round(self.completion_tokens),
+                "total_tokens": round(self.total_tokens),
+                "by_locale": _rounded(self.by_locale),
+                "by_table": _rounded(by_table),
+                "by_column": _rounded(self.by_column),
+            }
+
+def _accumulate(bucket: Dict[str, Dict[str, float]], key: str, prompt_tokens: float, completion_tokens: float) -> None:
+    v = bucket.setdefault(key, {"prompt_tokens": 0.0, "completion_tokens": 0.0})
+    v["prompt_tokens"] += prompt_tokens
+    v["completion_tokens"] += completion_tokens
+
+def _rounded(bucket: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, int]]:
+    return {k: {n: round(x) for n, x in v.items()} for k, v in sorted(bucket.items())}
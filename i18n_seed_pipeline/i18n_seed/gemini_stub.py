@@ -0,0 +1,431 @@
+"""
+Local stand-in for the Gemini generateContent / streamGenerateContent endpoints.
+
+Lets GeminiTranslator (batching, healing, streaming, concurrency) run and be timed without
+the real API:
+
+  python -m i18n_seed.cli stub-server --port 8765 --latency lognormal:0.3:0.5 --rate-429 0.05
+  GEMINI_API_KEY=x python -m i18n_seed.cli translate ... --llm-endpoint http://127.0.0.1:8765
+
+Modes:
+  synth   (default) answers every prompt with "[locale] text" for each input item
+  record  forwards to --upstream (the real API, using the caller's key) and stores each 200
+          response as a cassette file named after the hash of the request
+  replay  serves cassettes; a request without one gets a 404 (or a synthetic answer with
+          --replay-miss synth)
+
+Cassettes keep the recorded response time (and time to first chunk for streams); replay
+answers after that time, so replayed runs reproduce the recorded timings. --no-replay-timing
+uses --latency / --chars-per-sec for cassette hits too.
+Latency, 429/5xx injection and dropped/reordered/malformed items apply to synth and replay.
+Like the real API, answers to requests carrying a responseSchema are never malformed
+(--reject-schema answers them with a 400 instead, to exercise the fallback).
+cachedContents (context caching) are kept in memory; creating one below --cache-min-tokens
+fails like the API's minimum size does. Record mode does not proxy them (the translator
+then falls back to full prompts, which keeps cassettes reusable across runs).
+GET /stats returns the request/fault counters as JSON.
+"""
+from __future__ import annotations
+
+import os
+import re
+import json
+import math
+import time
+import random
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+from .translator_gemini import GEMINI_API_BASE
+
+# /v1beta/models/<model>:generateContent or :streamGenerateContent
+PATH_RE = re.compile(r"^/v1(?:beta)?/models/(?P<model>[^/:]+):(?P<method>generateContent|streamGenerateContent)$")
+LOCALE_RE = re.compile(r"\(locale=([A-Za-z_\-]+)\)")
+MULTI_KEYS_RE = re.compile(r"exactly these keys: ([^\n]+)")
+CACHE_PATH_RE = re.compile(r"^/v1(?:beta)?/(?P<name>cachedContents(?:/[^/]+)?)$")
+
+@dataclass
+class StubConfig:
+    host: str = "127.0.0.1"
+    port: int = 8765
+    mode: str = "synth"                 # synth | record | replay
+    cassette_dir: Optional[str] = None
+    upstream: str = GEMINI_API_BASE
+    replay_miss: str = "error"          # error | synth
+    replay_timing: bool = True          # replay sleeps for the cassette's recorded elapsed_s
+    latency: str = "fixed:0"            # fixed:S | uniform:A:B | lognormal:MU:SIGMA (seconds)
+    chars_per_sec: float = 0.0          # >0: add len(answer)/chars_per_sec of "generation" time
+    stream_chunks: int = 8
+    rate_429: float = 0.0
+    rate_5xx: float = 0.0
+    drop_rate: float = 0.0              # per item
+    reorder_rate: float = 0.0           # per response
+    malformed_rate: float = 0.0         # per response: answer is cut off mid-array
+    reject_schema: bool = False         # 400 for requests with generationConfig.responseSchema
+    cache_min_tokens: int = 0           # cachedContents under this many tokens are rejected (400)
+    seed: Optional[int] = None
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """fixed:S, uniform:A:B or lognormal:MU:SIGMA where MU is the median in seconds."""
+    kind, _, rest = (spec or "fixed:0").partition(":")
+    vals = [float(x) for x in rest.split(":") if x] if rest else []
+    if kind == "fixed":
+        v = vals[0] if vals else 0.0
+        return lambda rnd: v
+    if kind == "uniform" and len(vals) == 2:
+        a, b = vals
+        return lambda rnd: rnd.uniform(a, b)
+    if kind == "lognormal" and len(vals) == 2:
+        mu, sigma = math.log(max(vals[0], 1e-6)), vals[1]
+        return lambda rnd: rnd.lognormvariate(mu, sigma)
+    raise ValueError(f"Bad latency spec {spec!r} (use fixed:S, uniform:A:B or lognormal:MEDIAN:SIGMA)")
+
+def cassette_key(model: str, method: str, body: Dict[str, Any]) -> str:
+    canon = json.dumps({"model": model, "method": method, "body": body}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canon.encode("utf-8")).hexdigest()
+
+def _prompt_of(body: Dict[str, Any]) -> str:
+    out = []
+    for c in body.get("contents") or []:
+        for p in c.get("parts") or []:
+            out.append(p.get("text", ""))
+    return "\n".join(out)
+
+def _payload_of(prompt: str) -> List[Dict[str, Any]]:
+    # the pipeline's prompts end with the JSON payload line
+    for line in reversed(prompt.strip().splitlines()):
+        line = line.strip()
+        if line.startswith("["):
+            try:
+                arr = json.loads(line)
+            except Exception:
+                continue
+            if isinstance(arr, list):
+                return arr
+    return []
+
+def synth_answer(prompt: str) -> List[Any]:
+    """Echo translation: every item comes back as "[locale] text" (placeholders untouched)."""
+    items = _payload_of(prompt)
+    m = MULTI_KEYS_RE.search(prompt)
+    if m:
+        locs = [x.strip() for x in m.group(1).split(",") if x.strip()]
+        return [{"i": o.get("i"), "t": {loc: f"[{loc}] {o.get('t', '')}" for loc in locs}} for o in items if isinstance(o, dict)]
+    lm = LOCALE_RE.search(prompt)
+    loc = lm.group(1) if lm else "xx_XX"
+    out: List[Any] = []
+    for o in items:
+        if isinstance(o, dict):
+            out.append({"i": o.get("i"), "t": f"[{loc}] {o.get('t', '')}"})
+        else:
+            out.append(f"[{loc}] {o}")
+    return out
+
+def _response_json(text: str, prompt_chars: int, finish: Optional[str] = "STOP", cached_chars: int = 0) -> Dict[str, Any]:
+    cand: Dict[str, Any] = {"content": {"role": "model", "parts": [{"text": text}]}}
+    if finish:
+        cand["finishReason"] = finish
+    # rough 4 chars/token, enough for cost accounting in offline runs
+    p, c = max(1, prompt_chars // 4), max(1, len(text) // 4)
+    usage = {"promptTokenCount": p, "candidatesTokenCount": c, "totalTokenCount": p + c}
+    if cached_chars:
+        usage["cachedContentTokenCount"] = cached_chars // 4
+    return {"candidates": [cand], "usageMetadata": usage}
+
+class GeminiStub:
+    def __init__(self, cfg: StubConfig, logger: Optional[logging.Logger] = None) -> None:
+        self.cfg = cfg
+        self.logger = logger or logging.getLogger("i18n-seed")
+        self.rnd = random.Random(cfg.seed)
+        self._rnd_lock = threading.Lock()
+        self._latency = parse_latency(cfg.latency)
+        self._stats_lock = threading.Lock()
+        self.stats: Dict[str, int] = {
+            "requests": 0, "stream_requests": 0, "injected_429": 0, "injected_5xx": 0,
+            "dropped_items": 0, "reordered": 0, "malformed": 0,
+            "cassette_hits": 0, "cassette_misses": 0, "recorded": 0,
+            "contexts_created": 0, "contexts_refreshed": 0, "context_hits": 0,
+        }
+        self._contexts: Dict[str, Tuple[str, float]] = {}  # cachedContents/<id> -> (text, expires_at)
+        self._ctx_seq = 0
+        if cfg.mode in ("record", "replay"):
+            if not cfg.cassette_dir:
+                raise ValueError(f"--cassettes is required for mode={cfg.mode}")
+            os.makedirs(cfg.cassette_dir, exist_ok=True)
+
+    def _count(self, key: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self.stats[key] = self.stats.get(key, 0) + n
+
+    def _rand(self) -> float:
+        with self._rnd_lock:
+            return self.rnd.random()
+
+    def _cassette_path(self, key: str) -> str:
+        return os.path.join(self.cfg.cassette_dir or ".", f"{key}.json")
+
+    # ---- request handling ----
+    def handle(self, model: str, method: str, query: str, body: Dict[str, Any]) -> Tuple[int, str, List[Tuple[float, bytes]]]:
+        """Returns (status, content_type, [(delay_before_s, chunk), ...])."""
+        stream = method == "streamGenerateContent"
+        self._count("requests")
+        if stream:
+            self._count("stream_requests")
+
+        if self.cfg.mode == "record":
+            return self._record(model, method, query, body)
+
+        with self._rnd_lock:
+            delay = max(0.0, self._latency(self.rnd))
+        r = self._rand()
+        if r < self.cfg.rate_429:
+            self._count("injected_429")
+            return 429, "application/json", [(delay, b'{"error":{"code":429,"status":"RESOURCE_EXHAUSTED"}}')]
+        if r < self.cfg.rate_429 + self.cfg.rate_5xx:
+            self._count("injected_5xx")
+            return 503, "application/json", [(delay, b'{"error":{"code":503,"status":"UNAVAILABLE"}}')]
+
+        structured = "responseSchema" in (body.get("generationConfig") or {})
+        if structured and self.cfg.reject_schema:
+            return 400, "application/json", [(delay, b'{"error":{"code":400,"status":"INVALID_ARGUMENT","message":"responseSchema not supported"}}')]
+
+        prompt = _prompt_of(body)
+        cached_chars = 0
+        if body.get("cachedContent"):
+            with self._stats_lock:
+                ctx = self._contexts.get(body["cachedContent"])
+            if ctx is None or ctx[1] < time.time():
+                return 404, "application/json", [(delay, b'{"error":{"code":404,"status":"NOT_FOUND","message":"cachedContent not found"}}')]
+            self._count("context_hits")
+            cached_chars = len(ctx[0])
+            prompt = ctx[0] + prompt
+        recorded: Optional[Dict[str, Any]] = None
+        if self.cfg.mode == "replay":
+            path = self._cassette_path(cassette_key(model, method, body))
+            if os.path.exists(path):
+                self._count("cassette_hits")
+                with open(path, "r", encoding="utf-8") as f:
+                    cassette = json.load(f)
+                text = cassette["text"]
+                if self.cfg.replay_timing and cassette.get("elapsed_s") is not None:
+                    recorded = cassette
+            else:
+                self._count("cassette_misses")
+                if self.cfg.replay_miss != "synth":
+                    return 404, "application/json", [(0.0, b'{"error":{"code":404,"status":"NOT_FOUND","message":"no cassette"}}')]
+                text = self._synth_text(prompt, structured)
+        else:
+            text = self._synth_text(prompt, structured)
+
+        # delay is the whole response time; a stream's first chunk comes gen seconds before the end
+        if recorded is not None:
+            delay = float(recorded["elapsed_s"])
+            gen = max(0.0, delay - float(recorded.get("first_chunk_s", delay)))
+        else:
+            gen = (len(text) / self.cfg.chars_per_sec) if self.cfg.chars_per_sec > 0 else 0.0
+            delay += gen
+        if not stream:
+            data = json.dumps(_response_json(text, len(prompt), cached_chars=cached_chars), ensure_ascii=False).encode("utf-8")
+            return 200, "application/json", [(delay, data)]
+
+        # SSE: first chunk after the latency, the rest spread over the generation time
+        n = max(1, min(self.cfg.stream_chunks, len(text)))
+        step = -(-len(text) // n)
+        pieces = [text[i:i + step] for i in range(0, len(text), step)] or [""]
+        out: List[Tuple[float, bytes]] = []
+        for k, piece in enumerate(pieces):
+            last = k == len(pieces) - 1
+            ev = _response_json(piece, len(prompt), "STOP" if last else None, cached_chars=cached_chars)
+            if not last:
+                ev.pop("usageMetadata")
+            wait = (delay - gen) if k == 0 else gen / (len(pieces) - 1)
+            out.append((max(0.0, wait), ("data: " + json.dumps(ev, ensure_ascii=False) + "\r\n\r\n").encode("utf-8")))
+        return 200, "text/event-stream", out
+
+    def handle_cache(self, verb: str, name: str, query: str, body: Dict[str, Any]) -> Tuple[int, bytes]:
+        """cachedContents create (POST), TTL update (PATCH) and delete (DELETE)."""
+        if self.cfg.mode == "record":
+            return 404, b'{"error":{"code":404,"status":"NOT_FOUND","message":"context caching is not recorded"}}'
+        ttl = float(str(body.get("ttl") or "3600s").rstrip("s") or 3600)
+        with self._stats_lock:
+            if verb == "POST" and name == "cachedContents":
+                text = _prompt_of(body)
+                if len(text) // 4 < self.cfg.cache_min_tokens:
+                    return 400, b'{"error":{"code":400,"status":"INVALID_ARGUMENT","message":"cached content is too small"}}'
+                self._ctx_seq += 1
+                name = f"cachedContents/stub{self._ctx_seq}"
+                self._contexts[name] = (text, time.time() + ttl)
+                self.stats["contexts_created"] += 1
+            elif name not in self._contexts:
+                return 404, b'{"error":{"code":404,"status":"NOT_FOUND"}}'
+            elif verb == "PATCH":
+                self._contexts[name] = (self._contexts[name][0], time.time() + ttl)
+                self.stats["contexts_refreshed"] += 1
+            elif verb == "DELETE":
+                del self._contexts[name]
+                return 200, b"{}"
+            else:
+                return 405, b'{"error":{"code":405}}'
+            expires = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self._contexts[name][1]))
+        return 200, json.dumps({"name": name, "expireTime": expires}).encode("utf-8")
+
+    def _synth_text(self, prompt: str, structured: bool = False) -> str:
+        arr = synth_answer(prompt)
+        if self.cfg.drop_rate > 0 and arr:
+            kept = [o for o in arr if self._rand() >= self.cfg.drop_rate]
+            self._count("dropped_items", len(arr) - len(kept))
+            arr = kept
+        if self.cfg.reorder_rate > 0 and len(arr) > 1 and self._rand() < self.cfg.reorder_rate:
+            with self._rnd_lock:
+                self.rnd.shuffle(arr)
+            self._count("reordered")
+        text = json.dumps(arr, ensure_ascii=False)
+        if not structured and self.cfg.malformed_rate > 0 and self._rand() < self.cfg.malformed_rate:
+            with self._rnd_lock:
+                cut = self.rnd.randint(1, max(1, len(text) - 1))
+            self._count("malformed")
+            text = text[:cut]
+        return text
+
+    def _record(self, model: str, method: str, query: str, body: Dict[str, Any]) -> Tuple[int, str, List[Tuple[float, bytes]]]:
+        url = f"{self.cfg.upstream.rstrip('/')}/v1beta/models/{model}:{method}" + (f"?{query}" if query else "")
+        t0 = time.time()
+        first_chunk_s = None
+        with requests.post(url, json=body, headers={"Content-Type": "application/json"}, timeout=120, stream=True) as resp:
+            content = b""
+            for chunk in resp.iter_content(chunk_size=None):
+                if first_chunk_s is None:
+                    first_chunk_s = round(time.time() - t0, 3)
+                content += chunk
+        elapsed_s = round(time.time() - t0, 3)
+        ctype = resp.headers.get("Content-Type", "application/json")
+        if resp.status_code == 200:
+            if method == "streamGenerateContent":
+                text = ""
+                for line in content.decode("utf-8").splitlines():
+                    if line.startswith("data:"):
+                        cand = (json.loads(line[5:].strip()).get("candidates") or [{}])[0]
+                        text += "".join(p.get("text", "") for p in (cand.get("content") or {}).get("parts") or [])
+            else:
+                text = json.loads(content)["candidates"][0]["content"]["parts"][0]["text"]
+            cassette = {"model": model, "method": method, "elapsed_s": elapsed_s, "request": body, "text": text}
+            if method == "streamGenerateContent":
+                cassette["first_chunk_s"] = first_chunk_s if first_chunk_s is not None else elapsed_s
+            key = cassette_key(model, method, body)
+            with open(self._cassette_path(key), "w", encoding="utf-8") as f:
+                json.dump(cassette, f, ensure_ascii=False, indent=2)
+            self._count("recorded")
+        return resp.status_code, ctype, [(0.0, content)]
+
+def _make_handler(stub: GeminiStub):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, fmt, *args):  # keep stdout quiet; use the pipeline logger
+            stub.logger.debug("stub: " + fmt % args)
+
+        def _send(self, status: int, ctype: str, chunks: List[Tuple[float, bytes]]) -> None:
+            streaming = ctype.startswith("text/event-stream")
+            if not streaming and chunks:
+                time.sleep(chunks[0][0])
+            self.send_response(status)
+            self.send_header("Content-Type", ctype)
+            if streaming:
+                self.send_header("Transfer-Encoding", "chunked")
+            else:
+                self.send_header("Content-Length", str(sum(len(c) for _, c in chunks)))
+            self.end_headers()
+            for wait, data in chunks:
+                if streaming:
+                    time.sleep(wait)
+                    self.wfile.write(f"{len(data):X}\r\n".encode() + data + b"\r\n")
+                    self.wfile.flush()
+                else:
+                    self.wfile.write(data)
+            if streaming:
+                self.wfile.write(b"0\r\n\r\n")
+
+        def do_GET(self):
+            if urlsplit(self.path).path == "/stats":
+                with stub._stats_lock:
+                    data = json.dumps(stub.stats).encode("utf-8")
+                self._send(200, "application/json", [(0.0, data)])
+            else:
+                self._send(404, "application/json", [(0.0, b'{"error":{"code":404}}')])
+
+        def _cache_call(self, verb: str) -> bool:
+            parts = urlsplit(self.path)
+            m = CACHE_PATH_RE.match(parts.path)
+            if not m:
+                return False
+            n = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(n) if n else b""
+            try:
+                body = json.loads(raw.decode("utf-8") or "{}")
+            except Exception:
+                body = {}
+            status, data = stub.handle_cache(verb, m.group("name"), parts.query, body)
+            self._send(status, "application/json", [(0.0, data)])
+            return True
+
+        def do_PATCH(self):
+            if not self._cache_call("PATCH"):
+                self._send(404, "application/json", [(0.0, b'{"error":{"code":404}}')])
+
+        def do_DELETE(self):
+            if not self._cache_call("DELETE"):
+                self._send(404, "application/json", [(0.0, b'{"error":{"code":404}}')])
+
+        def do_POST(self):
+            if self._cache_call("POST"):
+                return
+            parts = urlsplit(self.path)
+            n = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(n) if n else b""
+            m = PATH_RE.match(parts.path)
+            if not m:
+                self._send(404, "application/json", [(0.0, b'{"error":{"code":404}}')])
+                return
+            try:
+                body = json.loads(raw.decode("utf-8") or "{}")
+            except Exception:
+                self._send(400, "application/json", [(0.0, b'{"error":{"code":400,"status":"INVALID_ARGUMENT"}}')])
+                return
+            try:
+                status, ctype, chunks = stub.handle(m.group("model"), m.group("method"), parts.query, body)
+            except Exception as e:
+                stub.logger.error(f"Stub failed: {e}")
+                status, ctype, chunks = 500, "application/json", [(0.0, b'{"error":{"code":500}}')]
+            self._send(status, ctype, chunks)
+
+    return Handler
+
+def start_stub_server(cfg: StubConfig, logger: Optional[logging.Logger] = None) -> Tuple[ThreadingHTTPServer, GeminiStub]:
+    """Starts the stub on a daemon thread; returns (server, stub). server.server_address has the bound port."""
+    stub = GeminiStub(cfg, logger)
+    server = ThreadingHTTPServer((cfg.host, cfg.port), _make_handler(stub))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="gemini-stub", daemon=True).start()
+    return server, stub
+
+def serve(cfg: StubConfig, logger: Optional[logging.Logger] = None) -> None:
+    logger = logger or logging.getLogger("i18n-seed")
+    stub = GeminiStub(cfg, logger)
+    server = ThreadingHTTPServer((cfg.host, cfg.port), _make_handler(stub))
+    server.daemon_threads = True
+    host, port = server.server_address[:2]
+    logger.info(f"Gemini stub ({cfg.mode}) listening on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        logger.info(f"Gemini stub stats: {json.dumps(stub.stats)}")
@@ -0,0 +1,64 @@
+"""
+Aligning an existing localized seed with its English source (`i18n-seed ingest-localized`).
+
+Both seeds are extracted with the same schema, so a cell is identified by its occurrence key
+in either file. The English value is placeholder-locked as in a translate run; the localized
+value is locked with the same tokens by finding the original placeholder texts in it. The
+resulting locked pairs are exactly the cache entries a translate run would look up.
+"""
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .placeholder_lock import PlaceholderLocker
+
+def relock_localized(localized: str, mapping: Dict[str, str]) -> Optional[str]:
+    """
+    Replaces the placeholder originals of `mapping` (token -> original) in a localized string
+    by their tokens; None when one of them is missing (the translation changed a placeholder).
+    """
+    parts: List[Tuple[str, bool]] = [(localized, False)]  # (text, is_token)
+    # longest originals first so "10" is not taken out of "100"; equal ones keep token order
+    order = sorted(mapping.items(), key=lambda kv: (-len(kv[1]), int(kv[0][4:-2])))
+    for token, original in order:
+        for i, (text, is_token) in enumerate(parts):
+            if not is_token and original in text:
+                before, _, after = text.partition(original)
+                parts[i:i + 1] = [(before, False), (token, True), (after, False)]
+                break
+        else:
+            return None
+    return "".join(text for text, _ in parts)
+
+def align_localized(en_items, loc_items, placeholder_patterns, *,
+                    keep_identical: bool = False) -> Tuple[Dict[str, str], Dict[str, Any]]:
+    """
+    Pairs the cells of two extractions by occurrence key: locked English source -> locked
+    localized text. Cells left in English are skipped unless `keep_identical`; a source
+    localized differently in several cells gets its most common rendering.
+    """
+    loc_by_occ = {it.occurrence_key(): it.value for it in loc_items}
+    locker = PlaceholderLocker(placeholder_patterns)
+    candidates: Dict[str, Counter] = defaultdict(Counter)
+    stats = {"en_cells": len(en_items), "localized_cells": len(loc_by_occ), "aligned": 0,
+             "missing": 0, "identical": 0, "placeholder_mismatch": 0}
+    for it in en_items:
+        localized = loc_by_occ.get(it.occurrence_key())
+        if localized is None:
+            stats["missing"] += 1
+            continue
+        if localized == it.value and not keep_identical:
+            stats["identical"] += 1
+            continue
+        locked, mapping = locker.lock(it.value)
+        target = relock_localized(localized, mapping) if mapping else localized
+        if target is None:
+            stats["placeholder_mismatch"] += 1
+            continue
+        candidates[locked][target] += 1
+        stats["aligned"] += 1
+    pairs = {src: counts.most_common(1)[0][0] for src, counts in candidates.items()}
+    stats["sources"] = len(pairs)
+    stats["conflicts"] = sum(1 for counts in candidates.values() if len(counts) > 1)
+    return pairs, stats
@@ -55,13 +55,48 @@
 # i18n_seed/placeholder_lock.py
 from __future__ import annotations
 import re
-from typing import Tuple, Dict, List
+from collections import OrderedDict
+from typing import Tuple, Dict, List, Optional
 
-def lock_placeholders(s: str, extra_patterns: List[re.Pattern]) -> Tuple[str, Dict[str, str]]:
+_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"), (re.ASCII, "a"))
+_BACKREF_RE = re.compile(r"\\[1-9]|\(\?P=")
+_TOKEN_RE = re.compile(r"__PH\d+__")
+
+def _combine(patterns: Tuple[re.Pattern, ...]) -> Optional[Tuple[re.Pattern, List[int]]]:
     """
-    Replace substrings matching any of the provided regex patterns with __PH{n}__ tokens.
-    Returns (locked_text, mapping).
+    One alternation of `patterns`, in order, with a group around each pattern (flags kept as
+    scoped inline flags), and the pattern index of each group number. None when a pattern
+    cannot be embedded (bytes, backreferences).
     """
+    parts, pattern_of = [], [-1]
+    for i, pat in enumerate(patterns):
+        if not isinstance(pat.pattern, str) or _BACKREF_RE.search(pat.pattern):
+            return None
+        flags = "".join(c for f, c in _INLINE_FLAGS if pat.flags & f)
+        if flags:
+            # newline: a trailing comment of a VERBOSE pattern must not swallow the ")"
+            body = f"(?{flags}:{pat.pattern}" + ("\n)" if "x" in flags else ")")
+        else:
+            body = pat.pattern
+        parts.append(f"({body})")
+        pattern_of += [i] * (1 + pat.groups)
+    return re.compile("|".join(parts)), pattern_of
+
+# id(pattern list) -> (the list, its patterns when compiled, combined pattern or None)
+_COMBINED: Dict[int, Tuple[list, tuple, Optional[Tuple[re.Pattern, List[int]]]]] = {}
+
+def _combined_for(patterns) -> Optional[Tuple[re.Pattern, List[int]]]:
+    # profiles pass the same list for every string; hashing the patterns on each call would cost more than the lookup saves
+    entry = _COMBINED.get(id(patterns))
+    snapshot = tuple(patterns)
+    if entry is None or entry[0] is not patterns or entry[1] != snapshot:
+        if len(_COMBINED) >= 64:
+            _COMBINED.clear()
+        entry = _COMBINED[id(patterns)] = (patterns, snapshot, _combine(snapshot))
+    return entry[2]
+
+def _lock_sequential(s: str, patterns) -> Tuple[str, Dict[str, str]]:
+    # one pat.sub pass per pattern over the partly locked string
     mapping: Dict[str, str] = {}
     idx = 0
 
@@ -74,12 +109,109 @@ def lock_placeholders(s: str, extra_patterns: List[re.Pattern]) -> Tuple[str, Di
         return key
 
     locked = s
-    for pat in extra_patterns or []:
+    for pat in patterns:
         locked = pat.sub(_sub_fn, locked)
     return locked, mapping
 
+def lock_placeholders(s: str, extra_patterns: List[re.Pattern]) -> Tuple[str, Dict[str, str]]:
+    """
+    Replace substrings matching any of the provided regex patterns with __PH{n}__ tokens.
+    Returns (locked_text, mapping).
+
+    The patterns run as one compiled alternation in a single pass: at each position the
+    first pattern (in list order) that matches wins, and tokens are never matched again.
+    Tokens are numbered pattern by pattern, then left to right, so strings whose matches
+    do not overlap lock exactly as with one substitution pass per pattern.
+    """
+    if not extra_patterns:
+        return s, {}
+    combined = _combined_for(extra_patterns)
+    if combined is None:
+        return _lock_sequential(s, extra_patterns)
+    regex, pattern_of = combined
+    m = regex.search(s)
+    if m is None:
+        return s, {}
+    matches = []
+    while m is not None:
+        start, end = m.span()
+        matches.append((pattern_of[m.lastindex], start, end))
+        if end == start and end == len(s):
+            break
+        m = regex.search(s, end if end > start else end + 1)
+    if len(matches) == 1:
+        _, start, end = matches[0]
+        return f"{s[:start]}__PH0__{s[end:]}", {"__PH0__": s[start:end]}
+    ordered = sorted(matches)  # (pattern, start): the sequential numbering
+    number = {(start, end): n for n, (_, start, end) in enumerate(ordered)}
+    mapping = {f"__PH{n}__": s[start:end] for n, (_, start, end) in enumerate(ordered)}
+    out: List[str] = []
+    pos = 0
+    for _, start, end in matches:
+        out.append(s[pos:start])
+        out.append(f"__PH{number[start, end]}__")
+        pos = end
+    out.append(s[pos:])
+    return "".join(out), mapping
+
+class PlaceholderLocker:
+    """
+    lock_placeholders() memoized per distinct value, for seeds where the same text fills
+    thousands of cells (brands, statuses, repeated titles). Equal values share one
+    (locked, mapping) tuple, so callers must not modify the mapping. At most `max_entries`
+    values are kept, least recently used first out.
+    """
+
+    def __init__(self, patterns: List[re.Pattern], max_entries: int = 200_000) -> None:
+        self.patterns = patterns
+        self.max_entries = max_entries
+        self._memo: "OrderedDict[str, Tuple[str, Dict[str, str]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lock(self, value: str) -> Tuple[str, Dict[str, str]]:
+        pair = self._memo.get(value)
+        if pair is not None:
+            self._memo.move_to_end(value)
+            self.hits += 1
+            return pair
+        self.misses += 1
+        pair = self._memo[value] = lock_placeholders(value, self.patterns)
+        if len(self._memo) > self.max_entries:
+            self._memo.popitem(last=False)
+        return pair
+
+class PlaceholderUnlocker:
+    """
+    unlock_placeholders() memoized per (locked translation, mapping identity), one instance
+    per locale: occurrences sharing a PlaceholderLocker pair are unlocked once. At most
+    `max_entries` results are kept, least recently used first out.
+    """
+
+    def __init__(self, max_entries: int = 200_000) -> None:
+        self.max_entries = max_entries
+        # (s, id(mapping)) -> (mapping, unlocked); the mapping is kept so its id stays unique
+        self._memo: "OrderedDict[Tuple[str, int], Tuple[Dict[str, str], str]]" = OrderedDict()
+
+    def unlock(self, s: str, mapping: Dict[str, str]) -> str:
+        if not mapping:
+            return s
+        key = (s, id(mapping))
+        hit = self._memo.get(key)
+        if hit is not None and hit[0] is mapping:
+            self._memo.move_to_end(key)
+            return hit[1]
+        out = unlock_placeholders(s, mapping)
+        self._memo[key] = (mapping, out)
+        if len(self._memo) > self.max_entries:
+            self._memo.popitem(last=False)
+        return out
+
 def unlock_placeholders(s: str, mapping: Dict[str, str]) -> str:
-    # Replace longer keys first to avoid partial collisions
-    for k in sorted(mapping.keys(), key=lambda x: -len(x)):
-        s = s.replace(k, mapping[k])
-    return s
\ No newline at end of file
+    # one pass over the __PHn__ tokens; tokens missing from the mapping are left as they are
+    if not mapping or "__PH" not in s:
+        return s
+    if len(mapping) == 1:
+        (token, original), = mapping.items()
+        return s.replace(token, original)
+    return _TOKEN_RE.sub(lambda m: mapping.get(m.group(0), m.group(0)), s)
\ No newline at end of file
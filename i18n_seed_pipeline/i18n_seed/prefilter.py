@@ -0,0 +1,145 @@
+"""
+Local prefilter between placeholder locking and batching.
+
+Every locked source string is classified as
+  * pass-through: nothing to translate (NULL, numbers, URLs, e-mails, codes / identifiers,
+    values of identifier-like columns); the target is the source itself,
+  * dictionary: an enum value the domain profile already maps for the locale
+    (`map_values` in json_overrides_by_locale); the target is the profile's value,
+  * model: everything else, sent to the translator as before.
+
+Classification is regex + character-class statistics per string and a cardinality check
+per column: a column whose values are (nearly) all distinct single tokens is an identifier
+column, its whitespace-free values are passed through. All-caps words such as SHOES or
+PENDING are *not* passed through on their own, since profiles ask for product types and
+statuses to be translated; they go to the dictionary or to the model.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
+
+_PH_RE = re.compile(r"__PH\d+__")
+_NULL_WORDS = {"null", "none", "nil", "n/a", "true", "false", "undefined", "nan"}
+_URL_RE = re.compile(r"^(?:[a-z][a-z0-9+.-]*://|www\.)\S+$", re.IGNORECASE)
+_EMAIL_RE = re.compile(r"^[\w.+-]+@[\w-]+(?:\.[\w-]+)+$")
+_UUID_RE = re.compile(r"^[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}$", re.IGNORECASE)
+_HEX_RE = re.compile(r"^(?:0x)?[0-9a-f]{12,}$", re.IGNORECASE)
+# snake_case / dotted keys, e.g. post_product_pricing, feed.v2 (plain hyphenated words like t-shirt are not keys)
+_KEY_RE = re.compile(r"^[a-z0-9-]+(?:[_.:][a-z0-9-]+)+$")
+_TOKEN_CHARS_RE = re.compile(r"^[\w.:/#@+-]+$")
+
+def classify_text(s: str) -> Optional[str]:
+    """Reason why `s` needs no translation, or None."""
+    t = s.strip()
+    if not t:
+        return "empty"
+    if t.lower() in _NULL_WORDS:
+        return "null"
+    bare = _PH_RE.sub(" ", t)
+    if not any(ch.isalpha() for ch in bare):
+        return "no_letters"
+    if " " in t:
+        return None
+    if _URL_RE.match(t):
+        return "url"
+    if _EMAIL_RE.match(t):
+        return "email"
+    if _UUID_RE.match(t) or _HEX_RE.match(t) or _KEY_RE.match(t):
+        return "identifier"
+    if _TOKEN_CHARS_RE.match(t):
+        letters = sum(ch.isalpha() for ch in t)
+        digits = sum(ch.isdigit() for ch in t)
+        # mostly digits / mixed code tokens (SKU-like): B07XJ8C8F5, pricing-3-0210, X-200-B
+        if digits and (digits >= letters or (digits >= 2 and any(ch in "-_" for ch in t))):
+            return "identifier"
+    return None
+
+def find_code_columns(col_values: Dict[str, List[str]], min_values: int = 20,
+                      min_distinct_ratio: float = 0.9, min_token_ratio: float = 0.95) -> Set[str]:
+    """
+    "table.column" keys whose values look like identifiers: at least `min_values` occurrences,
+    nearly all distinct, and nearly all single tokens containing a digit or a separator.
+    """
+    out: Set[str] = set()
+    for col, values in col_values.items():
+        distinct = set(values)
+        if len(values) < min_values or len(distinct) / len(values) < min_distinct_ratio:
+            continue
+        coded = [v for v in distinct if v.strip() and not any(ch.isspace() for ch in v.strip())
+                 and any(ch.isdigit() or ch in "-_:/." for ch in v)]
+        if len(coded) / len(distinct) >= min_token_ratio:
+            out.add(col)
+    return out
+
+@dataclass
+class PrefilterPlan:
+    passthrough: Dict[str, str] = field(default_factory=dict)  # source -> reason
+    code_columns: Set[str] = field(default_factory=set)
+
+    def report(self) -> Dict[str, object]:
+        reasons: Dict[str, int] = {}
+        for r in self.passthrough.values():
+            reasons[r] = reasons.get(r, 0) + 1
+        return {
+            "pass_strings": len(self.passthrough),
+            "pass_chars": sum(len(s) for s in self.passthrough),
+            "by_reason": dict(sorted(reasons.items())),
+            "code_columns": sorted(self.code_columns),
+        }
+
+def plan_prefilter(sources: Iterable[str], src_columns: Dict[str, List[str]],
+                   col_values: Dict[str, List[str]]) -> PrefilterPlan:
+    """
+    Pass-through decisions (locale independent). src_columns maps a source to its
+    "table.column" keys, col_values a "table.column" key to all its values (one per occurrence).
+    """
+    plan = PrefilterPlan(code_columns=find_code_columns(col_values))
+    for s in sources:
+        reason = classify_text(s)
+        if reason is None and not any(ch.isspace() for ch in s.strip()):
+            cols = src_columns.get(s) or []
+            if cols and all(c in plan.code_columns for c in cols):
+                reason = "code_column"
+        if reason:
+            plan.passthrough[s] = reason
+    return plan
+
+def _norm_enum(s: str) -> str:
+    # same normalisation as the reinjector's map_values lookup (PendingAvailability == PENDING_AVAILABILITY)
+    s = re.sub(r"(?<=[a-z])(?=[A-Z])", " ", s or "")
+    s = re.sub(r"[_\-]+", " ", s)
+    return re.sub(r"\s+", " ", s).strip().casefold()
+
+class ProfileDictionary:
+    """map_values of a profile's scalar overrides for one locale, looked up by "table.column"."""
+
+    def __init__(self, rules: List[dict]) -> None:
+        self._rules = []
+        for r in rules or []:
+            mv = r.get("map_values")
+            if isinstance(mv, dict) and not r.get("json_path"):
+                self._rules.append((r.get("table"), r.get("column"), mv, {_norm_enum(k): v for k, v in mv.items()}))
+
+    def lookup(self, table_column: str, value: str) -> Optional[str]:
+        table, _, column = table_column.partition(".")
+        table = table.strip().strip('`"[]')
+        for t, c, mv, mv_norm in self._rules:
+            if t not in (None, "*", table) or c not in (None, "*", column):
+                continue
+            if value in mv:
+                return str(mv[value])
+            key = _norm_enum(value)
+            if key in mv_norm:
+                return str(mv_norm[key])
+        return None
+
+    def translate(self, source: str, columns: List[str]) -> Optional[str]:
+        """Dictionary target when every column of the source maps it to the same value."""
+        if not self._rules or not columns or _PH_RE.search(source):
+            return None
+        targets = {self.lookup(c, source) for c in columns}
+        if len(targets) != 1:
+            return None
+        return targets.pop()
@@ -19,8 +19,55 @@
 # i18n_seed/profiles/__init__.py
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict, Set, List, Callable
-import re
+from functools import partial
+from importlib import import_module
+from typing import Any, Dict, Set, List, Callable, Iterator, Mapping, Optional, Tuple
+import os, re, json
+
+# per-locale profile data: data/<profile id>/<locale>.json
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+_LOCALE_FILES: Dict[str, dict] = {}  # path -> parsed file, for the locales in use
+
+class LocaleData(Mapping):
+    """
+    Read-only locale -> data mapping whose values are built by per-locale loaders on first
+    access and then kept, so a run only pays for the locales it asks for.
+    """
+
+    def __init__(self, loaders: Dict[str, Callable[[], Any]]) -> None:
+        self._loaders = loaders
+        self._data: Dict[str, Any] = {}
+
+    def __getitem__(self, locale: str) -> Any:
+        if locale not in self._data:
+            self._data[locale] = self._loaders[locale]()
+        return self._data[locale]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._loaders)
+
+    def __len__(self) -> int:
+        return len(self._loaders)
+
+    def loaded(self) -> List[str]:
+        return list(self._data)
+
+def load_locale_file(path: str) -> dict:
+    """A parsed locale data file, loaded once per process."""
+    data = _LOCALE_FILES.get(path)
+    if data is None:
+        with open(path, "r", encoding="utf-8") as fh:
+            data = _LOCALE_FILES[path] = json.load(fh)
+    return data
+
+def _locale_file_entry(path: str, key: str) -> Any:
+    return load_locale_file(path).get(key, [])
+
+def locale_data_files(profile_id: str, key: str) -> LocaleData:
+    """LocaleData of the `key` entries of data/<profile_id>/<locale>.json, one file per locale."""
+    directory = os.path.join(DATA_DIR, profile_id)
+    names = sorted(n for n in os.listdir(directory) if n.endswith(".json")) if os.path.isdir(directory) else []
+    return LocaleData({n[:-5]: partial(_locale_file_entry, os.path.join(directory, n), key) for n in names})
 
 @dataclass
 class DomainProfile:
@@ -33,33 +80,46 @@ class DomainProfile:
     force_include_columns: Dict[str, Set[str]] = field(default_factory=dict)
     # JSON keys to consider “translatable” (merged into SchemaHints.json_string_keys)
     json_string_keys: Set[str] = field(default_factory=set)
-    # Locale-specific JSON overrides applied at reinjection time
-    json_overrides_by_locale: Dict[str, List[dict]] = field(default_factory=dict)
+    # Locale-specific JSON overrides applied at reinjection time (a dict or a lazy LocaleData)
+    json_overrides_by_locale: Mapping[str, List[dict]] = field(default_factory=dict)
     # Optional additional validators (callables)
     validators: List[Callable] = field(default_factory=list)
 
-# Import concrete profiles
-from .amazon import amazon_profile
-from .slack import slack_profile
-
-ALL_PROFILES: List[DomainProfile] = [
-    amazon_profile(),
-    slack_profile(),
+# Concrete profiles: id -> (module, factory). A profile's module is imported and the profile
+# built on first use, once per process; callers share it and must not modify it.
+PROFILE_FACTORIES: Dict[str, Tuple[str, str]] = {
+    "amazon": (".amazon", "amazon_profile"),
+    "slack": (".slack", "slack_profile"),
     # add more here
-]
+}
+_BUILT: Dict[str, DomainProfile] = {}
+
+def get_profile(profile_id: str) -> Optional[DomainProfile]:
+    """The registered profile `profile_id` (None if there is no such profile)."""
+    profile = _BUILT.get(profile_id)
+    if profile is None and profile_id in PROFILE_FACTORIES:
+        module, factory = PROFILE_FACTORIES[profile_id]
+        profile = _BUILT[profile_id] = getattr(import_module(module, __name__), factory)()
+    return profile
+
+def __getattr__(name: str):
+    # ALL_PROFILES builds every registered profile; prefer get_profile()
+    if name == "ALL_PROFILES":
+        return [get_profile(pid) for pid in PROFILE_FACTORIES]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def pick_profile(server_name: str, table_names: Set[str]) -> DomainProfile:
     # Simple heuristic: choose based on table names or server_name hints
     lnames = {t.lower() for t in table_names}
     if any(t.startswith("catalog_") or t in {"catalog_items", "listings_items", "orders"} for t in lnames):
-        return amazon_profile()
+        return get_profile("amazon")
 
     if any(t.startswith("slack_") or t in {"slack_users", "slack_messages"} for t in lnames):
-        return slack_profile()
+        return get_profile("slack")
 
     # fallback to Amazon if seed resembles ecommerce
     if "amazon" in (server_name or "").lower():
-        return amazon_profile()
+        return get_profile("amazon")
 
     # last resort: generic-ish Amazon—easy to extend later
-    return amazon_profile()
\ No newline at end of file
+    return get_profile("amazon")
\ No newline at end of file
@@ -1,6 +1,6 @@
 from __future__ import annotations
 import re, json, logging, random, hashlib, os
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Mapping, Optional, Tuple, Any
 
 from .utils import is_likely_json_string, sql_escape_single_quotes
 from .config import SchemaHints
@@ -299,7 +299,7 @@ def _address_pool(locale: str) -> List[Dict[str, str]]:
     ext = _load_external_pool(locale)
     if ext:
         return ext
-    if _BUILTIN_ADDRESS_POOLS and isinstance(_BUILTIN_ADDRESS_POOLS, dict):
+    if _BUILTIN_ADDRESS_POOLS and isinstance(_BUILTIN_ADDRESS_POOLS, Mapping):
         return _BUILTIN_ADDRESS_POOLS.get(locale, [])
     return []
 
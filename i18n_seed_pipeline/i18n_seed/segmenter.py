@@ -0,0 +1,67 @@
+"""
+Sentence segmentation for long free-text columns (descriptions).
+
+Descriptions repeat the same boilerplate sentences across many listings while the full text
+is almost always unique, so caching whole descriptions rarely hits. Splitting the (locked)
+text into sentences lets every sentence be deduped and cached on its own; the translated
+sentences are joined back with the original whitespace between them.
+
+Splitting is conservative: only after ., ! or ? followed by whitespace and an uppercase
+letter, digit or placeholder, or at line breaks, and never after common abbreviations or
+initials. A missed boundary only costs a cache hit.
+"""
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+_BOUNDARY_RE = re.compile(
+    r"[.!?]+[\"')\]]*(?P<gap>\s+)(?=[\"'(\[]?(?:[A-Z0-9]|__PH\d+__))"
+    r"|(?P<nl>[ \t]*\n\s*)"
+)
+_ABBREV = {
+    "mr", "mrs", "ms", "dr", "st", "no", "vs", "inc", "ltd", "co", "corp", "approx",
+    "e.g", "i.e", "etc", "fig", "vol", "u.s", "u.k", "jr", "sr", "dept", "est",
+}
+_LAST_WORD_RE = re.compile(r"([A-Za-z][A-Za-z.]*)\.$")
+
+def _ends_with_abbreviation(sentence: str) -> bool:
+    m = _LAST_WORD_RE.search(sentence)
+    if not m:
+        return False
+    word = m.group(1)
+    # initials ("J. Smith") and listed abbreviations
+    return len(word) == 1 and word.isupper() or word.lower() in _ABBREV
+
+def split_segments(text: str) -> List[Tuple[str, str]]:
+    """
+    [(sentence, whitespace after it)]; joining sentence + whitespace over the list gives
+    back `text` exactly. A text without boundaries is returned as a single segment.
+    """
+    parts: List[Tuple[str, str]] = []
+    start = 0
+    for m in _BOUNDARY_RE.finditer(text):
+        if m.group("gap") is not None:
+            end, gap = m.start("gap"), m.group("gap")
+            if _ends_with_abbreviation(text[start:end]):
+                continue
+        else:
+            end, gap = m.start(), m.group("nl")
+        if end <= start or not text[start:end].strip():
+            continue
+        parts.append((text[start:end], gap))
+        start = m.end()
+    tail = text[start:]
+    if tail or not parts:
+        parts.append((tail, ""))
+    return parts
+
+def join_segments(parts: List[Tuple[str, str]], translations: Dict[str, str]) -> Optional[str]:
+    """Reassembled translation, or None while a sentence is still untranslated."""
+    out = []
+    for sentence, gap in parts:
+        tgt = translations.get(sentence)
+        if tgt is None:
+            return None
+        out.append(tgt + gap)
+    return "".join(out)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import re, json
+from collections import Counter
 from typing import Dict, List, Tuple, Any, Optional
 
 from .config import SchemaHints
@@ -28,6 +29,12 @@ class ExtractedItem:
         jp = self.json_path or ""
         return f"{self.table}:{pk_str}:{self.column}:{jp}"
 
+    def field_key(self) -> str:
+        # table.column, plus the JSON path with array indices collapsed: catalog_items.sales_ranks:$[].category
+        if not self.json_path:
+            return f"{self.table}.{self.column}"
+        return f"{self.table}.{self.column}:" + re.sub(r"\[\d+\]", "[]", self.json_path)
+
 
 # ---------- robust SQL statement splitter (quote/comment/dollar aware) ----------
 
@@ -332,3 +339,11 @@ class SqlExtractor:
                         items.append(ExtractedItem(t_norm, pk_tuple, col, val, r_i))
 
         return items
+
+    @staticmethod
+    def column_stats(items: List[ExtractedItem]) -> Dict[str, Counter]:
+        """Per field (ExtractedItem.field_key) distinct values with their occurrence counts."""
+        stats: Dict[str, Counter] = {}
+        for it in items:
+            stats.setdefault(it.field_key(), Counter())[it.value] += 1
+        return stats
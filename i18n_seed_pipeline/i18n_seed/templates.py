@@ -0,0 +1,90 @@
+"""
+Template-level dedupe of near-identical strings.
+
+Seed data repeats the same wording with different numbers and model codes ("Order #123
+shipped", "Order #124 shipped"; "Nike Hoodie Pro 2", "Nike Hoodie Pro 3"). Those values are
+masked into slot tokens (__V0__, __V1__, ...) so the strings collapse to one template; the
+template is translated once and every member is rebuilt locally by putting its own values
+back into the translated template.
+
+Only uppercase/numeric codes and integers are masked. Anything that might be reworded by a
+translation is left alone, and such strings translate individually as before: decimals, which
+are written differently per locale; ordinals; and lowercase unit suffixes like "10oz" or
+"2-pack". The same goes for strings without any words left to translate, and for templates
+whose translation does not keep every slot exactly once.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+SLOT_FMT = "__V{}__"
+SLOT_RE = re.compile(r"__V(\d+)__")
+# locked placeholders are matched first so their digits are never masked
+_TOKEN_RE = re.compile(r"__PH\d+__|\b(?:[A-Z]+-?)?\d+[A-Z0-9]*(?:-[A-Z0-9]+)*\b")
+_UNCERTAIN_RE = re.compile(r"\d[.,]\d|\b\d+(?:st|nd|rd|th)\b|(?-i:\d-?[a-z])|__V\d+__", re.IGNORECASE)
+_WORD_RE = re.compile(r"[^\W\d_]{2,}")
+
+def extract_template(s: str) -> Optional[Tuple[str, List[str]]]:
+    """(template, slot values) or None when the string should be translated as is."""
+    if not s or _UNCERTAIN_RE.search(s):
+        return None
+    slots: List[str] = []
+
+    def mask(m: "re.Match[str]") -> str:
+        tok = m.group(0)
+        if tok.startswith("__PH"):
+            return tok
+        slots.append(tok)
+        return SLOT_FMT.format(len(slots) - 1)
+
+    template = _TOKEN_RE.sub(mask, s)
+    if not slots:
+        return None
+    # nothing left to translate once values and placeholders are gone
+    if not _WORD_RE.search(re.sub(r"__(?:PH|V)\d+__", " ", template)):
+        return None
+    return template, slots
+
+def fill_template(translated: str, slots: List[str]) -> Optional[str]:
+    """Puts slot values back; None unless every slot appears exactly once (and no others)."""
+    found = SLOT_RE.findall(translated or "")
+    if sorted(int(k) for k in found) != list(range(len(slots))):
+        return None
+    return SLOT_RE.sub(lambda m: slots[int(m.group(1))], translated)
+
+@dataclass
+class TemplatePlan:
+    # template -> [(source, slot values)], only for templates shared by >= min_members sources
+    clusters: Dict[str, List[Tuple[str, List[str]]]] = field(default_factory=dict)
+    singles: List[str] = field(default_factory=list)
+
+    @property
+    def covered(self) -> int:
+        return sum(len(m) for m in self.clusters.values())
+
+    def describe(self) -> str:
+        return (f"{self.covered} string(s) -> {len(self.clusters)} template(s), "
+                f"{len(self.singles)} translated individually")
+
+def cluster_templates(sources: List[str], min_members: int = 2) -> TemplatePlan:
+    """Groups sources by template; order of clusters and singles follows the input."""
+    by_tpl: Dict[str, List[Tuple[str, List[str]]]] = {}
+    order: List[Tuple[str, Optional[str]]] = []
+    for s in sources:
+        ext = extract_template(s)
+        if ext is None:
+            order.append((s, None))
+            continue
+        tpl, slots = ext
+        by_tpl.setdefault(tpl, []).append((s, slots))
+        order.append((s, tpl))
+
+    plan = TemplatePlan()
+    for s, tpl in order:
+        if tpl is not None and len(by_tpl[tpl]) >= min_members:
+            plan.clusters.setdefault(tpl, by_tpl[tpl])
+        else:
+            plan.singles.append(s)
+    return plan
@@ -1,7 +1,33 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, List, Optional
 
 class Translator(ABC):
+    @property
+    def cache_namespace(self) -> str:
+        """Cache namespace of this translator's output (provider, model, prompt/rules version)."""
+        return type(self).__name__
+
+    @property
+    def enum_cache_namespace(self) -> str:
+        """Cache namespace of translate_enum output (a different prompt than translate_batch)."""
+        return f"{self.cache_namespace}:enum"
+
     @abstractmethod
     def translate_batch(self, src_texts: List[str], target_locale: str) -> List[str]:
         ...
+
+    def translate_batch_multi(self, src_texts: List[str], target_locales: List[str]) -> Dict[str, List[Optional[str]]]:
+        """
+        Translate the same batch into several locales. Returns locale -> translations aligned
+        with src_texts; None marks an item the provider did not return for that locale.
+        Providers without a native multi-locale request simply loop over translate_batch.
+        """
+        return {loc: list(self.translate_batch(src_texts, loc)) for loc in target_locales}
+
+    def translate_enum(self, values: List[str], fields: List[str], target_locale: str) -> List[Optional[str]]:
+        """
+        Translate the distinct values of low-cardinality columns (fields[i] names the column(s)
+        of values[i], comma-separated, as context). None marks a value the provider did not return. Providers
+        without a dedicated enum prompt use translate_batch.
+        """
+        return list(self.translate_batch(values, target_locale))
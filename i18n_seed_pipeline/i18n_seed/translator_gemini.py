@@ -330,13 +330,18 @@
 
 # i18n_seed/translator_gemini.py
 from __future__ import annotations
-import os, time, json, logging, random
-from typing import List, Dict, Any
+import os, time, json, hashlib, logging, random, threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Callable, Iterator, Tuple
 import requests
 
 from .translator_base import Translator
+from .context_cache import GeminiContextCache
 
-GEMINI_URL_TEMPLATE = "https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
+# GEMINI_API_BASE (or --llm-endpoint) points the translator at another host, e.g. the local stub in gemini_stub.py
+GEMINI_API_BASE = "https://generativelanguage.googleapis.com"
+GEMINI_URL_TEMPLATE = "{base}/v1beta/models/{model}:generateContent"
+GEMINI_STREAM_URL_TEMPLATE = "{base}/v1beta/models/{model}:streamGenerateContent"
 
 # Double all literal braces; only {lang_label}, {locale}, {payload}, {domain_rules} are formatting slots.
 # PROMPT_TEMPLATE = (
@@ -406,6 +411,68 @@ LANG_LABELS = {
     "sv_SE": "Swedish", "nb_NO": "Norwegian (Bokmal)", "da_DK": "Danish",
 }
 
+# Multi-locale fan-out: one request returns every target locale of an item at once.
+# Only {targets}, {example}, {locale_keys} and {payload} are formatting slots.
+PROMPT_MULTI_TEMPLATE = (
+    "# You are a professional software localization specialist.\n"
+    "# Translate the following english items into EACH of these locales: {targets}.\n"
+    "# STRICT RULES:\n"
+    "- Do NOT translate codes/identifiers: AFN, MFN, FBA, FBM, SKUs, marketplace IDs, emails, URLs, %s, "
+    "- Preserve placeholders exactly: __PH0__, __PH1__, URLs, emails, SKUs, marketplace IDs, %s, %(name)s, "
+    "- MUST TRANSLATE title and item name for example translating `Nike Running Shoes 300` to french should be `Chaussures de course Nike 300`\n"
+    "- Translate PRODUCT TYPES for example if french [\"SHOES\"] should be [\"CHAUSSURES\"] preserving the format\n"
+    "- Preserve the source text's casing and separators EXACTLY\n"
+    "- Do NOT add/remove/reorder items.\n"
+    "- Output MUST be a JSON array of objects like: [{{\"i\": 0, \"t\": {example}}}, ...]\n"
+    "- Every \"t\" MUST be an object with exactly these keys: {locale_keys}\n"
+    "INPUT JSON (array of objects with keys {{\"i\"}} and {{\"t\"}}):\n"
+    "{payload}\n"
+)
+
+# compact dictionary prompt for the distinct values of low-cardinality columns (statuses, types, ...)
+PROMPT_ENUM_TEMPLATE = (
+    "# You are a professional software localization specialist.\n"
+    "# Translate the following english enumeration values (statuses, types, categories, conditions) into {lang_label} (locale={locale}).\n"
+    "# \"f\" lists the database column(s) a value belongs to, comma-separated; use it as context only.\n"
+    "# STRICT RULES:\n"
+    "- Translate each value as a short UI label, consistently across the list\n"
+    "- Preserve the source text's casing and separators EXACTLY (french \"SHOES\" -> \"CHAUSSURES\")\n"
+    "- Do NOT translate codes/identifiers, brand names or placeholders (__PH0__, __PH1__, ...)\n"
+    "- Output MUST be a JSON array of objects like: [{{\"i\": 0, \"t\": \"...\"}}, ...], one object per input item\n"
+    "INPUT JSON (array of objects with keys {{\"i\"}}, {{\"f\"}} and {{\"t\"}}):\n"
+    "{payload}\n"
+)
+
+# Structured output: with responseSchema the model returns exactly this shape, so the body
+# parses with a plain json.loads (the fence/bracket/salvage fallbacks are for prose answers)
+ITEMS_SCHEMA: Dict[str, Any] = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {"i": {"type": "INTEGER"}, "t": {"type": "STRING"}},
+        "required": ["i", "t"],
+        "propertyOrdering": ["i", "t"],
+    },
+}
+
+def _multi_items_schema(locales: List[str]) -> Dict[str, Any]:
+    return {
+        "type": "ARRAY",
+        "items": {
+            "type": "OBJECT",
+            "properties": {
+                "i": {"type": "INTEGER"},
+                "t": {
+                    "type": "OBJECT",
+                    "properties": {loc: {"type": "STRING"} for loc in locales},
+                    "required": list(locales),
+                },
+            },
+            "required": ["i", "t"],
+            "propertyOrdering": ["i", "t"],
+        },
+    }
+
 def _strip_code_fence(s: str) -> str:
     s = s.strip()
     if s.startswith("```"):
@@ -428,27 +495,172 @@ def _json_from_text(s: str) -> Any:
         return json.loads(cand)
     return json.loads(s)
 
-def _post_gemini(url: str, api_key: str, prompt: str, timeout: int = 90) -> str:
-    headers = {"Content-Type": "application/json"}
+_DECODER = json.JSONDecoder()
+
+def _salvage_json_array(s: str) -> List[Any]:
+    """
+    Decode the elements of a truncated or partly malformed JSON array one by one and keep
+    every element that parses. Stops at the closing bracket or where the text runs out;
+    a broken element is skipped by resyncing on the next '{'.
+    """
+    s = _strip_code_fence(s)
+    pos = s.find("[")
+    if pos == -1:
+        return []
+    pos += 1
+    n = len(s)
+    out: List[Any] = []
+    while pos < n:
+        while pos < n and s[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= n or s[pos] == "]":
+            break
+        try:
+            obj, pos = _DECODER.raw_decode(s, pos)
+            out.append(obj)
+        except ValueError:
+            nxt = s.find("{", pos + 1)
+            if nxt == -1:
+                break
+            pos = nxt
+    return out
+
+def _parse_items(s: str, logger: logging.Logger | None = None) -> List[Any]:
+    """Full parse first; on failure keep whatever elements can be salvaged (raises if none)."""
+    try:
+        return _json_from_text(s)
+    except Exception as e:
+        salvaged = _salvage_json_array(s)
+        if not salvaged:
+            raise
+        if logger:
+            logger.warning(f"Gemini returned malformed/truncated JSON ({e}); salvaged {len(salvaged)} item(s)")
+        return salvaged
+
+class _StreamingArrayParser:
+    """
+    Returns the complete top-level elements of a JSON array as its text arrives in chunks.
+    An element that does not parse yet is kept buffered until more text comes in; close()
+    salvages whatever is left once the stream ends (truncated or malformed tail).
+    """
+
+    def __init__(self) -> None:
+        self.buf = ""
+        self.pos = -1  # -1 until the opening '[' has been seen
+        self.done = False
+
+    def feed(self, chunk: str) -> List[Any]:
+        self.buf += chunk
+        out: List[Any] = []
+        if self.pos < 0:
+            k = self.buf.find("[")
+            if k == -1:
+                return out
+            self.pos = k + 1
+        n = len(self.buf)
+        while not self.done:
+            p = self.pos
+            while p < n and self.buf[p] in " \t\r\n,":
+                p += 1
+            self.pos = p
+            if p >= n:
+                break
+            if self.buf[p] == "]":
+                self.done = True
+                break
+            try:
+                obj, self.pos = _DECODER.raw_decode(self.buf, p)
+            except ValueError:
+                break  # element still incomplete
+            out.append(obj)
+        return out
+
+    def close(self) -> List[Any]:
+        if self.pos < 0 or self.done:
+            return []
+        return _salvage_json_array("[" + self.buf[self.pos:])
+
+def _request_body(prompt: str, schema: Optional[Dict[str, Any]] = None, cached_content: Optional[str] = None) -> Dict[str, Any]:
+    gen_cfg: Dict[str, Any] = {"temperature": 0, "response_mime_type": "application/json"}
+    if schema is not None:
+        gen_cfg["responseSchema"] = schema
     body = {
         "contents": [{
             "role": "user",
             "parts": [{"text": prompt}]
         }],
-        "generationConfig": {"temperature": 0, "response_mime_type": "application/json"}
+        "generationConfig": gen_cfg
     }
-    resp = requests.post(url, headers=headers, params={"key": api_key}, json=body, timeout=timeout)
+    if cached_content:
+        # the static prompt prefix lives in the cached content; `prompt` is only the rest
+        body["cachedContent"] = cached_content
+    return body
+
+def _static_prefix(prompt: str, payload: Any) -> str:
+    """Everything before the JSON payload: identical for every batch of a locale and rule set."""
+    k = prompt.rfind(json.dumps(payload, ensure_ascii=False))
+    return prompt[:k] if k > 0 else ""
+
+def _post_gemini_stream(url: str, api_key: str, prompt: str, timeout: int = 90, schema: Optional[Dict[str, Any]] = None,
+                        cached_content: Optional[str] = None) -> Iterator[Tuple[str, Optional[str], Dict[str, int]]]:
+    """Yields (text_chunk, finish_reason, usage_metadata) from a streamGenerateContent server-sent-events response."""
+    headers = {"Content-Type": "application/json"}
+    with requests.post(url, headers=headers, params={"key": api_key, "alt": "sse"}, json=_request_body(prompt, schema, cached_content),
+                       timeout=timeout, stream=True) as resp:
+        if resp.status_code != 200:
+            raise RuntimeError(f"HTTP {resp.status_code}: {resp.text[:200]}")
+        for line in resp.iter_lines(decode_unicode=True):
+            if not line or not line.startswith("data:"):
+                continue
+            data = json.loads(line[5:].strip())
+            cand = (data.get("candidates") or [{}])[0]
+            parts = (cand.get("content") or {}).get("parts") or []
+            yield "".join(p.get("text", "") for p in parts), cand.get("finishReason"), data.get("usageMetadata") or {}
+
+def _post_gemini(url: str, api_key: str, prompt: str, timeout: int = 90, schema: Optional[Dict[str, Any]] = None,
+                 cached_content: Optional[str] = None) -> Tuple[str, Dict[str, int]]:
+    """Returns (text, usage_metadata); usage_metadata is {} when the response has none."""
+    headers = {"Content-Type": "application/json"}
+    resp = requests.post(url, headers=headers, params={"key": api_key}, json=_request_body(prompt, schema, cached_content), timeout=timeout)
     if resp.status_code != 200:
         raise RuntimeError(f"HTTP {resp.status_code}: {resp.text[:200]}")
     data = resp.json()
     try:
-        return data["candidates"][0]["content"]["parts"][0]["text"]
+        return data["candidates"][0]["content"]["parts"][0]["text"], data.get("usageMetadata") or {}
     except Exception:
         raise RuntimeError(f"Unexpected response: {str(data)[:200]}")
 
+def _usage_tokens(usage: Dict[str, int], prompt: str, text: str) -> Tuple[int, int, bool]:
+    """(prompt_tokens, completion_tokens, estimated); ~4 chars/token when the API reported nothing."""
+    p = int(usage.get("promptTokenCount") or 0)
+    total = int(usage.get("totalTokenCount") or 0)
+    if p or total:
+        # total - prompt also covers "thinking" tokens, which are billed as output
+        c = (total - p) if total else int(usage.get("candidatesTokenCount") or 0)
+        return p, c, False
+    return (len(prompt) + 3) // 4, (len(text) + 3) // 4, True
+
+def gemini_cache_namespace(model: str, domain_rules: str = "", enum: bool = False) -> str:
+    """
+    Cache namespace of GeminiTranslator output: model + version of the prompt and domain rules.
+    enum=True: namespace of the enum dictionary prompt's output, kept apart from general batches.
+    """
+    # a prompt or rules change gets fresh cache entries; the old ones stay for the old setup.
+    # Every template whose answers are cached in the namespace is part of its version.
+    rules = (domain_rules or "").rstrip() + ("\n" if domain_rules else "")
+    templates = (PROMPT_ENUM_TEMPLATE,) if enum else (PROMPT_TEMPLATE, PROMPT_SIMPLE_LIST, PROMPT_MULTI_TEMPLATE)
+    version = hashlib.blake2b("\0".join(templates + (rules,)).encode("utf-8"), digest_size=6).hexdigest()
+    return f"gemini:{model}:enum-{version}" if enum else f"gemini:{model}:{version}"
+
 class GeminiTranslator(Translator):
-    def __init__(self, model: str, qps: float = 1.0, max_retries: int = 5, backoff_base: float = 1.5, logger: logging.Logger | None = None, domain_rules: str = ""):
+    def __init__(self, model: str, qps: float = 1.0, max_retries: int = 5, backoff_base: float = 1.5, logger: logging.Logger | None = None, domain_rules: str = "",
+                 heal_workers: int = 4, heal_batch_items: int = 50, heal_rounds: int = 2,
+                 stream: bool = False, on_item: Optional[Callable[[str, str, str], None]] = None,
+                 api_base: Optional[str] = None, response_schema: bool = True,
+                 on_usage: Optional[Callable[[str, List[str], float, float], None]] = None,
+                 context_cache: bool = False, context_cache_ttl: int = 3600, context_cache_min_tokens: int = 4096):
         self.model = model
+        self.api_base = (api_base or os.getenv("GEMINI_API_BASE") or GEMINI_API_BASE).rstrip("/")
         self.api_key = os.getenv("GEMINI_API_KEY", "")
         if not self.api_key:
             raise RuntimeError("GEMINI_API_KEY environment variable is not set")
@@ -458,12 +670,160 @@ class GeminiTranslator(Translator):
         self.logger = logger or logging.getLogger("i18n-seed")
         self.domain_rules = (domain_rules or "").rstrip() + ("\n" if domain_rules else "")
         self._last_call = 0.0
+        self._qps_lock = threading.Lock()
+        # healing: leftovers are re-packed into batches of <= heal_batch_items and sent concurrently
+        self.heal_workers = max(1, heal_workers)
+        self.heal_batch_items = max(1, heal_batch_items)
+        self.heal_rounds = max(1, heal_rounds)
+        # stream=True uses streamGenerateContent; on_item(source, locale, translated) fires for
+        # every item as soon as it is collected (e.g. TranslationCache.put)
+        self.stream = stream
+        self.on_item = on_item
+        # responseSchema is switched off for the rest of the run if the API rejects it
+        self.response_schema = response_schema
+        self._stats_lock = threading.Lock()
+        self.stats: Dict[str, int] = {
+            "requests": 0, "parse_failures": 0, "parse_retries": 0, "schema_fallbacks": 0,
+            "prompt_tokens": 0, "completion_tokens": 0, "usage_estimated": 0,
+            "cached_prompt_tokens": 0, "context_cache_fallbacks": 0,
+        }
+        # on_usage(locale, sources, prompt_tokens, completion_tokens) for every answered request
+        # (retries, heal sub-requests and fallback prompts included)
+        self.on_usage = on_usage
+        # static prompt prefix uploaded once per (model, locale, rule set) as a cachedContent.
+        # The profile rules then go into that prefix too (they are already part of the cache
+        # namespace version); without context caching the prompt is unchanged.
+        self.context_cache: Optional[GeminiContextCache] = None
+        self.prompt_rules = ""
+        if context_cache:
+            self.context_cache = GeminiContextCache(
+                self.api_base, self.api_key, self.model, ttl_s=context_cache_ttl,
+                min_tokens=context_cache_min_tokens, logger=self.logger,
+            )
+            if self.domain_rules:
+                self.prompt_rules = "# DOMAIN RULES (apply to every item):\n" + self.domain_rules
+
+    @property
+    def cache_namespace(self) -> str:
+        return gemini_cache_namespace(self.model, self.domain_rules)
+
+    @property
+    def enum_cache_namespace(self) -> str:
+        return gemini_cache_namespace(self.model, self.domain_rules, enum=True)
+
+    def close(self) -> None:
+        if self.context_cache is not None:
+            self.context_cache.close()
+
+    def _bump(self, key: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self.stats[key] = self.stats.get(key, 0) + n
+
+    def _disable_schema(self, err: Exception) -> None:
+        with self._stats_lock:
+            if not self.response_schema:
+                return
+            self.response_schema = False
+            self.stats["schema_fallbacks"] += 1
+        self.logger.warning(f"Gemini rejected responseSchema ({err}); continuing with prompt-only JSON")
+
+    def _account(self, locales: List[str], sources: List[str], usage: Dict[str, int], prompt: str, text: str) -> None:
+        p, c, estimated = _usage_tokens(usage, prompt, text)
+        with self._stats_lock:
+            self.stats["prompt_tokens"] += p
+            self.stats["completion_tokens"] += c
+            self.stats["usage_estimated"] += int(estimated)
+            self.stats["cached_prompt_tokens"] += int(usage.get("cachedContentTokenCount") or 0)
+        if self.on_usage is None or not locales:
+            return
+        # a multi-locale request is shared evenly between its locales
+        for loc in locales:
+            try:
+                self.on_usage(loc, sources, p / len(locales), c / len(locales))
+            except Exception as e:
+                self.logger.warning(f"on_usage callback failed: {e}")
+
+    def _cached_context(self, prefix: str) -> Optional[str]:
+        if self.context_cache is None or not prefix:
+            return None
+        return self.context_cache.get(prefix)
+
+    def _degrade(self, err: Exception, cached: Optional[str], schema: Optional[Dict[str, Any]]) -> bool:
+        """
+        Handles a rejected request option: a cachedContent the API no longer accepts is dropped,
+        or the responseSchema is switched off. The error body must name the option; anything
+        else (oversized prompt, bad request, unknown model) returns False and is not degraded.
+        """
+        msg = str(err)
+        body = msg.lower()
+        if cached and msg.startswith(("HTTP 400", "HTTP 403", "HTTP 404")) and "cached" in body:
+            self.context_cache.invalidate(cached)
+            self._bump("context_cache_fallbacks")
+            self.logger.warning(f"Cached context {cached} rejected ({err}); resending the full prompt")
+            return True
+        if schema is not None and msg.startswith("HTTP 400") and "schema" in body:
+            self._disable_schema(err)
+            return True
+        return False
+
+    def _post(self, url: str, prompt: str, schema: Optional[Dict[str, Any]] = None,
+              locales: Optional[List[str]] = None, sources: Optional[List[str]] = None, prefix: str = "") -> str:
+        schema = schema if self.response_schema else None
+        cached = self._cached_context(prefix)
+        while True:
+            self._bump("requests")
+            try:
+                text, usage = _post_gemini(url, self.api_key, prompt[len(prefix):] if cached else prompt,
+                                           schema=schema, cached_content=cached)
+                break
+            except RuntimeError as e:
+                if not self._degrade(e, cached, schema):
+                    raise
+                cached, schema = (None, schema) if cached else (cached, None)
+        self._account(locales or [], sources or [], usage, prompt, text)
+        return text
+
+    def _post_stream(self, url: str, prompt: str, schema: Optional[Dict[str, Any]] = None,
+                     prefix: str = "") -> Iterator[Tuple[str, Optional[str], Dict[str, int]]]:
+        schema = schema if self.response_schema else None
+        cached = self._cached_context(prefix)
+        while True:
+            self._bump("requests")
+            try:
+                yield from _post_gemini_stream(url, self.api_key, prompt[len(prefix):] if cached else prompt,
+                                               schema=schema, cached_content=cached)
+                return
+            except RuntimeError as e:
+                # HTTP errors are raised before the first chunk, so nothing was yielded yet
+                if not self._degrade(e, cached, schema):
+                    raise
+                cached, schema = (None, schema) if cached else (cached, None)
+
+    def _parse_response(self, text: str) -> List[Any]:
+        # fast path: a schema-conforming body is the bare JSON array
+        try:
+            arr = json.loads(text)
+            if isinstance(arr, list):
+                return arr
+        except ValueError:
+            pass
+        self._bump("parse_failures")
+        return _parse_items(text, self.logger)
+
+    def _count_retry(self, err: Exception) -> None:
+        # JSON/shape errors are ValueErrors; HTTP and transport failures are not
+        if isinstance(err, ValueError):
+            self._bump("parse_retries")
 
     def _respect_qps(self):
+        # reserve the next slot under the lock so concurrent heal requests stay within qps;
+        # _last_call is only written here, as the start time of the latest reserved request
         min_interval = 1.0 / max(self.qps, 0.01)
-        dt = time.time() - self._last_call
-        if dt < min_interval:
-            time.sleep(min_interval - dt)
+        with self._qps_lock:
+            wait = max(0.0, min_interval - (time.time() - self._last_call))
+            self._last_call = time.time() + wait
+        if wait:
+            time.sleep(wait)
 
     def translate_batch(self, src_texts: List[str], target_locale: str) -> List[str]:
         idx_to_src = {i: s for i, s in enumerate(src_texts)}
@@ -471,31 +831,140 @@ class GeminiTranslator(Translator):
         self._request_with_heal(idx_to_src, idx_to_tgt, target_locale)
         return [idx_to_tgt.get(i, src_texts[i]) for i in range(len(src_texts))]
 
+    def translate_batch_multi(self, src_texts: List[str], target_locales: List[str]) -> Dict[str, List[Optional[str]]]:
+        """
+        One request for several locales: [{"i":0,"t":{"fr_FR":...,"de_DE":...}}, ...].
+        No healing here; None marks (item, locale) pairs the model dropped so the caller
+        can fall back to regular per-locale batches for just those.
+        """
+        locales = list(dict.fromkeys(target_locales))
+        out: Dict[str, List[Optional[str]]] = {loc: [None] * len(src_texts) for loc in locales}
+        if not src_texts or not locales:
+            return out
+
+        objs = [{"i": i, "t": s} for i, s in enumerate(src_texts)]
+        prompt = self._fmt_prompt_multi(objs, locales)
+        url = GEMINI_URL_TEMPLATE.format(base=self.api_base, model=self.model)
+
+        for attempt in range(self.max_retries):
+            try:
+                self._respect_qps()
+                text = self._post(url, prompt, _multi_items_schema(locales), locales=locales, sources=list(src_texts),
+                                  prefix=_static_prefix(prompt, objs))
+                arr = self._parse_response(text)
+                self._collect_multi(arr, len(src_texts), locales, out)
+                break
+            except Exception as e:
+                self._count_retry(e)
+                sleep = (self.backoff_base ** attempt) + random.uniform(0, 0.6)
+                self.logger.warning(f"Gemini multi-locale request failed ({e}); retrying in {sleep:.1f}s")
+                time.sleep(sleep)
+
+        total = len(src_texts) * len(locales)
+        missing = sum(1 for loc in locales for t in out[loc] if t is None)
+        if missing:
+            self.logger.warning(
+                f"Gemini multi-locale returned {total - missing} of {total} translations "
+                f"({len(src_texts)} items x {len(locales)} locales)"
+            )
+        return out
+
+    def translate_enum(self, values: List[str], fields: List[str], target_locale: str) -> List[Optional[str]]:
+        """
+        One compact request per column dictionary: [{"i": 0, "f": "orders.status", "t": "PENDING"}, ...].
+        No healing; None marks values the model dropped so the caller can send just those
+        through the regular batches. Results are never passed to on_item: the caller caches
+        them in the enum namespace, not the general one.
+        """
+        idx_to_src = dict(enumerate(values))
+        idx_to_tgt: Dict[int, str] = {}
+        if not values:
+            return []
+
+        objs = [{"i": i, "f": f, "t": v} for i, (v, f) in enumerate(zip(values, fields))]
+        prompt = self._fmt_prompt_enum(objs, target_locale)
+        url = GEMINI_URL_TEMPLATE.format(base=self.api_base, model=self.model)
+
+        for attempt in range(self.max_retries):
+            try:
+                self._respect_qps()
+                text = self._post(url, prompt, ITEMS_SCHEMA, locales=[target_locale], sources=list(values),
+                                  prefix=_static_prefix(prompt, objs))
+                self._collect_from_array(self._parse_response(text), list(idx_to_src), idx_to_tgt, idx_to_src)
+                break
+            except Exception as e:
+                self._count_retry(e)
+                sleep = (self.backoff_base ** attempt) + random.uniform(0, 0.6)
+                self.logger.warning(f"Gemini enum dictionary request failed ({e}); retrying in {sleep:.1f}s")
+                time.sleep(sleep)
+
+        if len(idx_to_tgt) < len(values):
+            self.logger.warning(f"Gemini enum dictionary returned {len(idx_to_tgt)} of {len(values)} values")
+        return [idx_to_tgt.get(i) for i in range(len(values))]
+
+    def _collect_multi(self, arr: Any, n_items: int, locales: List[str], out: Dict[str, List[Optional[str]]]) -> None:
+        if not isinstance(arr, list):
+            raise ValueError("Model did not return a JSON array")
+        for obj in arr:
+            if not (isinstance(obj, dict) and "i" in obj and isinstance(obj.get("t"), dict)):
+                continue
+            try:
+                i = int(obj["i"])
+            except Exception:
+                continue
+            if not 0 <= i < n_items:
+                continue
+            for loc in locales:
+                t = obj["t"].get(loc)
+                if isinstance(t, str):
+                    out[loc][i] = t
+
     def _request_with_heal(self, idx_to_src: Dict[int, str], idx_to_tgt: Dict[int, str], locale: str):
-        pending = dict(idx_to_src)
-        missing = self._one_request_and_collect(pending, idx_to_tgt, locale)
-        if not missing: return
-        if len(missing) > 1:
-            items = sorted(missing.items())
-            mid = len(items) // 2
-            left = dict(items[:mid]); right = dict(items[mid:])
-            miss_left = self._one_request_and_collect(left, idx_to_tgt, locale)
-            todo_right = dict(right); todo_right.update(miss_left)
-            missing = self._one_request_and_collect(todo_right, idx_to_tgt, locale)
-        for i, s in list(missing.items()):
-            _ = self._one_request_and_collect({i: s}, idx_to_tgt, locale)
+        missing = self._one_request_and_collect(dict(idx_to_src), idx_to_tgt, locale)
+        for round_no in range(self.heal_rounds):
+            if not missing:
+                return
+            # first round packs leftovers into right-sized batches; later rounds isolate singles
+            size = self.heal_batch_items if round_no == 0 else 1
+            batches = self._pack_leftovers(missing, size)
+            self.logger.info(
+                f"Healing {len(missing)} missing item(s) with {len(batches)} request(s) (round {round_no + 1})"
+            )
+            missing = {}
+            with ThreadPoolExecutor(max_workers=min(self.heal_workers, len(batches))) as ex:
+                for miss in ex.map(lambda b: self._one_request_and_collect(b, idx_to_tgt, locale), batches):
+                    missing.update(miss)
+
+    @staticmethod
+    def _pack_leftovers(missing: Dict[int, str], size: int) -> List[Dict[int, str]]:
+        items = sorted(missing.items())
+        return [dict(items[k:k + size]) for k in range(0, len(items), size)]
 
     def _fmt_prompt_objs(self, objs: List[Dict[str, Any]], locale: str) -> str:
         lang_label = LANG_LABELS.get(locale, locale)
-        return PROMPT_TEMPLATE.format(
+        return self.prompt_rules + PROMPT_TEMPLATE.format(
             lang_label=lang_label, locale=locale,
             payload=json.dumps(objs, ensure_ascii=False),
             domain_rules=self.domain_rules
         )
 
+    def _fmt_prompt_multi(self, objs: List[Dict[str, Any]], locales: List[str]) -> str:
+        return self.prompt_rules + PROMPT_MULTI_TEMPLATE.format(
+            targets=", ".join(f"{LANG_LABELS.get(loc, loc)} ({loc})" for loc in locales),
+            example=json.dumps({loc: "..." for loc in locales}, ensure_ascii=False),
+            locale_keys=", ".join(locales),
+            payload=json.dumps(objs, ensure_ascii=False),
+        )
+
+    def _fmt_prompt_enum(self, objs: List[Dict[str, Any]], locale: str) -> str:
+        return PROMPT_ENUM_TEMPLATE.format(
+            lang_label=LANG_LABELS.get(locale, locale), locale=locale,
+            payload=json.dumps(objs, ensure_ascii=False),
+        )
+
     def _fmt_prompt_list(self, items: List[str], locale: str) -> str:
         lang_label = LANG_LABELS.get(locale, locale)
-        return PROMPT_SIMPLE_LIST.format(
+        return self.prompt_rules + PROMPT_SIMPLE_LIST.format(
             lang_label=lang_label, locale=locale,
             payload=json.dumps(items, ensure_ascii=False),
             domain_rules=self.domain_rules
@@ -535,32 +1004,103 @@ class GeminiTranslator(Translator):
             return
         # else: nothing mappable
 
+    def _emit_items(self, indices: List[int], idx_to_src: Dict[int, str], idx_to_tgt: Dict[int, str], locale: str) -> None:
+        if self.on_item is None:
+            return
+        for i in indices:
+            try:
+                self.on_item(idx_to_src[i], locale, idx_to_tgt[i])
+            except Exception as e:
+                self.logger.warning(f"on_item callback failed: {e}")
+
+    def _stream_and_collect(self, prompt: str, asked: List[int], idx_to_tgt: Dict[int, str], idx_to_src: Dict[int, str], locale: str,
+                            prefix: str = "") -> None:
+        """
+        Streaming variant of one request: items are collected (and emitted) as they arrive.
+        A stream that breaks off or stops early keeps everything received so far; it only
+        raises (so the caller retries) when nothing usable came back.
+        """
+        url = GEMINI_STREAM_URL_TEMPLATE.format(base=self.api_base, model=self.model)
+        parser = _StreamingArrayParser()
+        got = 0
+        position = 0  # of the next plain (positional) item across chunks
+        received, usage, opened = [], {}, False
+
+        def take(objs: List[Any]) -> None:
+            nonlocal got, position
+            if not objs:
+                return
+            before = {i for i in asked if i in idx_to_tgt}
+            keyed = [o for o in objs if isinstance(o, dict)]
+            if keyed:
+                self._collect_from_array(keyed, asked, idx_to_tgt, idx_to_src)
+            # a chunk holds only part of the array: its k-th plain item is asked[position + k]
+            for o in objs:
+                if isinstance(o, dict):
+                    continue
+                if position < len(asked):
+                    idx_to_tgt[asked[position]] = str(o)
+                position += 1
+            new = [i for i in asked if i in idx_to_tgt and i not in before]
+            got += len(new)
+            self._emit_items(new, idx_to_src, idx_to_tgt, locale)
+
+        try:
+            for chunk, finish, chunk_usage in self._post_stream(url, prompt, ITEMS_SCHEMA, prefix=prefix):
+                opened = True
+                received.append(chunk)
+                usage = chunk_usage or usage
+                take(parser.feed(chunk))
+                if finish and finish != "STOP":
+                    self.logger.warning(f"Gemini stream stopped early ({finish}) after {got} of {len(asked)} items")
+                    break
+        except Exception as e:
+            take(parser.close())
+            if not got:
+                raise
+            self.logger.warning(f"Gemini stream interrupted ({e}); keeping {got} of {len(asked)} items received")
+            return
+        finally:
+            if opened:
+                self._account([locale], [idx_to_src[i] for i in asked], usage, prompt, "".join(received))
+
+        if not parser.done:
+            self._bump("parse_failures")
+        take(parser.close())
+        if not got:
+            raise ValueError("Gemini stream returned no usable items")
+
     def _one_request_and_collect(self, idx_to_src: Dict[int, str], idx_to_tgt: Dict[int, str], locale: str) -> Dict[int, str]:
         if not idx_to_src: return {}
-        self._respect_qps()
         objs = [{"i": i, "t": s} for i, s in sorted(idx_to_src.items())]
         prompt = self._fmt_prompt_objs(objs, locale)
-        url = GEMINI_URL_TEMPLATE.format(model=self.model)
+        prefix = _static_prefix(prompt, objs)
+        url = GEMINI_URL_TEMPLATE.format(base=self.api_base, model=self.model)
 
         last_err = None
         for attempt in range(self.max_retries):
             try:
-                text = _post_gemini(url, self.api_key, prompt)
-                self._last_call = time.time()
-                arr = _json_from_text(text)
+                self._respect_qps()
                 asked = [i for i, _ in sorted(idx_to_src.items())]
                 before = set(idx_to_tgt.keys())
-                self._collect_from_array(arr, asked, idx_to_tgt, idx_to_src)
+                if self.stream:
+                    self._stream_and_collect(prompt, asked, idx_to_tgt, idx_to_src, locale, prefix=prefix)
+                else:
+                    text = self._post(url, prompt, ITEMS_SCHEMA, locales=[locale], sources=list(idx_to_src.values()), prefix=prefix)
+                    arr = self._parse_response(text)
+                    self._collect_from_array(arr, asked, idx_to_tgt, idx_to_src)
+                    self._emit_items([i for i in asked if i in idx_to_tgt and i not in before], idx_to_src, idx_to_tgt, locale)
                 after = set(idx_to_tgt.keys())
                 missing = {i: s for i, s in idx_to_src.items() if i not in after}
                 if missing:
                     self.logger.warning(
-                        f"Gemini returned {len(after - before)} of {len(idx_to_src)} items; "
+                        f"Gemini returned {len(idx_to_src) - len(missing)} of {len(idx_to_src)} items; "
                         f"missing indices: {sorted(missing.keys())[:10]}{'...' if len(missing)>10 else ''}"
                     )
                 return missing
             except Exception as e:
                 last_err = e
+                self._count_retry(e)
                 sleep = (self.backoff_base ** attempt) + random.uniform(0, 0.6)
                 self.logger.warning(f"Gemini request failed ({e}); retrying in {sleep:.1f}s")
                 time.sleep(sleep)
@@ -569,17 +1109,16 @@ class GeminiTranslator(Translator):
         try:
             items = [s for _, s in sorted(idx_to_src.items())]
             prompt2 = self._fmt_prompt_list(items, locale)
-            text = _post_gemini(url, self.api_key, prompt2)
-            self._last_call = time.time()
-            arr = _json_from_text(text)
+            self._respect_qps()
+            text = self._post(url, prompt2, locales=[locale], sources=items, prefix=_static_prefix(prompt2, items))
+            arr = self._parse_response(text)
             asked = [i for i, _ in sorted(idx_to_src.items())]
-            before = set(idx_to_tgt.keys())
             self._collect_from_array(arr, asked, idx_to_tgt, idx_to_src)
             after = set(idx_to_tgt.keys())
             missing = {i: s for i, s in idx_to_src.items() if i not in after}
             if missing:
                 self.logger.warning(
-                    f"Gemini (simple-list) returned {len(after - before)} of {len(idx_to_src)}; "
+                    f"Gemini (simple-list) returned {len(idx_to_src) - len(missing)} of {len(idx_to_src)}; "
                     f"missing indices: {sorted(missing.keys())[:10]}{'...' if len(missing)>10 else ''}"
                 )
             if missing:
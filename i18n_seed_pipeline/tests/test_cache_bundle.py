@@ -0,0 +1,42 @@
+from i18n_seed.cache import TranslationCache, entry_key, open_for_maintenance, pin_translations
+from i18n_seed.cache_bundle import export_bundle, import_bundle
+
+NS = "gemini:test:0"
+
+
+def _put(path, rows):
+    cache = TranslationCache(path, namespace=NS)
+    cache.put_many((src, "fr_FR", tgt) for src, tgt in rows)
+    cache.close()
+
+
+def _row(conn, source):
+    return conn.execute(
+        "SELECT translated, pinned, hits, last_used FROM translations WHERE key=?", (entry_key(NS, "fr_FR", source),)
+    ).fetchone()
+
+
+def test_overwrite_import_keeps_pinned_rows_and_usage(tmp_path):
+    # bundle: model output for "Shoes" and "Bag", a human translation of "Hat"
+    remote = str(tmp_path / "remote.sqlite")
+    _put(remote, [("Shoes", "Souliers"), ("Bag", "Sacoche")])
+    conn = open_for_maintenance(remote)
+    pin_translations(conn, NS, "fr_FR", {"Hat": "Couvre-chef"})
+    bundle = export_bundle(conn, str(tmp_path / "bundle.jsonl.gz"))["bundle"]
+    conn.close()
+
+    # local: "Shoes" and "Hat" pinned, "Bag" model output that has been used
+    local = str(tmp_path / "local.sqlite")
+    _put(local, [("Bag", "Sac")])
+    conn = open_for_maintenance(local)
+    pin_translations(conn, NS, "fr_FR", {"Shoes": "Chaussures", "Hat": "Chapeau"})
+    conn.execute("UPDATE translations SET hits=7, last_used=123")
+    conn.commit()
+
+    stats = import_bundle(conn, bundle, overwrite=True)
+
+    assert _row(conn, "Shoes") == ("Chaussures", 1, 7, 123)  # unpinned bundle entry never wins over a pin
+    assert _row(conn, "Bag") == ("Sacoche", 0, 7, 123)  # replaced, usage counters kept
+    assert _row(conn, "Hat") == ("Couvre-chef", 1, 7, 123)  # a pinned bundle entry may replace a pin
+    assert stats["imported"] == 2
+    conn.close()
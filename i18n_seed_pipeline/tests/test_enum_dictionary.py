@@ -0,0 +1,39 @@
+import logging
+
+from i18n_seed.cache import TranslationCache
+from i18n_seed.cli import _enum_dictionary_pass
+from i18n_seed.config import TranslateConfig
+from i18n_seed.cost_tracker import CostTracker
+from i18n_seed.gemini_stub import StubConfig, start_stub_server
+from i18n_seed.translator_gemini import GeminiTranslator
+
+VALUES = ["PENDING", "SHIPPED", "DELIVERED", "CANCELLED"]
+
+
+def test_streamed_enum_pass_writes_only_the_enum_namespace(tmp_path, monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "x")
+    logger = logging.getLogger("i18n-seed")
+    server, _ = start_stub_server(StubConfig(port=0))
+    db = str(tmp_path / "cache.sqlite")
+    general = TranslationCache(db, namespace="general", logger=logger)
+    enum_cache = TranslationCache(db, namespace="general:enum", logger=logger)
+    try:
+        # as in `translate --stream`: streamed items go straight to the general cache
+        translator = GeminiTranslator("gemini-2.0-flash-001", qps=1000, logger=logger, stream=True,
+                                      on_item=general.put, api_base=f"http://127.0.0.1:{server.server_address[1]}")
+        cfg = TranslateConfig(schema_path="", input_sql_path="", output_dir="", locales=["fr_FR"], stream=True)
+        accum = {}
+        missing, stats = _enum_dictionary_pass(
+            locale="fr_FR", cfg=cfg, logger=logger, translator=translator, cache=enum_cache, cost=CostTracker(),
+            values=VALUES, enum_field_of={v: ["orders.status"] for v in VALUES}, translated_accum=accum,
+        )
+        general.flush()
+        enum_cache.flush()
+
+        assert missing == [] and stats["requests"] == 1
+        assert set(enum_cache.get_many(VALUES, "fr_FR")) == set(VALUES)
+        assert general.get_many(VALUES, "fr_FR") == {}
+    finally:
+        general.close()
+        enum_cache.close()
+        server.shutdown()